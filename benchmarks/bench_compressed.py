@@ -0,0 +1,89 @@
+"""
+Compare reading compressed telemetry directly with decompress-then-read.
+
+Generated datasets are compressed with gzip, bzip2 and xz. Each is read
+three ways: decompressed to a temporary file that is then read (the old
+workflow), read with read_telemetry_file, and streamed with iter_telemetry.
+Uncompressed files are read with read_telemetry_file as a baseline.
+
+Usage:
+    python benchmarks/bench_compressed.py [--count 200000] [--shapes array jsonl]
+"""
+from __future__ import annotations
+
+import argparse
+import bz2
+import gzip
+import lzma
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT / "src"
+for path in (ROOT, SRC_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.suite.generator import SHAPES, SHAPE_SUFFIXES, write_telemetry  # noqa: E402
+from extractors.telemetry_reader import iter_telemetry, read_telemetry_file  # noqa: E402
+
+CODECS = [("gzip", gzip, ".gz"), ("bzip2", bz2, ".bz2"), ("xz", lzma, ".xz")]
+
+def timed(func: Callable[[], int]) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+def decompress_then_read(path: Path, module, plain: Path) -> int:
+    with module.open(path, "rb") as src, plain.open("wb") as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    try:
+        return len(read_telemetry_file(plain))
+    finally:
+        plain.unlink()
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=["array", "jsonl"])
+    args = parser.parse_args()
+
+    print(f"{'input':<22} {'MB':>7} {'via disk s':>11} {'read s':>8} {'iter s':>8} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for shape in args.shapes:
+            suffix = SHAPE_SUFFIXES[shape]
+            source = write_telemetry(tmp_dir / f"{shape}{suffix}", args.count, shape)
+            megabytes = source.stat().st_size / 1e6
+
+            plain_read = timed(lambda: len(read_telemetry_file(source)))
+            print(
+                f"{shape + ' plain':<22} {megabytes:>7.1f} {'':>11} {plain_read:>8.2f} "
+                f"{'':>8} {'':>8}"
+            )
+
+            for name, module, extension in CODECS:
+                packed = tmp_dir / f"{shape}{suffix}{extension}"
+                with source.open("rb") as src, module.open(packed, "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+                plain = tmp_dir / f"unpacked{suffix}"
+
+                results: List[float] = [
+                    timed(lambda: decompress_then_read(packed, module, plain)),
+                    timed(lambda: len(read_telemetry_file(packed))),
+                    timed(lambda: sum(1 for _ in iter_telemetry(packed))),
+                ]
+                via_disk, direct, streamed = results
+                print(
+                    f"{shape + ' ' + name:<22} {megabytes:>7.1f} {via_disk:>11.2f} "
+                    f"{direct:>8.2f} {streamed:>8.2f} {via_disk / direct:>7.1f}x"
+                )
+                packed.unlink()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+"""
+Measure what duplicate dropping and episode collapsing save downstream.
+
+A fault storm is simulated by repeating a few flapping error patterns many
+times a minute on top of the regular generated feed, with a share of the
+records retransmitted. Parsed events are then aggregated, buffered for the
+timeline and exported to JSON lines, as the streaming pipeline does, once
+as they are and once through EventDeduplicator. Peak memory of the
+deduplicator is reported for growing stream lengths to show it levels off
+once the ID window is full.
+
+Usage:
+    python benchmarks/bench_dedup.py [--count 200000] [--storm 0.8] [--retransmit 0.05]
+                                     [--id-capacity 16384]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT / "src"
+for path in (ROOT, SRC_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.suite.generator import TelemetryGenerator  # noqa: E402
+from extractors.error_parser import ErrorEvent, EventAggregator, iter_parse_events  # noqa: E402
+from extractors.event_dedup import EventDeduplicator  # noqa: E402
+from outputs.event_exporter import open_event_writer  # noqa: E402
+from outputs.report_generator import TimelineBuffer  # noqa: E402
+
+logging.disable(logging.CRITICAL)
+
+CONFIG_PATH = SRC_DIR / "config" / "settings.example.json"
+
+# Patterns that flap during the storm
+FLAPPING = [("Navigation", "NAV-0001"), ("Power", "POW-0013"), ("Communications", "COM-0021")]
+
+def storm_events(count: int, storm: float, retransmit: float, config: Dict[str, Any]) -> List[ErrorEvent]:
+    """
+    ``count`` events in stream order: ``storm`` of them are repeats of the
+    flapping patterns, and ``retransmit`` of all events are sent twice.
+    """
+    generator = TelemetryGenerator()
+    rng = random.Random(7)
+    records = (json.loads(generator.record(index)) for index in range(count))
+    events: List[ErrorEvent] = []
+    for ev in iter_parse_events(records, config):
+        if rng.random() < storm:
+            subsystem, code = FLAPPING[rng.randrange(len(FLAPPING))]
+            ev = replace(ev, subsystem=subsystem, error_code=code, resolved=rng.random() < 0.5)
+        events.append(ev)
+        if rng.random() < retransmit:
+            events.append(replace(ev))
+    return events
+
+def downstream(events: Iterable[ErrorEvent], out_path: Path, config: Dict[str, Any]) -> int:
+    aggregator = EventAggregator.from_config(config)
+    timeline = TimelineBuffer()
+    with open_event_writer(out_path, "jsonl") as writer:
+        for ev in events:
+            writer.write(ev)
+            aggregator.add(ev)
+            timeline.add(ev)
+    aggregator.snapshot()
+    return aggregator.total_events
+
+def dedup_peak_bytes(events: List[ErrorEvent], config: Dict[str, Any]) -> int:
+    dedup = EventDeduplicator.from_config(config)
+    tracemalloc.start()
+    for ev in dedup.unique(events):
+        dedup.add(ev)
+    dedup.flush()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--storm", type=float, default=0.8, help="Share of flapping repeats")
+    parser.add_argument("--retransmit", type=float, default=0.05, help="Share of duplicated records")
+    parser.add_argument("--id-capacity", type=int, default=16384)
+    args = parser.parse_args()
+
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    config.setdefault("dedup", {})["id_capacity"] = args.id_capacity
+    events = storm_events(args.count, args.storm, args.retransmit, config)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out_path = Path(tmp) / "events.jsonl"
+        started = time.perf_counter()
+        plain = downstream(events, out_path, config)
+        plain_seconds = time.perf_counter() - started
+
+        dedup = EventDeduplicator.from_config(config)
+        started = time.perf_counter()
+        collapsed = downstream(dedup.process(events), out_path, config)
+        dedup_seconds = time.perf_counter() - started
+
+    print(f"{len(events)} events, {dedup.duplicates} duplicates")
+    print(f"{'downstream':<16} {'records':>9} {'seconds':>8} {'speedup':>8}")
+    print(f"{'as is':<16} {plain:>9} {plain_seconds:>8.2f} {'':>8}")
+    print(f"{'deduplicated':<16} {collapsed:>9} {dedup_seconds:>8.2f} {plain_seconds / dedup_seconds:>7.1f}x")
+
+    print(f"{'events':>9} {'dedup peak MB':>14}")
+    for fraction in (0.125, 0.25, 0.5, 1.0):
+        part = events[: int(len(events) * fraction)]
+        print(f"{len(part):>9} {dedup_peak_bytes(part, config) / 1e6:>14.1f}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
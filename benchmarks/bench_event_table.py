@@ -0,0 +1,91 @@
+"""
+Compare memory per event and aggregation time of a list of ErrorEvent
+objects against the columnar EventTable.
+
+Usage:
+    python benchmarks/bench_event_table.py [--count 200000]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from extractors.error_parser import aggregate_events, parse_event_table, parse_events  # noqa: E402
+
+SUBSYSTEMS = ["Navigation", "Power", "Thermal", "Communications", "Payload"]
+SEVERITIES = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+DESCRIPTIONS = [
+    "Star tracker lost lock on reference stars.",
+    "Bus voltage dipped below safe threshold.",
+    "Localized temperature drift above expected range.",
+    "Intermittent signal loss detected on downlink channel.",
+]
+
+def make_records(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    # Round-trip through JSON so every string is a distinct object, as it
+    # would be when read from a file.
+    return json.loads(json.dumps([
+        {
+            "timestamp": f"2025-11-10T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}Z",
+            "subsystem": rng.choice(SUBSYSTEMS),
+            "error_code": f"ERR-{rng.randint(1, 200):03d}",
+            "severity": rng.choice(SEVERITIES),
+            "description": rng.choice(DESCRIPTIONS),
+            "telemetry_id": f"TLM-{i:08d}",
+            "resolved": rng.random() < 0.5,
+        }
+        for i in range(count)
+    ]))
+
+def measured(build: Callable[[], Any]) -> Tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    config = json.loads((SRC_DIR / "config" / "settings.example.json").read_text())
+    records = make_records(args.count)
+
+    events, list_bytes = measured(lambda: parse_events(records, config))
+    table, table_bytes = measured(lambda: parse_event_table(records, config))
+    del records
+
+    started = time.perf_counter()
+    list_summary = aggregate_events(events)
+    list_agg = time.perf_counter() - started
+
+    started = time.perf_counter()
+    table_summary = aggregate_events(table)
+    table_agg = time.perf_counter() - started
+
+    assert list_summary == table_summary, "columnar aggregation diverged"
+
+    print(f"events: {args.count}")
+    print(f"{'container':<12} {'bytes/event':>12} {'aggregate ms':>13}")
+    print(f"{'list':<12} {list_bytes / args.count:>12.1f} {list_agg * 1e3:>13.1f}")
+    print(f"{'EventTable':<12} {table_bytes / args.count:>12.1f} {table_agg * 1e3:>13.1f}")
+    print(f"memory reduction: {list_bytes / table_bytes:.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+"""
+Compare an hourly report refresh by incremental snapshot with a full rebuild.
+
+A rolling archive of ``--days`` days is written as one JSON lines file per
+hour under ``YYYY/MM/DD/`` directories. The report snapshot is built over
+all but the last hour, then the last hour arrives and the report is
+refreshed twice: by rebuilding it from the whole archive, and by an
+incremental run that only reads the partitions at or after the snapshot's
+high-water mark. Both reports are checked to be identical. Rendering the
+text, JSON and CSV reports straight from the snapshot is timed as well.
+
+Usage:
+    python benchmarks/bench_incremental.py [--days 14] [--per-hour 300]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT / "src"
+for path in (ROOT, SRC_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.suite.generator import TelemetryGenerator  # noqa: E402
+from extractors.telemetry_sources import MergedTelemetry, discover_sources  # noqa: E402
+from extractors.utils_time import parse_timestamp  # noqa: E402
+from main import run_pipeline  # noqa: E402
+from outputs.report_generator import REPORT_FORMATS, error_report_path, generate_report  # noqa: E402
+from outputs.report_snapshot import SNAPSHOT_FILENAME, ReportSnapshot  # noqa: E402
+
+logging.disable(logging.CRITICAL)
+
+CONFIG_PATH = SRC_DIR / "config" / "settings.example.json"
+
+def write_archive(root: Path, days: int, per_hour: int) -> Path:
+    """
+    Write the hourly partitions and return the file of the last hour.
+    """
+    generator = TelemetryGenerator(interval=3600 / per_hour)
+    files: Dict[Path, List[Tuple[datetime, str]]] = {}
+    for index in range(days * 24 * per_hour):
+        record = json.loads(generator.record(index))
+        ts = next((record.pop(key) for key in ("timestamp", "time", "ts") if key in record), None)
+        try:
+            timestamp = parse_timestamp(ts).astimezone(timezone.utc)
+        except (TypeError, ValueError):
+            continue
+        record["timestamp"] = timestamp.isoformat()
+        path = root / timestamp.strftime("%Y/%m/%d/%H.jsonl")
+        files.setdefault(path, []).append((timestamp, json.dumps(record)))
+
+    for path, rows in files.items():
+        rows.sort(key=lambda row: row[0])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(line + "\n" for _, line in rows), encoding="utf-8")
+    return max(files)
+
+def refresh(
+    root: Path, out: Path, config: Dict[str, Any], snapshot: Optional[ReportSnapshot] = None
+) -> str:
+    since = snapshot.high_water_mark if snapshot is not None else None
+    sources = discover_sources([root], since=since)
+    run_pipeline(
+        config,
+        MergedTelemetry.from_config(sources, config, since),
+        streaming=True,
+        output_dir=out,
+        export_format="jsonl",
+        snapshot=snapshot,
+    )
+    return (out / "error_report.txt").read_text(encoding="utf-8")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--per-hour", type=int, default=300, help="Records per hourly file")
+    args = parser.parse_args()
+
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    with tempfile.TemporaryDirectory() as tmp:
+        root, out = Path(tmp) / "archive", Path(tmp) / "out"
+        last_hour = write_archive(root, args.days, args.per_hour)
+        held_back = last_hour.with_name(last_hour.name + ".pending")
+        last_hour.rename(held_back)
+        snapshot_path = out / SNAPSHOT_FILENAME
+        refresh(root, out, config, ReportSnapshot.load(snapshot_path, config))
+        held_back.rename(last_hour)
+
+        started = time.perf_counter()
+        rebuilt = refresh(root, out, config)
+        full_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        snapshot = ReportSnapshot.load(snapshot_path, config)
+        updated = refresh(root, out, config, snapshot)
+        incremental_seconds = time.perf_counter() - started
+        assert updated == rebuilt, "incremental report differs from the rebuilt one"
+
+        started = time.perf_counter()
+        snapshot = ReportSnapshot.read(snapshot_path)
+        generate_report(snapshot.timeline, snapshot.summary(), out, formats=list(REPORT_FORMATS))
+        render_seconds = time.perf_counter() - started
+        sizes = sum(error_report_path(out, fmt).stat().st_size for fmt in REPORT_FORMATS)
+
+        files = len(discover_sources([root]))
+        print(f"{files} hourly files, {snapshot.aggregator.total_events} events, "
+              f"snapshot {snapshot_path.stat().st_size / 1e3:.0f} kB")
+        print(f"{'refresh':<28} {'seconds':>8} {'speedup':>8}")
+        print(f"{'full rebuild':<28} {full_seconds:>8.3f} {'':>8}")
+        print(f"{'incremental':<28} {incremental_seconds:>8.3f} {full_seconds / incremental_seconds:>7.1f}x")
+        print(f"{'render text+json+csv':<28} {render_seconds:>8.3f} {full_seconds / render_seconds:>7.1f}x")
+        print(f"({sizes / 1e3:.0f} kB of reports)")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,163 @@
+"""
+Load-test the ingestion server with a synthetic sender.
+
+The server runs in this process with a sink that parses, aggregates and
+checks alerts like ``main.py --serve``. A sender subprocess renders
+generated records up front and then pushes them as fast as the server
+accepts them over TCP, a Unix socket or HTTP POST (``--post-size``
+records per request on one keep-alive connection). Throughput is taken
+from the first byte sent to the last record processed; batch latency and
+queue depth come from the server's counters.
+
+Usage:
+    python benchmarks/bench_ingest.py [--count 200000] [--protocols tcp unix http]
+                                      [--batch-size 1000] [--queue-size 10000]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import http.client
+import json
+import logging
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT / "src"
+for path in (ROOT, SRC_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.suite.generator import TelemetryGenerator  # noqa: E402
+from extractors.alert_window import AlertEngine  # noqa: E402
+from extractors.error_parser import EventAggregator, iter_parse_events  # noqa: E402
+from extractors.ingest_server import IngestionServer  # noqa: E402
+
+logging.disable(logging.CRITICAL)
+
+CONFIG_PATH = SRC_DIR / "config" / "settings.example.json"
+
+def send(protocol: str, address: str, count: int, post_size: int) -> None:
+    """
+    Sender process: render ``count`` records, report readiness on stdout,
+    wait for a line on stdin, then send.
+    """
+    generator = TelemetryGenerator()
+    lines = [(generator.record(index) + "\n").encode("utf-8") for index in range(count)]
+    print("ready", flush=True)
+    sys.stdin.readline()
+
+    if protocol == "http":
+        host, port = address.rsplit(":", 1)
+        conn = http.client.HTTPConnection(host, int(port))
+        for start in range(0, count, post_size):
+            conn.request("POST", "/ingest", body=b"".join(lines[start:start + post_size]))
+            response = conn.getresponse()
+            response.read()
+            if response.status != 202:
+                raise SystemExit(f"POST failed with {response.status}")
+        conn.close()
+        return
+
+    if protocol == "unix":
+        sock = socket.socket(socket.AF_UNIX)
+        sock.connect(address)
+    else:
+        host, port = address.rsplit(":", 1)
+        sock = socket.create_connection((host, int(port)))
+    with sock:
+        sock.sendall(b"".join(lines))
+
+def run(protocol: str, args: argparse.Namespace, config: Dict[str, Any], tmp_dir: Path) -> Dict[str, Any]:
+    aggregator = EventAggregator.from_config(config)
+    alert_engine = AlertEngine(config)
+
+    def handle_batch(records: List[Dict[str, Any]]) -> None:
+        for ev in iter_parse_events(records, config):
+            aggregator.add(ev)
+            alert_engine.observe(ev)
+
+    server = IngestionServer(
+        handle_batch,
+        tcp_port=0 if protocol == "tcp" else None,
+        http_port=0 if protocol == "http" else None,
+        unix_path=tmp_dir / "ingest.sock" if protocol == "unix" else None,
+        queue_size=args.queue_size,
+        batch_size=args.batch_size,
+        batch_latency=args.batch_latency_ms / 1000,
+        stats_interval=None,
+    )
+    thread = threading.Thread(target=lambda: asyncio.run(server.run()))
+    thread.start()
+    server.ready.wait()
+    address = server.addresses[protocol]
+    if protocol != "unix":
+        address = f"{address[0]}:{address[1]}"
+
+    sender = subprocess.Popen(
+        [sys.executable, __file__, "--send", protocol, address, "--count", str(args.count),
+         "--post-size", str(args.post_size)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        sender.stdout.readline()  # type: ignore[union-attr]
+        started = time.perf_counter()
+        sender.stdin.write("go\n")  # type: ignore[union-attr]
+        sender.stdin.flush()  # type: ignore[union-attr]
+        stats = server.stats
+        while stats.processed + stats.malformed < args.count:
+            if sender.poll() not in (None, 0):
+                raise RuntimeError(f"Sender failed with exit code {sender.returncode}")
+            time.sleep(0.005)
+        elapsed = time.perf_counter() - started
+    finally:
+        sender.wait()
+        server.request_stop()
+        thread.join()
+
+    result = server.stats.to_dict()
+    result["seconds"] = elapsed
+    result["records_per_second"] = stats.processed / elapsed
+    return result
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--protocols", nargs="+", choices=("tcp", "unix", "http"), default=["tcp", "unix", "http"])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--batch-latency-ms", type=float, default=200)
+    parser.add_argument("--queue-size", type=int, default=10000)
+    parser.add_argument("--post-size", type=int, default=500, help="Records per HTTP POST")
+    parser.add_argument("--send", nargs=2, metavar=("PROTOCOL", "ADDRESS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.send:
+        send(args.send[0], args.send[1], args.count, args.post_size)
+        return 0
+
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    print(
+        f"{'protocol':<9} {'records/s':>10} {'seconds':>8} {'batches':>8} "
+        f"{'mean ms':>8} {'max ms':>8} {'peak queue':>11}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for protocol in args.protocols:
+            result = run(protocol, args, config, Path(tmp))
+            print(
+                f"{protocol:<9} {result['records_per_second']:>10.0f} {result['seconds']:>8.2f} "
+                f"{result['batches']:>8} {result['mean_latency_ms']:>8.1f} "
+                f"{result['max_latency_ms']:>8.1f} {result['peak_queue_depth']:>11}"
+            )
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+"""
+Compare evaluating several configurations in one pass with one run each.
+
+Mission-phase variants of the example settings are derived, each with its
+own severity levels and alert threshold. The same generated telemetry file
+is then evaluated by one streaming run per configuration, as invoking
+main.py once per settings file does, and by a single multi-config run that
+reads and parses the records once. A lone single-configuration run is
+timed as the floor the multi-config run is measured against.
+
+Usage:
+    python benchmarks/bench_multi_config.py [--count 200000] [--configs 4]
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT / "src"
+for path in (ROOT, SRC_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.suite.generator import TelemetryGenerator  # noqa: E402
+from main import run_multi_config, run_pipeline  # noqa: E402
+
+logging.disable(logging.CRITICAL)
+
+CONFIG_PATH = SRC_DIR / "config" / "settings.example.json"
+
+def phase_configs(base: Dict[str, Any], count: int) -> Dict[str, Dict[str, Any]]:
+    """
+    ``count`` variants of ``base``: phases after the first stop treating
+    MEDIUM as a level of its own (it becomes UNKNOWN) or promote HIGH to
+    critical, and raise the alert threshold.
+    """
+    configs = {}
+    for index in range(count):
+        config = copy.deepcopy(base)
+        levels = config["severity_levels"]
+        if index % 3 == 1:
+            levels.pop("MEDIUM", None)
+        elif index % 3 == 2:
+            levels["HIGH"] = levels["CRITICAL"]
+        config["alerting"]["critical_error_threshold"] = 1 + 5 * index
+        configs[f"phase{index + 1}"] = config
+    return configs
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--configs", type=int, default=4)
+    args = parser.parse_args()
+
+    base = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    configs = phase_configs(base, args.configs)
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = Path(tmp) / "telemetry.jsonl"
+        generator = TelemetryGenerator()
+        with data_path.open("w", encoding="utf-8") as f:
+            for index in range(args.count):
+                f.write(generator.record(index) + "\n")
+
+        started = time.perf_counter()
+        run_pipeline(base, data_path, streaming=True, output_dir=Path(tmp) / "one")
+        one_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for name, config in configs.items():
+            run_pipeline(config, data_path, streaming=True, output_dir=Path(tmp) / "separate" / name)
+        separate_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        run_multi_config(configs, [data_path], Path(tmp) / "multi")
+        multi_seconds = time.perf_counter() - started
+
+    print(f"{args.count} records, {len(configs)} configurations")
+    print(f"{'strategy':<28} {'seconds':>8} {'vs one run':>11}")
+    print(f"{'one configuration':<28} {one_seconds:>8.2f} {1.0:>10.2f}x")
+    print(f"{'one run per configuration':<28} {separate_seconds:>8.2f} {separate_seconds / one_seconds:>10.2f}x")
+    print(f"{'single pass, fanned out':<28} {multi_seconds:>8.2f} {multi_seconds / one_seconds:>10.2f}x")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
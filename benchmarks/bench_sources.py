@@ -0,0 +1,120 @@
+"""
+Compare merged multi-file ingestion with parsing the files one by one.
+
+A generated dataset is split into per-subsystem, per-day partitions under
+``YYYY/MM/DD/`` directories, each file in timestamp order and optionally
+gzip-compressed. The partitions are then parsed file by file and sorted
+(the only option before directory inputs), and merged by MergedTelemetry
+with one and with several reader threads. A ``--since`` run shows the
+effect of skipping partitions outside the range.
+
+Usage:
+    python benchmarks/bench_sources.py [--count 200000] [--workers 4] [--gzip]
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from operator import attrgetter, itemgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT / "src"
+for path in (ROOT, SRC_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.suite.generator import TelemetryGenerator  # noqa: E402
+from extractors.error_parser import iter_parse_events  # noqa: E402
+from extractors.telemetry_reader import iter_telemetry  # noqa: E402
+from extractors.telemetry_sources import MergedTelemetry, discover_sources  # noqa: E402
+from extractors.utils_time import parse_timestamp  # noqa: E402
+
+CONFIG_PATH = SRC_DIR / "config" / "settings.example.json"
+
+def write_partitions(root: Path, count: int, compress: bool) -> None:
+    """
+    Write ``count`` generated records as time-ordered JSON lines files, one
+    per subsystem and day.
+    """
+    generator = TelemetryGenerator(interval=2.0)
+    files: Dict[Path, List[Tuple[datetime, str]]] = {}
+    for index in range(count):
+        record = json.loads(generator.record(index))
+        ts = next((record[key] for key in ("timestamp", "time", "ts") if key in record), None)
+        try:
+            timestamp = parse_timestamp(ts)
+        except (TypeError, ValueError):
+            continue
+        record = {"timestamp": timestamp.isoformat(), **{
+            key: value for key, value in record.items() if key not in ("timestamp", "time", "ts")
+        }}
+        subsystem = record.get("subsystem") or record.get("module")
+        name = timestamp.strftime("%Y/%m/%d/") + f"{subsystem}.jsonl"
+        files.setdefault(root / name, []).append((timestamp, json.dumps(record)))
+
+    for path, rows in files.items():
+        rows.sort(key=itemgetter(0))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = "".join(line + "\n" for _, line in rows)
+        if compress:
+            with gzip.open(path.with_name(path.name + ".gz"), "wt", encoding="utf-8") as f:
+                f.write(text)
+        else:
+            path.write_text(text, encoding="utf-8")
+
+def one_by_one(paths: List[Path], config: Dict[str, Any]) -> int:
+    events = []
+    for path in paths:
+        events.extend(iter_parse_events(iter_telemetry(path), config))
+    events.sort(key=attrgetter("timestamp"))
+    return len(events)
+
+def timed(func: Callable[[], int]) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--gzip", action="store_true", help="Compress the partitions")
+    args = parser.parse_args()
+
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_partitions(root, args.count, args.gzip)
+        paths = discover_sources([root])
+        merged = list(MergedTelemetry(paths, config))
+        expected = sorted(merged, key=attrgetter("timestamp"))
+        assert [ev.timestamp for ev in merged] == [ev.timestamp for ev in expected]
+        since = merged[len(merged) // 2].timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+        since += timedelta(days=1)
+
+        print(f"{len(paths)} files, {len(merged)} events")
+        print(f"{'strategy':<28} {'seconds':>8} {'speedup':>8}")
+        baseline = timed(lambda: one_by_one(paths, config))
+        print(f"{'one by one, then sort':<28} {baseline:>8.2f} {'':>8}")
+        for workers in sorted({1, args.workers}):
+            seconds = timed(lambda: sum(1 for _ in MergedTelemetry(paths, config, workers)))
+            label = f"merged, {workers} thread{'s' if workers > 1 else ''}"
+            print(f"{label:<28} {seconds:>8.2f} {baseline / seconds:>7.1f}x")
+
+        def ranged() -> int:
+            sources = discover_sources([root], since=since)
+            return sum(1 for _ in MergedTelemetry(sources, config, args.workers, since=since))
+
+        seconds = timed(ranged)
+        print(f"{'merged, --since ' + since.date().isoformat():<28} {seconds:>8.2f} {baseline / seconds:>7.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
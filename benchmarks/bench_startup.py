@@ -0,0 +1,104 @@
+"""
+Measure what small main.py invocations cost cold and through a warm worker.
+
+Every invocation analyzes the same small telemetry file (``--count``
+records), as the cron jobs do, in a fresh interpreter: a bare interpreter
+start as the floor, a cold ``main.py`` run, and ``main.py submit`` to a
+worker started once up front. Wall-clock times per invocation are the
+median over ``--runs`` invocations; the reports of the cold and warm runs
+are checked to be identical.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 20] [--count 200]
+"""
+from __future__ import annotations
+
+import argparse
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT / "src"
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.suite.generator import TelemetryGenerator  # noqa: E402
+
+MAIN = SRC_DIR / "main.py"
+
+def median_seconds(command: List[str], runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+def wait_for_worker(path: Path, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_UNIX) as probe:
+            try:
+                probe.connect(str(path))
+                return
+            except OSError:
+                time.sleep(0.05)
+    raise RuntimeError(f"worker did not start listening on {path}")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--count", type=int, default=200, help="Records in the analyzed file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        data_path = tmp_dir / "telemetry.jsonl"
+        generator = TelemetryGenerator()
+        with data_path.open("w", encoding="utf-8") as f:
+            for index in range(args.count):
+                f.write(generator.record(index) + "\n")
+        socket_path = tmp_dir / "worker.sock"
+
+        floor = median_seconds([sys.executable, "-c", "pass"], args.runs)
+        cold = median_seconds(
+            [sys.executable, str(MAIN), str(data_path), "--output-dir", str(tmp_dir / "cold")],
+            args.runs,
+        )
+        worker = subprocess.Popen(
+            [sys.executable, str(MAIN), "worker", "--socket", str(socket_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_for_worker(socket_path)
+            warm = median_seconds(
+                [sys.executable, str(MAIN), "submit", "--socket", str(socket_path),
+                 str(data_path), "--output-dir", str(tmp_dir / "warm")],
+                args.runs,
+            )
+        finally:
+            worker.terminate()
+            worker.wait()
+
+        reports = [
+            (tmp_dir / name / "error_report.txt").read_text(encoding="utf-8")
+            for name in ("cold", "warm")
+        ]
+        assert reports[0] == reports[1], "worker report differs from the cold run's"
+
+    print(f"{args.count} records per invocation, median of {args.runs} invocations")
+    print(f"{'invocation':<28} {'ms':>8} {'over floor':>11}")
+    print(f"{'python -c pass':<28} {floor * 1000:>8.1f} {'':>11}")
+    print(f"{'main.py (cold)':<28} {cold * 1000:>8.1f} {(cold - floor) * 1000:>9.1f}ms")
+    print(f"{'main.py submit (warm)':<28} {warm * 1000:>8.1f} {(warm - floor) * 1000:>9.1f}ms")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
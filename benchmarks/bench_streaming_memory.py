@@ -0,0 +1,91 @@
+"""
+Compare peak RSS of the batch and streaming pipelines as input size grows.
+
+Each measurement runs in a fresh interpreter so the peak resident set size
+reported by ``getrusage`` belongs to that run alone.
+
+Usage:
+    python benchmarks/bench_streaming_memory.py [--sizes 20000 80000 320000]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = PROJECT_ROOT / "src"
+
+SUBSYSTEMS = ["Navigation", "Power", "Thermal", "Communications", "Payload"]
+SEVERITIES = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+
+_CHILD = """
+import json, logging, resource, sys
+from pathlib import Path
+sys.path.insert(0, {src!r})
+import main
+logging.disable(logging.CRITICAL)
+config = json.loads(Path({config!r}).read_text())
+main.run_pipeline(config, Path({data!r}), streaming={streaming}, output_dir=Path({out!r}))
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+def write_sample(path: Path, count: int, seed: int = 42) -> None:
+    rng = random.Random(seed)
+    with path.open("w", encoding="utf-8") as f:
+        f.write("[")
+        for i in range(count):
+            record = {
+                "timestamp": f"2025-11-10T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}Z",
+                "subsystem": rng.choice(SUBSYSTEMS),
+                "error_code": f"ERR-{rng.randint(1, 50):03d}",
+                "severity": rng.choice(SEVERITIES),
+                "description": "Synthetic telemetry anomaly for benchmarking.",
+                "telemetry_id": f"TLM-{i:08d}",
+                "resolved": rng.random() < 0.5,
+            }
+            f.write(",\n" if i else "\n")
+            f.write(json.dumps(record))
+        f.write("\n]")
+
+def peak_rss_kb(data: Path, out: Path, streaming: bool) -> int:
+    code = _CHILD.format(
+        src=str(SRC_DIR),
+        config=str(SRC_DIR / "config" / "settings.example.json"),
+        data=str(data),
+        out=str(out),
+        streaming=streaming,
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return int(result.stdout.strip().splitlines()[-1])
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[20_000, 80_000, 320_000]
+    )
+    args = parser.parse_args()
+
+    print(f"{'records':>10} {'file MB':>9} {'batch MB':>10} {'stream MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for size in args.sizes:
+            data = tmp_dir / f"telemetry_{size}.json"
+            write_sample(data, size)
+            batch = peak_rss_kb(data, tmp_dir / "batch", streaming=False)
+            stream = peak_rss_kb(data, tmp_dir / "stream", streaming=True)
+            print(
+                f"{size:>10} {data.stat().st_size / 1e6:>9.1f} "
+                f"{batch / 1024:>10.1f} {stream / 1024:>10.1f}"
+            )
+            data.unlink()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+"""
+Micro-benchmark of TimestampParser against the previous parse_timestamp.
+
+Timestamps are generated in bursts that share the same second, as telemetry
+downlinks typically do.
+
+Usage:
+    python benchmarks/bench_timestamps.py [--count 200000] [--burst 8]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from extractors.utils_time import TimestampParser, parse_timestamp  # noqa: E402
+
+def legacy_parse_timestamp(value: str) -> datetime:
+    """
+    parse_timestamp as it was before the TimestampParser engine, kept verbatim
+    as the baseline (it expects strings, so epoch values are passed via str()).
+    """
+    if not value:
+        raise ValueError("Empty timestamp")
+
+    text = value.strip()
+
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+
+    try:
+        dt = datetime.fromisoformat(text)
+    except ValueError:
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
+            try:
+                dt = datetime.strptime(text, fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            raise
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    else:
+        dt = dt.astimezone(timezone.utc)
+
+    return dt
+
+def make_samples(count: int, burst: int) -> Dict[str, List[Any]]:
+    start = datetime(2025, 11, 10, tzinfo=timezone.utc)
+    moments = [
+        start + timedelta(seconds=i // burst, microseconds=(i % burst) * 1000)
+        for i in range(count)
+    ]
+    return {
+        "iso Z": [m.strftime("%Y-%m-%dT%H:%M:%SZ") for m in moments],
+        "iso fraction Z": [m.strftime("%Y-%m-%dT%H:%M:%S.%fZ") for m in moments],
+        "iso +00:00": [m.isoformat() for m in moments],
+        "space separated": [m.strftime("%Y-%m-%d %H:%M:%S") for m in moments],
+        "epoch seconds": [int(m.timestamp()) for m in moments],
+    }
+
+def timed(func: Callable[[Any], datetime], values: List[Any]) -> float:
+    started = time.perf_counter()
+    for value in values:
+        func(value)
+    return time.perf_counter() - started
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--burst", type=int, default=8)
+    args = parser.parse_args()
+
+    print(
+        f"{'format':<18} {'legacy ns':>10} {'generic ns':>11} "
+        f"{'engine ns':>10} {'speedup':>8}"
+    )
+    for name, values in make_samples(args.count, args.burst).items():
+        if name.startswith("epoch"):
+            # The legacy parser rejects numbers outright
+            legacy = float("nan")
+        else:
+            legacy = timed(legacy_parse_timestamp, values)
+        generic = timed(parse_timestamp, values)
+        engine = timed(TimestampParser(), values)
+        baseline = generic if legacy != legacy else legacy
+        print(
+            f"{name:<18} {legacy / len(values) * 1e9:>10.0f} "
+            f"{generic / len(values) * 1e9:>11.0f} "
+            f"{engine / len(values) * 1e9:>10.0f} {baseline / engine:>7.1f}x"
+        )
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+"""
+Compare memory and accuracy of the Space-Saving top-K sketch against an
+exact Counter over high-cardinality (subsystem, error_code) pairs.
+
+Usage:
+    python benchmarks/bench_topk.py [--count 1000000] [--codes 200000] [--shards 1]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from extractors.heavy_hitters import SpaceSaving  # noqa: E402
+
+SUBSYSTEMS = ["Navigation", "Power", "Thermal", "Communications", "Payload"]
+CAPACITIES = [100, 1_000, 10_000]
+TOP = 10
+
+def make_pairs(count: int, codes: int, seed: int = 7) -> List[Tuple[str, str]]:
+    """
+    Zipf-distributed pairs: a few codes dominate, with a long tail of rare
+    ones, as fleet-wide error codes tend to be.
+    """
+    rng = random.Random(seed)
+    keys = [(SUBSYSTEMS[i % len(SUBSYSTEMS)], f"ERR-{i:06d}") for i in range(codes)]
+    weights = [1 / (rank + 1) ** 1.1 for rank in range(codes)]
+    return rng.choices(keys, weights, k=count)
+
+def measured(build: Callable[[], Any]) -> Tuple[Any, int, float]:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+def sketch(pairs: List[Tuple[str, str]], capacity: int, shards: int) -> SpaceSaving:
+    # Build one sketch per shard and merge them, as parallel workers would
+    parts = [SpaceSaving(capacity) for _ in range(shards)]
+    for i, pair in enumerate(pairs):
+        parts[i % shards].add(pair)
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    return merged
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--codes", type=int, default=200_000)
+    parser.add_argument("--shards", type=int, default=1)
+    args = parser.parse_args()
+
+    pairs = make_pairs(args.count, args.codes)
+
+    exact, exact_bytes, exact_time = measured(lambda: Counter(pairs))
+    top = exact.most_common(TOP)
+    print(f"events: {args.count}, distinct pairs: {len(exact)}, shards: {args.shards}")
+    print(
+        f"{'structure':<16} {'KiB':>9} {'seconds':>8} {'top-10 hit':>10} "
+        f"{'max abs err':>11} {'error bound':>11}"
+    )
+    print(
+        f"{'Counter':<16} {exact_bytes / 1024:>9.0f} {exact_time:>8.2f} "
+        f"{TOP:>10} {0:>11} {0:>11}"
+    )
+
+    for capacity in CAPACITIES + [len(exact)]:
+        result, nbytes, elapsed = measured(lambda: sketch(pairs, capacity, args.shards))
+        reported = result.most_common(TOP)
+        hits = len({key for key, _ in reported} & {key for key, _ in top})
+        max_error = max(count - exact[key] for key, count in reported)
+        bound = result.error_bound()
+        assert max_error <= bound, "sketch exceeded its error bound"
+        if capacity >= len(exact):
+            assert reported == top, "sketch not exact within capacity"
+        print(
+            f"{'SpaceSaving ' + str(capacity):<16} {nbytes / 1024:>9.0f} {elapsed:>8.2f} "
+            f"{hits:>10} {max_error:>11} {bound:>11}"
+        )
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
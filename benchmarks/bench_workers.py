@@ -0,0 +1,85 @@
+"""
+Measure batch parse time against the number of parse worker processes.
+
+Parses ``--count`` generated records with ``parse_and_aggregate`` serially
+and through the process pool with 2, 4, ... up to ``--max-workers`` workers,
+including counts above the available CPUs, which ``--workers`` is capped at,
+to show what oversubscribing them costs. Every pool is started afresh, as it
+is on each run of main.py, and the events and summary are checked against
+the serial result. Times are the best of ``--runs``.
+
+Usage:
+    python benchmarks/bench_workers.py [--count 200000] [--max-workers 8] [--runs 3]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT / "src"
+for path in (ROOT, SRC_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.suite.generator import TelemetryGenerator  # noqa: E402
+from extractors.error_parser import (  # noqa: E402
+    DEFAULT_CHUNK_SIZE,
+    _parse_parallel,
+    available_cpus,
+    parse_and_aggregate,
+)
+from extractors.field_schema import FieldSchema  # noqa: E402
+
+def best_seconds(run: Callable[[], Any], runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--max-workers", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    config = json.loads((SRC_DIR / "config" / "settings.example.json").read_text())
+    generator = TelemetryGenerator()
+    records: List[Dict[str, Any]] = [json.loads(generator.record(i)) for i in range(args.count)]
+    schema = FieldSchema.from_config(config)
+
+    events, aggregator = parse_and_aggregate(records, config)
+    expected = aggregator.snapshot()
+    serial = best_seconds(lambda: parse_and_aggregate(records, config), args.runs)
+
+    cpus = available_cpus()
+    print(f"{args.count} records, {cpus} available CPUs, chunks of {DEFAULT_CHUNK_SIZE}")
+    print(f"{'workers':<10} {'seconds':>8} {'speedup':>8}")
+    print(f"{'serial':<10} {serial:>8.2f} {1.0:>7.2f}x")
+
+    workers = 2
+    while workers <= args.max_workers:
+        # Called directly, as parse_and_aggregate would cap the pool at the CPUs
+        def run(workers: int = workers) -> Any:
+            return _parse_parallel(records, schema, workers, DEFAULT_CHUNK_SIZE, aggregate=True)
+
+        parallel_events, parallel_aggregator = run()
+        assert parallel_events == events, f"events with {workers} workers differ"
+        assert parallel_aggregator.snapshot() == expected, f"summary with {workers} workers differs"
+        elapsed = best_seconds(run, args.runs)
+        note = "" if workers <= cpus else "  (above the CPU count; capped)"
+        print(f"{workers:<10} {elapsed:>8.2f} {serial / elapsed:>7.2f}x{note}")
+        workers *= 2
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
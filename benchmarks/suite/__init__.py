@@ -0,0 +1,16 @@
+"""
+Reproducible benchmark suite: a seeded telemetry generator and a runner that
+times every pipeline stage and compares the results against a baseline.
+"""
+from .generator import SHAPES, TelemetryGenerator, ensure_dataset, write_telemetry
+from .runner import MODES, compare, run_suite
+
+__all__ = [
+    "MODES",
+    "SHAPES",
+    "TelemetryGenerator",
+    "compare",
+    "ensure_dataset",
+    "run_suite",
+    "write_telemetry",
+]
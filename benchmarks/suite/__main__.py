@@ -0,0 +1,124 @@
+"""
+Generate synthetic telemetry and benchmark the pipeline against a baseline.
+
+Usage (from the repository root):
+    python -m benchmarks.suite generate out.jsonl --count 1e6 --shape jsonl
+    python -m benchmarks.suite run --counts 1e4 1e5 --save-baseline
+    python -m benchmarks.suite run --counts 1e4 1e5
+
+A run exits with status 1 when a scenario regressed against the baseline,
+so it can gate an upgrade. Baselines are machine specific: record one on the
+old version and compare on the same host.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+from .generator import DEFAULT_SEED, SHAPES, write_telemetry
+from .runner import MODES, PROJECT_ROOT, compare, load_results, run_suite, save_results
+
+RESULTS_DIR = PROJECT_ROOT / "benchmarks" / "results"
+
+def _count(value: str) -> int:
+    # Accept 1e6 as well as 1000000
+    count = int(float(value))
+    if count < 0:
+        raise argparse.ArgumentTypeError("count must not be negative")
+    return count
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite", description=__doc__.splitlines()[1]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="Write a synthetic telemetry file")
+    generate.add_argument("path", type=Path)
+    generate.add_argument("--count", type=_count, default=10_000)
+    generate.add_argument("--shape", choices=SHAPES, default="jsonl")
+    generate.add_argument("--seed", type=int, default=DEFAULT_SEED)
+
+    run = commands.add_parser("run", help="Benchmark the pipeline over generated datasets")
+    run.add_argument("--counts", type=_count, nargs="+", default=[10_000, 100_000])
+    run.add_argument("--shapes", choices=SHAPES, nargs="+", default=list(SHAPES))
+    run.add_argument("--modes", choices=sorted(MODES), nargs="+", default=["batch", "stream"])
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    run.add_argument(
+        "--data-dir",
+        type=Path,
+        default=RESULTS_DIR / "data",
+        help="Where generated datasets are kept for reuse (default: %(default)s)",
+    )
+    run.add_argument("--output", type=Path, default=RESULTS_DIR / "latest.json")
+    run.add_argument("--baseline", type=Path, default=RESULTS_DIR / "baseline.json")
+    run.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store this run as the baseline instead of comparing against it",
+    )
+    run.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative slowdown per stage (default: %(default)s)",
+    )
+    run.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.05,
+        help="Ignore slowdowns smaller than this (default: %(default)s)",
+    )
+    run.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative growth of peak RSS (default: %(default)s)",
+    )
+    return parser.parse_args(argv)
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.command == "generate":
+        write_telemetry(args.path, args.count, args.shape, args.seed)
+        print(f"Wrote {args.count} {args.shape} records to {args.path}")
+        return 0
+
+    results = run_suite(
+        args.counts, args.shapes, args.modes, args.data_dir, args.repeat, args.seed
+    )
+    save_results(results, args.output)
+    print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; rerun with --save-baseline to create one")
+        return 0
+
+    rows, problems = compare(
+        results,
+        load_results(args.baseline),
+        tolerance=args.tolerance,
+        min_seconds=args.min_seconds,
+        memory_tolerance=args.memory_tolerance,
+    )
+    print(f"{'scenario':<28} {'stage':<12} {'baseline':>10} {'current':>10} {'change':>8}")
+    for row in rows:
+        print(row)
+    if problems:
+        print(f"\n{len(problems)} regression(s):")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,263 @@
+"""
+Seeded generator of synthetic telemetry for the benchmark suite.
+
+The output mimics a fleet downlink: several devices interleave their
+records, each with its own timestamp format and field naming, error codes
+follow a long-tailed distribution, severities come in the spellings real
+sources use, and a small share of records is malformed. The same seed,
+count and shape always produce a byte-identical file.
+
+Records are written one at a time, so files of 10^8 records can be generated
+without holding them in memory.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import random
+from datetime import datetime, timezone
+from itertools import accumulate
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, TextIO, Tuple
+
+SHAPES = ("array", "wrapped", "jsonl")
+SHAPE_SUFFIXES = {"array": ".json", "wrapped": ".json", "jsonl": ".jsonl"}
+
+DEFAULT_SEED = 20251110
+
+# 2025-11-10T00:00:00Z
+_START_EPOCH = 1762732800
+
+SUBSYSTEMS = [
+    ("Navigation", 30),
+    ("Power", 25),
+    ("Thermal", 20),
+    ("Communications", 15),
+    ("Payload", 7),
+    ("Propulsion", 3),
+]
+
+# Normalized severity -> spellings seen in the wild, with weights
+SEVERITIES = [
+    ("LOW", 45, ["LOW", "low", "INFO", "info", "Low"]),
+    ("MEDIUM", 30, ["MEDIUM", "WARN", "warning", "Warning", "medium"]),
+    ("HIGH", 18, ["HIGH", "high", "ERR", "err", "High"]),
+    ("CRITICAL", 4, ["CRITICAL", "FATAL", "fatal", "Critical"]),
+    ("UNKNOWN", 3, ["", "SEV9", "n/a"]),
+]
+
+DESCRIPTIONS = [
+    "Star tracker lost lock on reference stars.",
+    "Bus voltage dipped below safe threshold.",
+    "Localized temperature drift above expected range.",
+    "Intermittent signal loss detected on downlink channel.",
+    "Reaction wheel speed exceeded nominal envelope.",
+    "Checksum mismatch in telemetry frame.",
+    "Heater cycled more often than scheduled.",
+    "Payload instrument entered safe mode.",
+]
+
+# Field names per device style: canonical keys or the accepted aliases
+_CANONICAL = ("timestamp", "subsystem", "error_code", "severity", "description", "telemetry_id")
+_ALIASED = ("time", "module", "code", "level", "message", "id")
+_TERSE = ("ts", "module", "code", "level", "message", "id")
+
+def _per_second(fmt: Callable[[int], str]) -> Callable[[int], str]:
+    """
+    Memoize ``fmt`` over whole seconds; consecutive records mostly share one.
+    """
+    cache: Dict[int, str] = {}
+
+    def render(second: int) -> str:
+        text = cache.get(second)
+        if text is None:
+            if len(cache) >= 4096:
+                cache.clear()
+            text = cache[second] = fmt(second)
+        return text
+
+    return render
+
+def _utc(second: int) -> datetime:
+    return datetime.fromtimestamp(second, tz=timezone.utc)
+
+_iso_seconds = _per_second(lambda s: _utc(s).strftime("%Y-%m-%dT%H:%M:%S"))
+# Same instant rendered in UTC+02:00
+_iso_offset = _per_second(lambda s: _utc(s + 7200).strftime('"%Y-%m-%dT%H:%M:%S+02:00"'))
+_naive = _per_second(lambda s: _utc(s).strftime('"%Y-%m-%d %H:%M:%S"'))
+
+def _iso_z(ts: float) -> str:
+    return f'"{_iso_seconds(int(ts))}Z"'
+
+def _iso_micros(ts: float) -> str:
+    second = int(ts)
+    return f'"{_iso_seconds(second)}.{int((ts - second) * 1e6):06d}Z"'
+
+def _iso_plus_two(ts: float) -> str:
+    return _iso_offset(int(ts))
+
+def _naive_utc(ts: float) -> str:
+    return _naive(int(ts))
+
+def _epoch_seconds(ts: float) -> str:
+    return str(int(ts))
+
+def _epoch_millis(ts: float) -> str:
+    return str(int(ts * 1000))
+
+def _epoch_float(ts: float) -> str:
+    return f"{ts:.3f}"
+
+def _epoch_text(ts: float) -> str:
+    return f'"{int(ts)}"'
+
+# (timestamp renderer producing a JSON value, field names) per device
+DEVICES: List[Tuple[Callable[[float], str], Sequence[str]]] = [
+    (_iso_z, _CANONICAL),
+    (_iso_z, _CANONICAL),
+    (_iso_micros, _CANONICAL),
+    (_iso_plus_two, _ALIASED),
+    (_naive_utc, _CANONICAL),
+    (_epoch_seconds, _TERSE),
+    (_epoch_millis, _ALIASED),
+    (_epoch_float, _TERSE),
+    (_epoch_text, _ALIASED),
+]
+
+_RESOLVED_VALUES = ["true", "false", "false", '"yes"', '"no"', '"1"', None]
+
+class _Weighted:
+    """
+    Weighted choice over a fixed population with a shared RNG.
+    """
+
+    def __init__(self, rng: random.Random, items: Sequence, weights: Sequence[float]) -> None:
+        self.rng = rng
+        self.items = list(items)
+        self.cumulative = list(accumulate(weights))
+        self.total = self.cumulative[-1]
+
+    def __call__(self):
+        index = bisect.bisect(self.cumulative, self.rng.random() * self.total)
+        return self.items[min(index, len(self.items) - 1)]
+
+class TelemetryGenerator:
+    """
+    Deterministic stream of synthetic telemetry records as JSON text.
+
+    ``codes`` distinct error codes per subsystem follow a Zipf-like
+    distribution; ``failure_rate`` of the records lack a usable timestamp.
+    Records advance about ``interval`` seconds each with per-device jitter, so
+    the stream is mostly but not strictly time ordered.
+    """
+
+    def __init__(
+        self,
+        seed: int = DEFAULT_SEED,
+        codes: int = 400,
+        failure_rate: float = 0.001,
+        interval: float = 0.25,
+    ) -> None:
+        self.rng = random.Random(seed)
+        self.failure_rate = failure_rate
+        self.interval = interval
+
+        rng = self.rng
+        self._subsystem = _Weighted(rng, [name for name, _ in SUBSYSTEMS], [w for _, w in SUBSYSTEMS])
+        self._code_rank = _Weighted(rng, range(codes), [1 / (rank + 1) ** 1.1 for rank in range(codes)])
+        self._severity = _Weighted(
+            rng,
+            [json.dumps(spelling) for _, _, spellings in SEVERITIES for spelling in spellings],
+            [
+                weight / len(spellings)
+                for _, weight, spellings in SEVERITIES
+                for _ in spellings
+            ],
+        )
+        self._descriptions = [json.dumps(text) for text in DESCRIPTIONS]
+        self._subsystem_codes = {
+            name: [json.dumps(f"{name[:3].upper()}-{rank:04d}") for rank in range(codes)]
+            for name, _ in SUBSYSTEMS
+        }
+
+    def record(self, index: int) -> str:
+        """
+        Render record ``index`` as a single-line JSON object.
+        """
+        rng = self.rng
+        device = rng.randrange(len(DEVICES))
+        render_ts, names = DEVICES[device]
+        ts = _START_EPOCH + index * self.interval + rng.uniform(-30.0, 5.0) + device * 0.001
+
+        subsystem = self._subsystem()
+        fields = []
+        roll = rng.random()
+        if roll < self.failure_rate / 2:
+            pass  # Missing timestamp
+        elif roll < self.failure_rate:
+            fields.append(f'"{names[0]}":"not-a-time"')
+        else:
+            fields.append(f'"{names[0]}":{render_ts(ts)}')
+        fields.append(f'"{names[1]}":"{subsystem}"')
+        fields.append(f'"{names[2]}":{self._subsystem_codes[subsystem][self._code_rank()]}')
+        fields.append(f'"{names[3]}":{self._severity()}')
+        fields.append(f'"{names[4]}":{self._descriptions[rng.randrange(len(self._descriptions))]}')
+        fields.append(f'"{names[5]}":"TLM-{device:02d}-{index:010d}"')
+        resolved = _RESOLVED_VALUES[rng.randrange(len(_RESOLVED_VALUES))]
+        if resolved is not None:
+            fields.append(f'"resolved":{resolved}')
+        return "{" + ",".join(fields) + "}"
+
+def _write_records(f: TextIO, generator: TelemetryGenerator, count: int, separator: str) -> None:
+    record = generator.record
+    for index in range(count):
+        if index:
+            f.write(separator)
+        f.write(record(index))
+
+def write_telemetry(
+    path: Path,
+    count: int,
+    shape: str = "jsonl",
+    seed: int = DEFAULT_SEED,
+    **options: float,
+) -> Path:
+    """
+    Write ``count`` synthetic records to ``path`` as a JSON array ("array"),
+    an array wrapped in an object with metadata ("wrapped") or JSON lines
+    ("jsonl"). Extra ``options`` go to ``TelemetryGenerator``.
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown shape: {shape}")
+    generator = TelemetryGenerator(seed, **options)  # type: ignore[arg-type]
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8", newline="\n") as f:
+        if shape == "jsonl":
+            _write_records(f, generator, count, "\n")
+            if count:
+                f.write("\n")
+        else:
+            if shape == "wrapped":
+                metadata = {"source": "benchmark-suite", "seed": seed, "count": count}
+                f.write('{"metadata":' + json.dumps(metadata) + ',"records":')
+            f.write("[\n")
+            _write_records(f, generator, count, ",\n")
+            f.write("\n]")
+            if shape == "wrapped":
+                f.write("}")
+    tmp_path.replace(path)
+    return path
+
+def dataset_path(data_dir: Path, count: int, shape: str, seed: int = DEFAULT_SEED) -> Path:
+    return data_dir / f"telemetry_{shape}_{count}_{seed}{SHAPE_SUFFIXES[shape]}"
+
+def ensure_dataset(data_dir: Path, count: int, shape: str, seed: int = DEFAULT_SEED) -> Path:
+    """
+    Return the dataset for ``(count, shape, seed)``, generating it only if it
+    is not in ``data_dir`` yet.
+    """
+    path = dataset_path(data_dir, count, shape, seed)
+    if not path.exists():
+        data_dir.mkdir(parents=True, exist_ok=True)
+        write_telemetry(path, count, shape, seed)
+    return path
@@ -0,0 +1,200 @@
+"""
+Run the pipeline over generated datasets and compare against a baseline.
+
+Every run happens in a fresh interpreter, so the peak RSS recorded by
+``PipelineMetrics`` belongs to that run alone. The stage timings of repeated
+runs are reduced to their median.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .generator import DEFAULT_SEED, ensure_dataset
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = PROJECT_ROOT / "src"
+CONFIG_PATH = SRC_DIR / "config" / "settings.example.json"
+
+# Pipeline options per mode
+MODES: Dict[str, Dict[str, Any]] = {
+    "batch": {},
+    "stream": {"streaming": True},
+    "columnar": {"columnar": True},
+    "parallel": {"workers": 4},
+}
+
+_CHILD = """
+import json, logging, sys
+from pathlib import Path
+sys.path.insert(0, {src!r})
+import main
+logging.disable(logging.CRITICAL)
+config = json.loads(Path({config!r}).read_text())
+main.run_pipeline(config, Path({data!r}), output_dir=Path({out!r}), **{options!r})
+"""
+
+def scenario_key(shape: str, count: int, mode: str) -> str:
+    return f"{shape}/{count}/{mode}"
+
+def _run_once(data: Path, out: Path, options: Dict[str, Any]) -> Dict[str, Any]:
+    code = _CHILD.format(
+        src=str(SRC_DIR),
+        config=str(CONFIG_PATH),
+        data=str(data),
+        out=str(out),
+        options=options,
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+    with (out / "pipeline_metrics.json").open("r", encoding="utf-8") as f:
+        metrics = json.load(f)
+    metrics["report_sha256"] = hashlib.sha256(
+        (out / "error_report.txt").read_bytes()
+    ).hexdigest()
+    return metrics
+
+def _median(values: Iterable[Optional[float]]) -> Optional[float]:
+    present = [value for value in values if value is not None]
+    return statistics.median(present) if present else None
+
+def _reduce(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine repeated runs of one scenario: medians of timings and memory, the
+    correctness fields of the first run.
+    """
+    first = runs[0]
+    stages: Dict[str, Dict[str, Any]] = {}
+    for stage in first["stages"]:
+        name = stage["name"]
+        samples = [s for run in runs for s in run["stages"] if s["name"] == name]
+        stages[name] = {
+            "wall_seconds": _median(s["wall_seconds"] for s in samples),
+            "cpu_seconds": _median(s["cpu_seconds"] for s in samples),
+            "records": stage["records"],
+        }
+    return {
+        "records": first["records"],
+        "events": first["events"],
+        "parse_failures": first["parse_failures"],
+        "report_sha256": first["report_sha256"],
+        "wall_seconds": _median(run["wall_seconds"] for run in runs),
+        "cpu_seconds": _median(run["cpu_seconds"] for run in runs),
+        "peak_rss_bytes": _median(run["peak_rss_bytes"] for run in runs),
+        "records_per_second": _median(run["records_per_second"] for run in runs),
+        "stages": stages,
+    }
+
+def run_suite(
+    counts: Sequence[int],
+    shapes: Sequence[str],
+    modes: Sequence[str],
+    data_dir: Path,
+    repeat: int = 3,
+    seed: int = DEFAULT_SEED,
+    progress=print,
+) -> Dict[str, Any]:
+    """
+    Run every (shape, count, mode) scenario ``repeat`` times and return the
+    results document.
+    """
+    scenarios: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for shape in shapes:
+            for count in counts:
+                progress(f"preparing {shape} dataset with {count} records")
+                data = ensure_dataset(data_dir, count, shape, seed)
+                for mode in modes:
+                    key = scenario_key(shape, count, mode)
+                    runs = []
+                    for attempt in range(repeat):
+                        runs.append(_run_once(data, Path(tmp) / key / str(attempt), MODES[mode]))
+                    scenarios[key] = _reduce(runs)
+                    progress(
+                        f"{key}: {scenarios[key]['wall_seconds']:.3f}s, "
+                        f"{(scenarios[key]['peak_rss_bytes'] or 0) / 2**20:.1f} MiB peak"
+                    )
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": seed,
+        "repeat": repeat,
+        "scenarios": scenarios,
+    }
+
+def _slower(current: Optional[float], base: Optional[float], tolerance: float, floor: float) -> bool:
+    if current is None or base is None:
+        return False
+    return current > base * (1 + tolerance) and current - base > floor
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = 0.2,
+    min_seconds: float = 0.05,
+    memory_tolerance: float = 0.2,
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare ``results`` with ``baseline`` scenario by scenario.
+
+    Returns ``(rows, problems)``: a printable line per compared scenario and
+    stage, and a description of every regression. A timing regresses when it
+    is more than ``tolerance`` slower and at least ``min_seconds`` slower in
+    absolute terms; peak memory when it grew by more than
+    ``memory_tolerance``. Any change in the events, parse failures or report
+    content is a regression as well.
+    """
+    rows: List[str] = []
+    problems: List[str] = []
+    for key, current in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(key)
+        if base is None:
+            rows.append(f"{key:<28} (not in baseline)")
+            continue
+
+        for field in ("records", "events", "parse_failures", "report_sha256"):
+            if current[field] != base[field]:
+                problems.append(f"{key}: {field} changed from {base[field]} to {current[field]}")
+
+        pairs = [("total", current["wall_seconds"], base["wall_seconds"])]
+        for name, stage in current["stages"].items():
+            base_stage = base["stages"].get(name)
+            if base_stage is not None:
+                pairs.append((name, stage["wall_seconds"], base_stage["wall_seconds"]))
+        for name, now, then in pairs:
+            change = (now / then - 1) * 100 if then else 0.0
+            flag = ""
+            if _slower(now, then, tolerance, min_seconds):
+                flag = "  REGRESSION"
+                problems.append(f"{key} {name}: {then:.3f}s -> {now:.3f}s ({change:+.0f}%)")
+            rows.append(f"{key:<28} {name:<12} {then:>9.3f}s {now:>9.3f}s {change:>+7.1f}%{flag}")
+
+        now_rss, then_rss = current["peak_rss_bytes"], base["peak_rss_bytes"]
+        if now_rss and then_rss:
+            change = (now_rss / then_rss - 1) * 100
+            flag = ""
+            if now_rss > then_rss * (1 + memory_tolerance):
+                flag = "  REGRESSION"
+                problems.append(f"{key} peak RSS: {then_rss / 2**20:.1f} -> {now_rss / 2**20:.1f} MiB")
+            rows.append(
+                f"{key:<28} {'peak MiB':<12} {then_rss / 2**20:>9.1f}  {now_rss / 2**20:>9.1f}  "
+                f"{change:>+7.1f}%{flag}"
+            )
+    return rows, problems
+
+def load_results(path: Path) -> Dict[str, Any]:
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
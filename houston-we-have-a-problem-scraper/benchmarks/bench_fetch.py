@@ -0,0 +1,90 @@
+"""
+Compare the throughput of the serial fetch loop against ConcurrentFetcher
+on a local HTTP server that adds a fixed latency to every response.
+
+Usage:
+    python benchmarks/bench_fetch.py [--count 500] [--latency-ms 20] [--concurrency 32]
+"""
+import argparse
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from analyzers.concurrent_fetcher import ConcurrentFetcher  # noqa: E402
+from analyzers.pattern_detector import PatternDetector  # noqa: E402
+
+PAGE = (
+    "<html><head><title>Telemetry {path}</title></head>"
+    "<body><p>Subsystem nominal.</p><p>Checksum error on frame 12.</p></body></html>"
+)
+
+def make_handler(latency):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            payload = PAGE.format(path=self.path).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+def run_serial(urls, settings):
+    detector = PatternDetector(settings)
+    started = time.perf_counter()
+    for url in urls:
+        detector.fetch_data(url)
+    return time.perf_counter() - started
+
+def run_concurrent(urls, settings):
+    started = time.perf_counter()
+    with ConcurrentFetcher(settings) as fetcher:
+        failures = sum(1 for result in fetcher.fetch_all(urls) if not result.ok)
+    if failures:
+        print(f"  warning: {failures} concurrent fetches failed")
+    return time.perf_counter() - started
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.latency_ms / 1000))
+    server.daemon_threads = True
+    server.request_queue_size = max(args.concurrency * 2, 64)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base}/page/{i}" for i in range(args.count)]
+    settings = {"timeout": 10, "fetch": {"concurrency": args.concurrency}}
+
+    try:
+        serial = run_serial(urls, settings)
+        concurrent = run_concurrent(urls, settings)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"URLs: {args.count}, server latency: {args.latency_ms:g} ms")
+    print(f"serial loop:        {serial:8.2f} s  {args.count / serial:8.1f} pages/s")
+    print(f"ConcurrentFetcher:  {concurrent:8.2f} s  {args.count / concurrent:8.1f} pages/s")
+    print(f"speedup:            {serial / concurrent:8.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
\ No newline at end of file
@@ -0,0 +1,152 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class FetchResult:
+    __slots__ = ("url", "data", "error", "attempts", "elapsed")
+
+    def __init__(self, url, data=None, error=None, attempts=1, elapsed=0.0):
+        self.url = url
+        self.data = data
+        self.error = error
+        self.attempts = attempts
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+class HostRateLimiter:
+    """
+    Spaces requests to the same host at least 1 / rate seconds apart.
+    """
+
+    def __init__(self, rate_per_host):
+        self.interval = 1.0 / rate_per_host if rate_per_host else 0.0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host):
+        if not self.interval:
+            return
+        # Reserve the next free slot under the lock, sleep outside of it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+class ConcurrentFetcher:
+    """
+    Fetches pages on a thread pool over one pooled requests.Session.
+
+    Connections are kept alive and reused per host; transient failures
+    (connection errors, timeouts, 429 and 5xx responses) are retried with
+    exponential backoff, honouring Retry-After when the server sends one.
+    """
+
+    def __init__(self, settings, detector=None):
+        fetch_settings = settings.get("fetch", {})
+        self.timeout = settings.get("timeout", 10)
+        self.concurrency = max(1, int(fetch_settings.get("concurrency", 16)))
+        self.max_retries = int(fetch_settings.get("max_retries", 3))
+        self.backoff = float(fetch_settings.get("retry_backoff", 0.5))
+        self.max_backoff = float(fetch_settings.get("max_backoff", 30))
+        self.rate_limiter = HostRateLimiter(fetch_settings.get("per_host_rate_limit", 0))
+
+        if detector is None:
+            from .pattern_detector import PatternDetector
+            detector = PatternDetector(settings)
+        self.detector = detector
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=int(fetch_settings.get("max_hosts", 64)),
+            pool_maxsize=self.concurrency,
+            max_retries=0,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        user_agent = fetch_settings.get("user_agent")
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def _retry_delay(self, attempt, response=None):
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+        return min(self.backoff * (2 ** attempt), self.max_backoff)
+
+    def fetch(self, url):
+        host = urlsplit(url).netloc
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            self.rate_limiter.wait(host)
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    return FetchResult(url, error=e, attempts=attempt + 1,
+                                       elapsed=time.monotonic() - started)
+                time.sleep(self._retry_delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                delay = self._retry_delay(attempt, response)
+                response.close()
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            try:
+                response.raise_for_status()
+                data = self.detector.parse_html(url, response.text)
+            except Exception as e:
+                return FetchResult(url, error=e, attempts=attempt + 1,
+                                   elapsed=time.monotonic() - started)
+            return FetchResult(url, data=data, attempts=attempt + 1,
+                               elapsed=time.monotonic() - started)
+
+    def fetch_all(self, urls):
+        """
+        Yield a FetchResult per URL as soon as it completes (not in input
+        order). At most 2 x concurrency requests are queued at a time, so
+        long URL lists are consumed lazily.
+        """
+        urls = iter(urls)
+        max_pending = self.concurrency * 2
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            pending = set()
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    url = next(urls, None)
+                    if url is None:
+                        exhausted = True
+                        break
+                    pending.add(pool.submit(self.fetch, url))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
\ No newline at end of file
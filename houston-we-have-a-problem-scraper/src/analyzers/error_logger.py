@@ -1,6 +1,7 @@
 import json
 import os
 import time
+from .log_writer import BatchedLogWriter
 
 class ErrorLogger:
     def __init__(self, settings):
@@ -8,18 +9,32 @@ class ErrorLogger:
         self.log_dir = settings.get("log_dir", "logs")
         os.makedirs(self.log_dir, exist_ok=True)
 
+        buffer_settings = settings.get("log_buffer", {})
+        writer_options = {
+            "flush_bytes": buffer_settings.get("flush_bytes", 64 * 1024),
+            "flush_records": buffer_settings.get("flush_records", 1000),
+            "flush_interval": buffer_settings.get("flush_interval", 1.0),
+            "max_bytes": buffer_settings.get("max_bytes", 0),
+            "backup_count": buffer_settings.get("backup_count", 5),
+        }
+        self.issue_writer = BatchedLogWriter(os.path.join(self.log_dir, "issues.log"), **writer_options)
+        self.error_writer = BatchedLogWriter(os.path.join(self.log_dir, "errors.log"), **writer_options)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def log_issue(self, url, issue):
-        log_path = os.path.join(self.log_dir, "issues.log")
         issue_record = {
             "sourceUrl": url,
             **issue
         }
-        with open(log_path, "a") as f:
-            f.write(json.dumps(issue_record) + "\n")
+        self.issue_writer.write_line(json.dumps(issue_record))
         return issue_record
 
     def log_error(self, url, message, severity="high"):
-        log_path = os.path.join(self.log_dir, "errors.log")
         error_entry = {
             "sourceUrl": url,
             "errorType": "exception",
@@ -27,6 +42,13 @@ class ErrorLogger:
             "timestamp": int(time.time()),
             "severity": severity
         }
-        with open(log_path, "a") as f:
-            f.write(json.dumps(error_entry) + "\n")
-        return error_entry
\ No newline at end of file
+        self.error_writer.write_line(json.dumps(error_entry))
+        return error_entry
+
+    def flush(self):
+        self.issue_writer.flush()
+        self.error_writer.flush()
+
+    def close(self):
+        self.issue_writer.close()
+        self.error_writer.close()
\ No newline at end of file
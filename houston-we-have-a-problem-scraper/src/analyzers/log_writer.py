@@ -0,0 +1,125 @@
+import atexit
+import os
+import threading
+import weakref
+
+class BatchedLogWriter:
+    """
+    Append-only line writer that keeps its file open and writes in batches.
+
+    Lines are buffered in memory and written with a single call once the
+    buffer reaches ``flush_bytes`` or ``flush_records``; a background thread
+    also flushes every ``flush_interval`` seconds so a quiet log is never
+    more than that far behind. Pending lines are written at interpreter exit,
+    including exits caused by an unhandled exception.
+
+    With ``max_bytes`` set, the file is rotated like
+    logging.handlers.RotatingFileHandler: ``path`` becomes ``path.1``, older
+    backups shift up and anything beyond ``backup_count`` is removed.
+
+    All methods are safe to call from several threads.
+    """
+
+    def __init__(self, path, flush_bytes=64 * 1024, flush_records=1000,
+                 flush_interval=1.0, max_bytes=0, backup_count=5):
+        self.path = path
+        self.flush_bytes = flush_bytes
+        self.flush_records = flush_records
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._file = open(path, "ab")
+        self._size = self._file.seek(0, os.SEEK_END)
+        self._closed = False
+
+        self._stop = threading.Event()
+        self._flusher = None
+        if flush_interval and flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                args=(weakref.ref(self), self._stop, flush_interval),
+                name=f"log-flusher:{os.path.basename(path)}",
+                daemon=True,
+            )
+            self._flusher.start()
+        # A weak reference keeps atexit from pinning writers nobody closed
+        self._atexit = _close_at_exit(weakref.ref(self))
+        atexit.register(self._atexit)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _flush_periodically(writer_ref, stop, interval):
+        while not stop.wait(interval):
+            writer = writer_ref()
+            if writer is None:
+                return
+            writer.flush()
+            del writer
+
+    def write_line(self, line):
+        data = (line + "\n").encode("utf-8")
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"write to closed log {self.path}")
+            self._buffer.append(data)
+            self._buffered_bytes += len(data)
+            if (self._buffered_bytes >= self.flush_bytes
+                    or len(self._buffer) >= self.flush_records):
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            if not self._closed:
+                self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+            self._file.close()
+        self._stop.set()
+        atexit.unregister(self._atexit)
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        data = b"".join(self._buffer)
+        self._buffer.clear()
+        self._buffered_bytes = 0
+
+        if self.max_bytes and self._size and self._size + len(data) > self.max_bytes:
+            self._rotate_locked()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+    def _rotate_locked(self):
+        self._file.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "ab")
+        self._size = 0
+
+def _close_at_exit(writer_ref):
+    def close():
+        writer = writer_ref()
+        if writer is not None:
+            writer.close()
+    return close
\ No newline at end of file
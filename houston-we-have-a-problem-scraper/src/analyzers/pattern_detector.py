@@ -1,15 +1,18 @@
-import requests
-from bs4 import BeautifulSoup
-
 class PatternDetector:
     def __init__(self, settings):
         self.settings = settings
         self.timeout = settings.get("timeout", 10)
 
     def fetch_data(self, url):
+        import requests
+
         response = requests.get(url, timeout=self.timeout)
         response.raise_for_status()
-        html = response.text
+        return self.parse_html(url, response.text)
+
+    def parse_html(self, url, html):
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(html, "html.parser")
         return {
             "url": url,
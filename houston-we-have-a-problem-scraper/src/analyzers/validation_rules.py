@@ -1,29 +1,142 @@
 import re
 import time
 
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Offsets listed per issue; the occurrence count is always exact
+MAX_REPORTED_OFFSETS = 20
+
+def _build_trie_pattern(terms):
+    """
+    Build a regex matching the longest of ``terms`` (lowercase literals)
+    that starts at the current position. Shared prefixes are factored out
+    so matching cost follows the text, not the number of terms.
+    """
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def render(node):
+        terminal = "" in node
+        branches = [re.escape(char) + render(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            # Greedy optional suffix: longer terms win over their prefixes
+            return "(?:" + body + ")?"
+        return body
+
+    return render(trie)
+
+class ForbiddenWordMatcher:
+    """
+    Finds every forbidden word in a single pass over the content.
+
+    Plain ASCII words are compiled into one trie-shaped regex inside a
+    lookahead, so one scan reports a match at every position, including
+    words that are prefixes of longer ones. Words containing regex syntax
+    keep their own compiled pattern, as they were always treated as regular
+    expressions, and so do non-ASCII words: their case folding does not
+    survive lower() (it may change their length, or fold two words together).
+    """
+
+    def __init__(self, words):
+        self.words = [word for word in words if word]
+        self._by_literal = {}
+        self._patterns = []
+        for word in self.words:
+            if word.isascii() and REGEX_METACHARACTERS.isdisjoint(word):
+                self._by_literal.setdefault(word.lower(), []).append(word)
+            else:
+                self._patterns.append((word, re.compile(word, re.IGNORECASE)))
+
+        self._combined = None
+        self._prefixes = {}
+        if self._by_literal:
+            literals = list(self._by_literal)
+            self._combined = re.compile(
+                "(?=(" + _build_trie_pattern(literals) + "))", re.IGNORECASE
+            )
+            # Every literal that is a prefix of the longest match also matches
+            for literal in literals:
+                self._prefixes[literal] = [
+                    other for other in literals if literal.startswith(other)
+                ]
+
+    def _literals_matching(self, text):
+        prefixes = self._prefixes.get(text.lower())
+        if prefixes is not None:
+            return prefixes
+        # Case folding that lower() does not reproduce; fall back to the regex
+        return [
+            literal for literal in self._by_literal
+            if re.match(re.escape(literal), text, re.IGNORECASE)
+        ]
+
+    def find(self, content):
+        """
+        Return {word: [(start, end), ...]} for the words present in
+        ``content``. Matches of one word never overlap, as with re.finditer.
+        """
+        found = {}
+        if self._combined is not None:
+            literal_hits = {}
+            last_end = {}
+            for match in self._combined.finditer(content):
+                start = match.start()
+                for literal in self._literals_matching(match.group(1)):
+                    if start < last_end.get(literal, 0):
+                        continue
+                    end = start + len(literal)
+                    last_end[literal] = end
+                    literal_hits.setdefault(literal, []).append((start, end))
+            for literal, spans in literal_hits.items():
+                for word in self._by_literal[literal]:
+                    found[word] = spans
+
+        for word, pattern in self._patterns:
+            spans = [match.span() for match in pattern.finditer(content)]
+            if spans:
+                found[word] = spans
+        return found
+
 class ValidationRules:
     def __init__(self, settings):
         self.settings = settings
         self.rules = settings.get("rules", {"missing_title": True, "forbidden_words": ["error", "404", "not found"]})
+        self.matcher = ForbiddenWordMatcher(self.rules.get("forbidden_words", []))
 
     def check(self, data):
         issues = []
+        now = int(time.time())
         if self.rules.get("missing_title") and not data.get("title"):
             issues.append({
                 "errorType": "missing_data",
                 "errorMessage": "Missing page title",
-                "timestamp": int(time.time()),
+                "timestamp": now,
                 "severity": "medium",
                 "context": {"url": data.get("url")}
             })
 
-        for word in self.rules.get("forbidden_words", []):
-            if re.search(word, data.get("content", ""), re.IGNORECASE):
-                issues.append({
-                    "errorType": "content_mismatch",
-                    "errorMessage": f"Found forbidden word: {word}",
-                    "timestamp": int(time.time()),
-                    "severity": "low",
-                    "context": {"url": data.get("url")}
-                })
+        found = self.matcher.find(data.get("content") or "")
+        for word in self.matcher.words:
+            spans = found.get(word)
+            if not spans:
+                continue
+            issues.append({
+                "errorType": "content_mismatch",
+                "errorMessage": f"Found forbidden word: {word}",
+                "timestamp": now,
+                "severity": "low",
+                "context": {
+                    "url": data.get("url"),
+                    "occurrences": len(spans),
+                    "offsets": [list(span) for span in spans[:MAX_REPORTED_OFFSETS]]
+                }
+            })
         return issues
\ No newline at end of file
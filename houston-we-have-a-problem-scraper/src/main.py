@@ -1,6 +1,5 @@
 import json
 import os
-from analyzers.pattern_detector import PatternDetector
 from analyzers.validation_rules import ValidationRules
 from analyzers.error_logger import ErrorLogger
 from outputs.issue_exporter import IssueExporter
@@ -16,24 +15,34 @@ def main():
 
     urls = load_urls(settings.get("url_list", "data/urls.txt"))
 
-    detector = PatternDetector(settings)
     rules = ValidationRules(settings)
     logger = ErrorLogger(settings)
     exporter = IssueExporter(settings)
 
     all_issues = []
 
-    for url in urls:
-        try:
-            print(f"Scanning {url}...")
-            page_data = detector.fetch_data(url)
-            issues = rules.check(page_data)
-            for issue in issues:
-                issue_record = logger.log_issue(url, issue)
-                all_issues.append(issue_record)
-        except Exception as e:
-            logger.log_error(url, str(e), severity="high")
-
+    if urls:
+        # requests and bs4 are only loaded when there is something to fetch
+        from analyzers.concurrent_fetcher import ConcurrentFetcher
+
+        # Pages are checked as soon as they arrive, in completion order
+        with ConcurrentFetcher(settings) as fetcher:
+            print(f"Scanning {len(urls)} URLs with up to {fetcher.concurrency} concurrent requests...")
+            for result in fetcher.fetch_all(urls):
+                if not result.ok:
+                    logger.log_error(result.url, str(result.error), severity="high")
+                    continue
+                try:
+                    issues = rules.check(result.data)
+                    for issue in issues:
+                        issue_record = logger.log_issue(result.url, issue)
+                        all_issues.append(issue_record)
+                except Exception as e:
+                    logger.log_error(result.url, str(e), severity="high")
+    else:
+        print("No URLs to scan.")
+
+    logger.close()
     exporter.export(all_issues)
     print(f"Scan complete. Exported {len(all_issues)} issues.")
 
@@ -0,0 +1,112 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.analyzers.concurrent_fetcher import ConcurrentFetcher
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            hits = server.hits[self.path]
+            server.connections.add(self.client_address)
+
+        if self.path == "/missing":
+            self._send(404, "<html><title>Missing</title></html>")
+        elif self.path == "/flaky" and hits < 3:
+            self._send(503, "busy")
+        elif self.path == "/always-down":
+            self._send(500, "down")
+        else:
+            self._send(200, f"<html><head><title>Page {self.path}</title></head><body>ok</body></html>")
+
+    def _send(self, status, body):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestConcurrentFetcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.server.hits = {}
+        cls.server.connections = set()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        with self.server.lock:
+            self.server.hits.clear()
+            self.server.connections.clear()
+
+    def _fetcher(self, **fetch_settings):
+        fetch_settings.setdefault("retry_backoff", 0.01)
+        return ConcurrentFetcher({"timeout": 5, "fetch": fetch_settings})
+
+    def test_fetch_all_returns_every_url(self):
+        urls = [f"{self.base}/page/{i}" for i in range(50)]
+        with self._fetcher(concurrency=8) as fetcher:
+            results = list(fetcher.fetch_all(urls))
+
+        self.assertEqual(sorted(r.url for r in results), sorted(urls))
+        self.assertTrue(all(r.ok for r in results))
+        by_url = {r.url: r.data for r in results}
+        self.assertEqual(by_url[urls[3]]["title"], "Page /page/3")
+        # Keep-alive: far fewer connections than requests
+        self.assertLessEqual(len(self.server.connections), 8)
+
+    def test_retries_transient_errors(self):
+        with self._fetcher(max_retries=3) as fetcher:
+            result = fetcher.fetch(f"{self.base}/flaky")
+        self.assertTrue(result.ok)
+        self.assertEqual(result.attempts, 3)
+
+    def test_gives_up_after_max_retries(self):
+        with self._fetcher(max_retries=2) as fetcher:
+            result = fetcher.fetch(f"{self.base}/always-down")
+        self.assertFalse(result.ok)
+        self.assertEqual(result.attempts, 3)
+        self.assertEqual(self.server.hits["/always-down"], 3)
+
+    def test_client_errors_are_not_retried(self):
+        with self._fetcher(max_retries=3) as fetcher:
+            result = fetcher.fetch(f"{self.base}/missing")
+        self.assertFalse(result.ok)
+        self.assertEqual(result.attempts, 1)
+
+    def test_connection_errors_are_reported(self):
+        with self._fetcher(max_retries=1) as fetcher:
+            result = fetcher.fetch("http://127.0.0.1:1/")
+        self.assertFalse(result.ok)
+        self.assertEqual(result.attempts, 2)
+
+    def test_per_host_rate_limit(self):
+        urls = [f"{self.base}/limited/{i}" for i in range(5)]
+        started = time.monotonic()
+        with self._fetcher(concurrency=5, per_host_rate_limit=20) as fetcher:
+            results = list(fetcher.fetch_all(urls))
+        elapsed = time.monotonic() - started
+        self.assertTrue(all(r.ok for r in results))
+        # Five requests at 20/s need at least four 50 ms gaps
+        self.assertGreaterEqual(elapsed, 0.19)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from src.analyzers.error_logger import ErrorLogger
+from src.analyzers.log_writer import BatchedLogWriter
+
+class TestBatchedLogWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "test.log")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read_lines(self, path=None):
+        with open(path or self.path) as f:
+            return f.read().splitlines()
+
+    def test_buffers_until_threshold(self):
+        writer = BatchedLogWriter(self.path, flush_records=3, flush_interval=0)
+        writer.write_line("a")
+        writer.write_line("b")
+        self.assertEqual(self.read_lines(), [])
+        writer.write_line("c")
+        self.assertEqual(self.read_lines(), ["a", "b", "c"])
+        writer.write_line("d")
+        writer.close()
+        self.assertEqual(self.read_lines(), ["a", "b", "c", "d"])
+
+    def test_time_based_flush(self):
+        with BatchedLogWriter(self.path, flush_interval=0.05) as writer:
+            writer.write_line("pending")
+            deadline = time.monotonic() + 2
+            while not self.read_lines() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(self.read_lines(), ["pending"])
+
+    def test_concurrent_writers(self):
+        writer = BatchedLogWriter(self.path, flush_records=7, flush_interval=0)
+
+        def work(n):
+            for i in range(500):
+                writer.write_line(json.dumps({"thread": n, "i": i}))
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.close()
+
+        records = [json.loads(line) for line in self.read_lines()]
+        self.assertEqual(len(records), 4000)
+        for n in range(8):
+            self.assertEqual([r["i"] for r in records if r["thread"] == n], list(range(500)))
+
+    def test_size_based_rotation(self):
+        writer = BatchedLogWriter(self.path, flush_records=1, flush_interval=0,
+                                  max_bytes=20, backup_count=2)
+        for i in range(10):
+            writer.write_line(f"line-{i:04d}")  # 10 bytes with the newline
+        writer.close()
+
+        self.assertEqual(self.read_lines(), ["line-0008", "line-0009"])
+        self.assertEqual(self.read_lines(self.path + ".1"), ["line-0006", "line-0007"])
+        self.assertEqual(self.read_lines(self.path + ".2"), ["line-0004", "line-0005"])
+        self.assertFalse(os.path.exists(self.path + ".3"))
+
+    def test_write_after_close_fails(self):
+        writer = BatchedLogWriter(self.path, flush_interval=0)
+        writer.close()
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write_line("late")
+
+class TestErrorLogger(unittest.TestCase):
+    def test_issues_and_errors_written_on_close(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with ErrorLogger({"log_dir": tmp}) as logger:
+                record = logger.log_issue("https://example.com", {"errorType": "missing_data"})
+                logger.log_error("https://example.com", "boom")
+            self.assertEqual(record["sourceUrl"], "https://example.com")
+
+            with open(os.path.join(tmp, "issues.log")) as f:
+                self.assertEqual(json.loads(f.read()), record)
+            with open(os.path.join(tmp, "errors.log")) as f:
+                self.assertEqual(json.loads(f.read())["errorMessage"], "boom")
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import re
 import unittest
 from src.analyzers.validation_rules import ValidationRules
 
@@ -15,5 +16,43 @@ class TestValidationRules(unittest.TestCase):
         issues = self.rules.check(data)
         self.assertTrue(any("forbidden" in i["errorMessage"] for i in issues))
 
+    def test_forbidden_word_offsets(self):
+        data = {"url": "https://example.com", "title": "Page", "content": "Error: error again"}
+        issues = self.rules.check(data)
+        context = issues[0]["context"]
+        self.assertEqual(context["occurrences"], 2)
+        self.assertEqual(context["offsets"], [[0, 5], [7, 12]])
+
+    def test_overlapping_and_regex_words(self):
+        rules = ValidationRules({"rules": {
+            "missing_title": False,
+            "forbidden_words": ["not found", "not", "found", "err(or)?s?", "timeout"]
+        }})
+        data = {"url": "https://example.com", "title": "Page", "content": "Page NOT FOUND, errors logged"}
+        issues = rules.check(data)
+        messages = [i["errorMessage"] for i in issues]
+        self.assertEqual(messages, [
+            "Found forbidden word: not found",
+            "Found forbidden word: not",
+            "Found forbidden word: found",
+            "Found forbidden word: err(or)?s?",
+        ])
+        self.assertEqual(issues[0]["context"]["offsets"], [[5, 14]])
+        self.assertEqual(issues[2]["context"]["offsets"], [[9, 14]])
+        self.assertEqual(issues[3]["context"]["offsets"], [[16, 22]])
+
+    def test_non_ascii_words_match_as_their_own_patterns(self):
+        words = ["İstanbul", "s", "ſ", "k", "\u212a", "straße", "error"]
+        rules = ValidationRules({"rules": {"missing_title": False, "forbidden_words": words}})
+        for content in ("İSTANBUL", "İstanbul", "ſ", "S", "\u212a", "K", "STRAßE", "ERROR"):
+            with self.subTest(content=content):
+                data = {"url": "https://example.com", "title": "Page", "content": content}
+                messages = [i["errorMessage"] for i in rules.check(data)]
+                expected = [
+                    f"Found forbidden word: {word}"
+                    for word in words if re.search(word, content, re.IGNORECASE)
+                ]
+                self.assertEqual(messages, expected)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
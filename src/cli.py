@@ -0,0 +1,1534 @@
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from itertools import islice
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import worker_client  # type: ignore
+
+CURRENT_FILE = Path(__file__).resolve()
+SRC_DIR = CURRENT_FILE.parent
+PROJECT_ROOT = SRC_DIR.parent
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from extractors.alert_window import AlertEngine  # type: ignore
+    from extractors.error_parser import ErrorEvent  # type: ignore
+    from extractors.event_cache import ParsedEventCache  # type: ignore
+    from extractors.event_dedup import EventDeduplicator  # type: ignore
+    from extractors.telemetry_sources import MergedTelemetry  # type: ignore
+    from outputs.pipeline_metrics import PipelineMetrics  # type: ignore
+    from outputs.report_snapshot import ReportSnapshot  # type: ignore
+
+_SUBSYSTEMS: List[_Subsystem] = []
+
+# Command-line choices and defaults owned by pipeline modules, copied here so
+# parsing arguments (and --help) imports none of them. Each copy is checked
+# against the module when it is first loaded.
+REPORT_FORMATS = ("csv", "json", "text")
+EXPORT_FORMATS = ("binary", "json", "jsonl")
+PROFILE_STAGES = (
+    "cache_load",
+    "read",
+    "parse",
+    "stream",
+    "aggregate",
+    "cache_store",
+    "dedup",
+    "snapshot",
+    "report",
+    "export",
+    "index",
+    "alerts",
+)
+SNAPSHOT_FILENAME = "report_snapshot.json"
+# Seconds the first import of each pipeline module took during the current
+# command, in import order
+_IMPORT_TIMES: Dict[str, float] = {}
+
+class _Subsystem:
+    """
+    A pipeline module that is imported on first attribute access, so each
+    command only pays for what it uses: a query never loads the parser and
+    a batch run neither asyncio nor the worker-process machinery.
+
+    ``copies`` maps attributes of the module to the copies cli keeps of them
+    (a dict attribute is compared by its sorted keys); loading the module
+    fails if one is out of date.
+    """
+
+    def __init__(self, name: str, **copies: Any) -> None:
+        self._name = name
+        self._copies = copies
+        self._module: ModuleType | None = None
+        _SUBSYSTEMS.append(self)
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            imported = self._name in sys.modules
+            started = time.perf_counter()
+            module = importlib.import_module(self._name)
+            if not imported:
+                _IMPORT_TIMES[self._name] = time.perf_counter() - started
+            for attr, copy in self._copies.items():
+                value = getattr(module, attr)
+                if isinstance(value, dict):
+                    value = tuple(sorted(value))
+                if value != copy:
+                    raise RuntimeError(
+                        f"cli's copy of {self._name}.{attr} is out of date: "
+                        f"{copy!r} != {value!r}"
+                    )
+            self._module = module
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+alert_window = _Subsystem("extractors.alert_window")
+config_fanout = _Subsystem("extractors.config_fanout")
+error_parser = _Subsystem("extractors.error_parser")
+event_cache = _Subsystem("extractors.event_cache")
+event_dedup = _Subsystem("extractors.event_dedup")
+event_index = _Subsystem("extractors.event_index")
+event_table = _Subsystem("extractors.event_table")
+ingest_server = _Subsystem("extractors.ingest_server")
+tail_follower = _Subsystem("extractors.tail_follower")
+telemetry_reader = _Subsystem("extractors.telemetry_reader")
+telemetry_sources = _Subsystem("extractors.telemetry_sources")
+utils_time = _Subsystem("extractors.utils_time")
+event_exporter = _Subsystem("outputs.event_exporter", EXPORT_FORMATS=EXPORT_FORMATS)
+pipeline_metrics = _Subsystem("outputs.pipeline_metrics", STAGES=PROFILE_STAGES)
+report_generator = _Subsystem("outputs.report_generator", REPORT_FORMATS=REPORT_FORMATS)
+report_snapshot = _Subsystem("outputs.report_snapshot", SNAPSHOT_FILENAME=SNAPSHOT_FILENAME)
+
+CONFIG_PATH = SRC_DIR / "config" / "settings.example.json"
+DEFAULT_DATA_PATH = PROJECT_ROOT / "data" / "sample_logs.json"
+# Where --index puts the index of a binary export to data/
+DEFAULT_INDEX_DIR = PROJECT_ROOT / "data" / "normalized_events.index"
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+
+# Parsed events fanned out to the configurations of a multi-config run at a time
+MULTI_CONFIG_CHUNK = 1024
+
+def setup_logging() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+    )
+
+def load_config(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {path}")
+
+    with path.open("r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    logging.info("Configuration loaded from %s", path)
+    return config
+
+def run_pipeline(
+    config: Dict[str, Any],
+    data_path: Path | MergedTelemetry,
+    streaming: bool = False,
+    output_dir: Path | None = None,
+    workers: int = 1,
+    columnar: bool = False,
+    export_format: str = "json",
+    cache: ParsedEventCache | None = None,
+    build_index: bool = False,
+    metrics: PipelineMetrics | None = None,
+    dedup: EventDeduplicator | None = None,
+    report_formats: Sequence[str] = ("text",),
+    snapshot: ReportSnapshot | None = None,
+) -> Path:
+    """
+    Run the pipeline over ``data_path`` and return the report path.
+
+    ``data_path`` is a single telemetry file or a ``MergedTelemetry`` over
+    several, which is consumed as one stream in timestamp order. Stage
+    timings, throughput and peak memory are collected in ``metrics`` and
+    written to pipeline_metrics.json next to the report.
+
+    With ``dedup``, repeated telemetry IDs are dropped after parsing and
+    bursts of one error pattern are collapsed into episodes before
+    aggregation, reporting and export. Alerting still sees every distinct
+    event.
+
+    The report is written in each of ``report_formats``. With ``snapshot``,
+    only events newer than it are processed and added to it, the report
+    covers every run so far and the updated snapshot is saved; the new
+    events are appended to the normalized export of earlier runs.
+    """
+    logger = logging.getLogger("pipeline")
+
+    if output_dir is None:
+        output_dir = PROJECT_ROOT / "data"
+    if metrics is None:
+        metrics = pipeline_metrics.PipelineMetrics()
+    if snapshot is not None and not streaming:
+        logger.info("Incremental runs are processed in streaming mode")
+        streaming = True
+    # Anything but a Path is a MergedTelemetry; checking for the latter would
+    # import telemetry_sources into every single-file run
+    merged = not isinstance(data_path, Path)
+    if workers > 1:
+        capped = error_parser.effective_workers(workers)
+        if capped < workers:
+            logger.info("Capping --workers at %d, the number of available CPUs", capped)
+            workers = capped
+    metrics.info.update(
+        source=[str(path) for path in data_path.paths] if merged else str(data_path),
+        mode="streaming" if streaming else "batch",
+        workers=workers,
+        columnar=columnar,
+        export_format=export_format,
+    )
+
+    if merged and workers > 1 and (cache is None or streaming):
+        logger.info("Multiple sources are parsed by the reader threads, not worker processes")
+
+    try:
+        if streaming:
+            if cache is not None:
+                logger.info("The parsed-event cache is not used in streaming mode")
+            return _run_streaming_pipeline(
+                config,
+                data_path,
+                output_dir,
+                export_format,
+                build_index,
+                metrics,
+                dedup,
+                report_formats,
+                snapshot,
+            )
+        return _run_batch_pipeline(
+            config,
+            data_path,
+            output_dir,
+            workers,
+            columnar,
+            export_format,
+            cache,
+            build_index,
+            metrics,
+            dedup,
+            report_formats,
+        )
+    finally:
+        metrics.write(output_dir)
+
+def _run_batch_pipeline(
+    config: Dict[str, Any],
+    data_path: Path | MergedTelemetry,
+    output_dir: Path,
+    workers: int,
+    columnar: bool,
+    export_format: str,
+    cache: ParsedEventCache | None,
+    build_index: bool,
+    metrics: PipelineMetrics,
+    dedup: EventDeduplicator | None = None,
+    report_formats: Sequence[str] = ("text",),
+) -> Path:
+    logger = logging.getLogger("pipeline")
+
+    parsed_events: Sequence[ErrorEvent]
+    cached = None
+    fingerprint = None
+    merged = not isinstance(data_path, Path)
+    if cache is not None and not merged:
+        with metrics.stage("cache_load"):
+            fingerprint = cache.fingerprint(data_path)
+            cached = cache.load(
+                data_path, config, columnar=columnar, fingerprint=fingerprint
+            )
+        metrics.info["cache_hit"] = cached is not None
+
+    if cached is not None:
+        # 1-3. Unchanged source: reuse the parsed events and their aggregate
+        parsed_events, aggregator, raw_count = cached
+        metrics.records = raw_count
+        metrics.events = len(parsed_events)
+        if not raw_count:
+            logger.warning("No telemetry records found. Exiting.")
+            return report_generator.error_report_path(output_dir, report_formats[0])
+        with metrics.stage("aggregate", len(parsed_events)):
+            summary = aggregator.snapshot()
+    elif merged:
+        # 1-2. Read, parse and merge the sources in timestamp order
+        logger.info("Reading %s in timestamp order", data_path)
+        with metrics.stage("parse") as stage:
+            if cache is not None:
+                # Only new and changed files are parsed, each one whole
+                hits = cache.hits
+                events, raw_count = error_parser.parse_sources(
+                    data_path.paths, config, workers, cache, data_path.since, data_path.until
+                )
+                metrics.info["cache_hits"] = cache.hits - hits
+            else:
+                events = data_path
+            parsed_events = event_table.EventTable(events) if columnar else list(events)
+            if cache is None:
+                raw_count = data_path.records
+            stage.records = metrics.records = raw_count
+        metrics.events = len(parsed_events)
+        logger.info(
+            "Parsed %d events from %d raw telemetry records",
+            len(parsed_events),
+            raw_count,
+        )
+
+        if not raw_count:
+            logger.warning("No telemetry records found. Exiting.")
+            return report_generator.error_report_path(output_dir, report_formats[0])
+
+        # 3. Aggregate and analyze patterns
+        logger.info("Aggregating error statistics")
+        with metrics.stage("aggregate", len(parsed_events)):
+            if columnar:
+                aggregator = parsed_events.aggregate(  # type: ignore[attr-defined]
+                    config.get("aggregation", {}).get("top_k_capacity")
+                )
+            else:
+                aggregator = error_parser.EventAggregator.from_config(config)
+                aggregator.update(parsed_events)
+            summary = aggregator.snapshot()
+    else:
+        # 1. Ingest telemetry data
+        logger.info("Reading telemetry data from %s", data_path)
+        with metrics.stage("read") as stage:
+            raw_events = telemetry_reader.read_telemetry_file(data_path)
+            stage.records = metrics.records = len(raw_events)
+        logger.info("Loaded %d raw telemetry records", len(raw_events))
+
+        if not raw_events:
+            metrics.events = 0
+            logger.warning("No telemetry records found. Exiting.")
+            return report_generator.error_report_path(output_dir, report_formats[0])
+
+        # 2. Normalize and enrich events
+        logger.info("Parsing and normalizing telemetry events")
+        if columnar:
+            with metrics.stage("parse", len(raw_events)):
+                parsed_events = error_parser.parse_event_table(raw_events, config, workers=workers)
+            logger.info("Parsed %d events successfully", len(parsed_events))
+
+            # 3. Aggregate and analyze patterns
+            logger.info("Aggregating error statistics")
+            with metrics.stage("aggregate", len(parsed_events)):
+                aggregator = parsed_events.aggregate(  # type: ignore[attr-defined]
+                    config.get("aggregation", {}).get("top_k_capacity")
+                )
+                summary = aggregator.snapshot()
+        else:
+            # Events are aggregated as they are parsed
+            with metrics.stage("parse", len(raw_events)):
+                parsed_events, aggregator = error_parser.parse_and_aggregate(
+                    raw_events, config, workers=workers
+                )
+            logger.info("Parsed %d events successfully", len(parsed_events))
+
+            # 3. Aggregate and analyze patterns
+            logger.info("Aggregating error statistics")
+            with metrics.stage("aggregate", len(parsed_events)):
+                summary = aggregator.snapshot()
+        metrics.events = len(parsed_events)
+
+        if cache is not None:
+            with metrics.stage("cache_store", len(parsed_events)):
+                cache.store(
+                    data_path, config, parsed_events, aggregator, len(raw_events), fingerprint
+                )
+
+    alert_events = parsed_events
+    if dedup is not None:
+        # The cache keeps every event; duplicates and bursts are folded after it
+        logger.info("Dropping duplicate events and collapsing episodes")
+        with metrics.stage("dedup", len(parsed_events)):
+            alert_events = list(dedup.unique(parsed_events))
+            parsed_events = list(dedup.collapse(alert_events))
+            aggregator = error_parser.EventAggregator.from_config(config)
+            aggregator.update(parsed_events)
+            summary = aggregator.snapshot()
+        summary["dedup"] = metrics.info["dedup"] = dedup.stats()
+        _log_dedup_summary(dedup)
+
+    # 4. Generate report
+    output_dir.mkdir(parents=True, exist_ok=True)
+    logger.info("Generating report in %s", output_dir)
+    with metrics.stage("report", len(parsed_events)):
+        report_path = report_generator.generate_report(
+            parsed_events,
+            summary,
+            output_dir,
+            options=report_generator.TimelineOptions.from_config(config),
+            formats=report_formats,
+        )
+
+    # 5. Optionally persist normalized data for downstream tools
+    normalized_path = event_exporter.normalized_events_path(output_dir, export_format)
+    with metrics.stage("export", len(parsed_events)):
+        event_exporter.write_normalized_events(parsed_events, normalized_path, export_format)
+    logger.info("Normalized events written to %s", normalized_path)
+    if build_index:
+        with metrics.stage("index", len(parsed_events)):
+            event_index.build_event_index(normalized_path)
+
+    # 6. Evaluate alerting thresholds over the lookback window
+    alert_engine = alert_window.AlertEngine(config)
+    with metrics.stage("alerts", len(alert_events)):
+        for alert in alert_engine.observe_all(alert_events):
+            _log_alert(alert)
+    _log_alert_summary(alert_engine)
+
+    return report_path
+
+def _run_streaming_pipeline(
+    config: Dict[str, Any],
+    data_path: Path | MergedTelemetry,
+    output_dir: Path,
+    export_format: str = "json",
+    build_index: bool = False,
+    metrics: PipelineMetrics | None = None,
+    dedup: EventDeduplicator | None = None,
+    report_formats: Sequence[str] = ("text",),
+    snapshot: ReportSnapshot | None = None,
+) -> Path:
+    """
+    Single-pass variant of ``run_pipeline`` with memory independent of input size.
+
+    Records are read, parsed, exported and aggregated one at a time; only the
+    earliest events needed for the report timeline are retained. ``dedup``
+    keeps a bounded window of recent IDs and open episodes. A ``snapshot``
+    supplies the aggregate and timeline to continue, and drops the events
+    it already holds before anything else sees them; once it has been saved
+    by an earlier run, the new events are appended to that run's export.
+    """
+    logger = logging.getLogger("pipeline")
+    if metrics is None:
+        metrics = pipeline_metrics.PipelineMetrics()
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    normalized_path = event_exporter.normalized_events_path(output_dir, export_format)
+
+    logger.info("Streaming telemetry data from %s", data_path)
+    raw_count = 0
+
+    def counted_records():
+        nonlocal raw_count
+        for record in telemetry_reader.iter_telemetry(data_path):
+            raw_count += 1
+            yield record
+
+    if not isinstance(data_path, Path):
+        events: Iterable[ErrorEvent] = data_path
+    else:
+        events = error_parser.iter_parse_events(counted_records(), config)
+
+    if snapshot is not None:
+        events = snapshot.new_events(events)
+        aggregator, timeline = snapshot.aggregator, snapshot.timeline
+    else:
+        timeline = report_generator.TimelineBuffer(
+            report_generator.TimelineOptions.from_config(config)
+        )
+        aggregator = error_parser.EventAggregator.from_config(config)
+    reported = aggregator.total_events
+    append = snapshot is not None and snapshot.runs > 0
+    alert_engine = alert_window.AlertEngine(config)
+    if dedup is not None:
+        events = dedup.collapse(_alerted(dedup.unique(events), alert_engine))
+    else:
+        events = _alerted(events, alert_engine)
+    with metrics.stage("stream") as stage:
+        with event_exporter.open_event_writer(normalized_path, export_format, append) as writer:
+            for ev in events:
+                writer.write(ev)
+                aggregator.add(ev)
+                timeline.add(ev)
+        if not isinstance(data_path, Path):
+            raw_count = data_path.records
+        stage.records = metrics.records = raw_count
+
+    exported = aggregator.total_events - reported
+    metrics.events = exported
+    if dedup is not None:
+        metrics.info["dedup"] = dedup.stats()
+        metrics.events += dedup.duplicates + metrics.info["dedup"]["events_collapsed"]
+        if snapshot is not None:
+            snapshot.add_dedup_stats(metrics.info["dedup"])
+
+    with metrics.stage("aggregate", aggregator.total_events):
+        if snapshot is not None:
+            summary = snapshot.summary()
+        else:
+            summary = aggregator.snapshot()
+            if dedup is not None:
+                summary["dedup"] = metrics.info["dedup"]
+
+    if snapshot is not None:
+        with metrics.stage("snapshot", aggregator.total_events):
+            snapshot.save()
+        metrics.events += snapshot.skipped
+        metrics.info["snapshot"] = {
+            "path": str(snapshot.path),
+            "runs": snapshot.runs,
+            "high_water_mark": (
+                snapshot.high_water_mark.isoformat() if snapshot.high_water_mark else None
+            ),
+            "skipped_events": snapshot.skipped,
+        }
+
+    logger.info(
+        "Streamed %d raw telemetry records, parsed %d events successfully",
+        raw_count,
+        metrics.events,
+    )
+    if dedup is not None:
+        _log_dedup_summary(dedup)
+    if snapshot is not None:
+        logger.info(
+            "Skipped %d events already in the report snapshot; it now holds %d",
+            snapshot.skipped,
+            summary["total_events"],
+        )
+
+    if not raw_count:
+        if not append:
+            normalized_path.unlink()
+        if not summary["total_events"]:
+            logger.warning("No telemetry records found. Exiting.")
+            return report_generator.error_report_path(output_dir, report_formats[0])
+    else:
+        logger.info("Normalized events written to %s", normalized_path)
+        if build_index:
+            with metrics.stage("index", exported):
+                event_index.build_event_index(normalized_path)
+
+    logger.info("Generating report in %s", output_dir)
+    with metrics.stage("report", summary["total_events"]):
+        report_path = report_generator.generate_report(
+            timeline, summary, output_dir, formats=report_formats
+        )
+
+    _log_alert_summary(alert_engine)
+
+    return report_path
+
+def run_follow(
+    config: Dict[str, Any],
+    data_path: Path,
+    output_dir: Path | None = None,
+    checkpoint_path: Path | None = None,
+    stop: threading.Event | None = None,
+    dedup: EventDeduplicator | None = None,
+    report_formats: Sequence[str] = ("text",),
+) -> Path:
+    """
+    Tail a growing JSONL file, updating the aggregate as records arrive.
+
+    The critical threshold is re-checked after every batch, so an alert is
+    raised at most one poll interval (or one read window while catching up)
+    after the record that triggers it. The consumed byte offset is
+    checkpointed together with the aggregate, timeline, alert window and
+    dedup state, so a restart only processes bytes appended since and
+    carries on counting where it stopped. Counts start from zero if the
+    report settings changed in between. Runs until interrupted or ``stop``
+    is set, then writes the report.
+    """
+    logger = logging.getLogger("follow")
+
+    if output_dir is None:
+        output_dir = PROJECT_ROOT / "data"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if checkpoint_path is None:
+        checkpoint_path = output_dir / f"{data_path.name}.checkpoint.json"
+    if stop is None:
+        stop = threading.Event()
+
+    poll_interval = float(config.get("ingestion", {}).get("poll_interval_seconds", 1.0))
+    analysis = _LiveAnalysis(config, dedup)
+
+    logger.info(
+        "Following %s (poll interval %.1fs, checkpoint %s)",
+        data_path,
+        poll_interval,
+        checkpoint_path,
+    )
+    try:
+        with tail_follower.TelemetryTail(data_path, checkpoint_path) as tail:
+            while not stop.is_set():
+                records = tail.poll()
+                if tail.resume_state is not None:
+                    if analysis.load_state(tail.resume_state):
+                        logger.info(
+                            "Restored %d events from the checkpoint",
+                            analysis.aggregator.total_events,
+                        )
+                    else:
+                        logger.info("Report settings changed; counting from zero")
+                    tail.resume_state = None
+                if records:
+                    analysis.process(records)
+                    logger.info(
+                        "Processed %d new records (%d events total)",
+                        len(records),
+                        analysis.aggregator.total_events,
+                    )
+                tail.save_checkpoint(analysis.to_state)
+
+                # Keep draining a backlog without waiting between reads
+                if not records:
+                    stop.wait(poll_interval)
+    except KeyboardInterrupt:
+        logger.info("Follow mode interrupted")
+
+    return analysis.report(output_dir, report_formats)
+
+def run_server(
+    config: Dict[str, Any],
+    output_dir: Path | None = None,
+    stop: threading.Event | None = None,
+    dedup: EventDeduplicator | None = None,
+    report_formats: Sequence[str] = ("text",),
+) -> Path:
+    """
+    Receive telemetry over the network, updating the aggregate as it arrives.
+
+    Records sent to the ``IngestionServer`` configured in the ``server``
+    section are parsed, aggregated and checked against the alert threshold
+    one micro-batch at a time. Runs until interrupted or ``stop`` is set,
+    then drains what was received and writes the report.
+    """
+    import asyncio
+
+    logger = logging.getLogger("server")
+
+    if output_dir is None:
+        output_dir = PROJECT_ROOT / "data"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    analysis = _LiveAnalysis(config, dedup)
+    server = ingest_server.IngestionServer.from_config(config, analysis.process)
+    try:
+        asyncio.run(server.run(stop))
+    except KeyboardInterrupt:
+        logger.info("Ingestion server interrupted")
+
+    return analysis.report(output_dir, report_formats)
+
+class _LiveAnalysis:
+    """
+    Incremental aggregate, timeline and alerting over batches of raw
+    records or parsed events, as used by follow, server and multi-config
+    mode. ``label`` tags the alerts logged.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        dedup: EventDeduplicator | None = None,
+        label: str | None = None,
+    ) -> None:
+        self.config = config
+        self.dedup = dedup
+        self.label = label
+        self.aggregator = error_parser.EventAggregator.from_config(config)
+        self.timeline = report_generator.TimelineBuffer(
+            report_generator.TimelineOptions.from_config(config)
+        )
+        self.alert_engine = alert_window.AlertEngine(config)
+
+    def process(self, records: Sequence[Dict[str, Any]]) -> None:
+        self.add_events(error_parser.iter_parse_events(records, self.config))
+
+    def add_events(self, events: Iterable[ErrorEvent]) -> None:
+        aggregator = self.aggregator
+        timeline = self.timeline
+        alert_engine = self.alert_engine
+        dedup = self.dedup
+
+        if dedup is not None:
+            events = dedup.unique(events)
+        for ev in events:
+            alert = alert_engine.observe(ev)
+            if alert is not None:
+                _log_alert(alert, self.label)
+            for record in dedup.add(ev) if dedup is not None else (ev,):
+                aggregator.add(record)
+                timeline.add(record)
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Return the aggregate, timeline, alert window and dedup state as
+        JSON-serializable data, keyed by the settings they were built under.
+        """
+        state: Dict[str, Any] = {
+            "settings": report_snapshot.snapshot_settings(self.config, self.dedup),
+            "aggregate": self.aggregator.to_state(),
+            "timeline": self.timeline.to_state(),
+            "alerts": self.alert_engine.to_state(),
+        }
+        if self.dedup is not None:
+            state["dedup"] = self.dedup.to_state()
+        return state
+
+    def load_state(self, state: Dict[str, Any]) -> bool:
+        """
+        Continue from ``to_state`` output; returns False, leaving this
+        analysis as it was, if the state was built under other settings.
+        """
+        if state.get("settings") != report_snapshot.snapshot_settings(self.config, self.dedup):
+            return False
+        self.aggregator = error_parser.EventAggregator.from_state(state["aggregate"])
+        self.timeline = report_generator.TimelineBuffer.from_state(state["timeline"])
+        if not self.alert_engine.load_state(state["alerts"]):
+            logging.getLogger("follow").info(
+                "Alerting window settings changed; the alert window starts empty"
+            )
+        if self.dedup is not None:
+            self.dedup.load_state(state["dedup"])
+        return True
+
+    def report(self, output_dir: Path, formats: Sequence[str] = ("text",)) -> Path:
+        dedup = self.dedup
+        if dedup is not None:
+            for record in dedup.flush():
+                self.aggregator.add(record)
+                self.timeline.add(record)
+        summary = self.aggregator.snapshot()
+        if dedup is not None:
+            summary["dedup"] = dedup.stats()
+            _log_dedup_summary(dedup)
+        return report_generator.generate_report(
+            self.timeline, summary, output_dir, formats=formats
+        )
+
+def run_multi_config(
+    configs: Dict[str, Dict[str, Any]],
+    sources: Sequence[Path],
+    output_dir: Path | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    metrics: PipelineMetrics | None = None,
+    dedup: bool = False,
+    report_formats: Sequence[str] | None = None,
+) -> List[Path]:
+    """
+    Evaluate several configurations in a single pass over ``sources`` and
+    return their report paths.
+
+    Records are read and parsed once under the first configuration, keeping
+    their raw severity, so reading, field extraction and timestamp parsing
+    are shared. ``SeverityFanout`` then normalizes each chunk of events per
+    configuration, and dedup (with ``dedup`` or dedup.enabled), aggregation,
+    alerting and the report run per configuration. The report of
+    configuration ``name`` goes to ``output_dir/name``. All configurations
+    must share field_aliases; reading settings such as read_workers come
+    from the first. Normalized events are not exported in this mode.
+    """
+    logger = logging.getLogger("pipeline")
+
+    if output_dir is None:
+        output_dir = PROJECT_ROOT / "data"
+    if metrics is None:
+        metrics = pipeline_metrics.PipelineMetrics()
+    names = list(configs)
+    first = configs[names[0]]
+    fanout = config_fanout.SeverityFanout.from_configs([configs[name] for name in names])
+    analyses = [
+        _LiveAnalysis(
+            config,
+            event_dedup.EventDeduplicator.from_config(config)
+            if dedup or config.get("dedup", {}).get("enabled", False)
+            else None,
+            label=name,
+        )
+        for name, config in configs.items()
+    ]
+    metrics.info.update(
+        source=[str(path) for path in sources], mode="multi-config", configs=names
+    )
+
+    raw_count = 0
+
+    def counted_records():
+        nonlocal raw_count
+        for record in telemetry_reader.iter_telemetry(sources[0]):
+            raw_count += 1
+            yield record
+
+    merged = None
+    if len(sources) == 1 and since is None and until is None:
+        events: Iterator[ErrorEvent] = error_parser.iter_parse_events(
+            counted_records(), first, raw_severity=True
+        )
+    else:
+        merged = telemetry_sources.MergedTelemetry.from_config(
+            sources, first, since, until, raw_severity=True
+        )
+        events = iter(merged)
+
+    logger.info("Evaluating %d configurations in one pass: %s", len(names), ", ".join(names))
+    try:
+        parsed = 0
+        with metrics.stage("stream") as stage:
+            while chunk := list(islice(events, MULTI_CONFIG_CHUNK)):
+                parsed += len(chunk)
+                for analysis, normalized in zip(analyses, fanout.fan_out(chunk)):
+                    analysis.add_events(normalized)
+            if merged is not None:
+                raw_count = merged.records
+            stage.records = metrics.records = raw_count
+        metrics.events = parsed
+        logger.info(
+            "Streamed %d raw telemetry records, parsed %d events successfully",
+            raw_count,
+            parsed,
+        )
+
+        if not raw_count:
+            logger.warning("No telemetry records found. Exiting.")
+            return []
+
+        report_paths = []
+        with metrics.stage("report", parsed * len(analyses)):
+            for name, analysis in zip(names, analyses):
+                formats = report_formats or analysis.config.get("report", {}).get(
+                    "formats", ["text"]
+                )
+                report_paths.append(analysis.report(output_dir / name, formats))
+                _log_alert_summary(analysis.alert_engine, name)
+        return report_paths
+    finally:
+        metrics.write(output_dir)
+
+def _alerted(events: Iterable[ErrorEvent], engine: AlertEngine) -> Iterator[ErrorEvent]:
+    for ev in events:
+        alert = engine.observe(ev)
+        if alert is not None:
+            _log_alert(alert)
+        yield ev
+
+def _log_alert(alert: Dict[str, Any], label: str | None = None) -> None:
+    logging.getLogger("pipeline").error(
+        "%sCritical alert: %d CRITICAL events in the %g minutes up to %s "
+        "(threshold=%d, by subsystem: %s)",
+        f"[{label}] " if label else "",
+        alert["count"],
+        alert["lookback_minutes"],
+        alert["window_end"].isoformat(),
+        alert["threshold"],
+        alert["by_subsystem"],
+    )
+
+def _log_dedup_summary(dedup: EventDeduplicator) -> None:
+    stats = dedup.stats()
+    logging.getLogger("pipeline").info(
+        "Dropped %d duplicate events; collapsed %d repeats into episodes, %d records remain",
+        stats["duplicates_dropped"],
+        stats["events_collapsed"],
+        stats["records"],
+    )
+
+def _log_alert_summary(engine: AlertEngine, label: str | None = None) -> None:
+    logger = logging.getLogger("pipeline")
+    prefix = f"[{label}] " if label else ""
+
+    if engine.counter.late_events:
+        logger.warning(
+            "%s%d events arrived later than the lateness allowance and were not "
+            "counted for alerting",
+            prefix,
+            engine.counter.late_events,
+        )
+    if not engine.alerts:
+        logger.info(
+            "%sCritical events below threshold: at most %d within %g minutes (threshold=%d)",
+            prefix,
+            engine.peak_count,
+            engine.lookback_minutes,
+            engine.threshold,
+        )
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    ``--since``/``--until`` argument type; loads the time parsing on use.
+    """
+    return utils_time.parse_timestamp(value)
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Detect and summarize error patterns in telemetry logs."
+    )
+    parser.add_argument(
+        "data_paths",
+        nargs="*",
+        default=[str(DEFAULT_DATA_PATH)],
+        metavar="data_path",
+        help="JSON, JSONL (optionally compressed) or binary event files, directories "
+        "scanned recursively, or glob patterns; several sources are merged in "
+        f"timestamp order (default: {DEFAULT_DATA_PATH.relative_to(PROJECT_ROOT)})",
+    )
+    parser.add_argument(
+        "--config",
+        dest="configs",
+        action="append",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Settings file; repeat to evaluate several in one pass over the data, "
+        "each reported to data/<file name>/ "
+        f"(default: {CONFIG_PATH.relative_to(PROJECT_ROOT)})",
+    )
+    parser.add_argument(
+        "--since",
+        type=parse_timestamp,
+        default=None,
+        help="Only analyze events at or after this time; YYYY/MM/DD partition "
+        "directories entirely before it are not read",
+    )
+    parser.add_argument(
+        "--until",
+        type=parse_timestamp,
+        default=None,
+        help="Only analyze events before this time; YYYY/MM/DD partition "
+        "directories entirely after it are not read",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=None,
+        help="Directory for the report, normalized events and metrics (default: data/)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Process records incrementally with constant memory usage",
+    )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Tail a growing JSONL file and update the analysis as records arrive",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Receive JSONL telemetry over TCP, a Unix socket and HTTP POST as set "
+        "in the server config section, and report when interrupted",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="Offset checkpoint file for --follow (default: next to the report)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Parse with up to N worker processes, at most one per available CPU "
+        "(batch mode only, default: 1)",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Hold parsed events in a compact columnar table (batch mode only)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse parsed events of unchanged inputs from the on-disk cache "
+        "(batch mode only; also enabled by cache.enabled in the config)",
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Drop repeated telemetry IDs and collapse bursts of the same error into "
+        "episodes before aggregation (also enabled by dedup.enabled in the config)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Continue the report snapshot: only process events newer than it and "
+        "report over every run so far (also enabled by report.incremental in the config)",
+    )
+    parser.add_argument(
+        "--snapshot",
+        type=Path,
+        default=None,
+        help="Report snapshot file for --incremental (default: report.snapshot_path "
+        "in the config)",
+    )
+    parser.add_argument(
+        "--report-format",
+        nargs="+",
+        choices=REPORT_FORMATS,
+        default=None,
+        help="Write the report in these formats (default: report.formats in the "
+        "config, else text)",
+    )
+    parser.add_argument(
+        "--export-format",
+        choices=EXPORT_FORMATS,
+        default=None,
+        help="Format of the normalized events export (default: json)",
+    )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help="Build a query index next to the normalized events "
+        "(requires --export-format binary)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="parse",
+        choices=PROFILE_STAGES,
+        default=None,
+        metavar="STAGE",
+        help="Run STAGE under cProfile and write the stats next to the report "
+        "(default stage: parse; worker processes are not profiled)",
+    )
+    parser.add_argument(
+        "--import-time",
+        action="store_true",
+        help="Print how long importing each pipeline module took and the run time "
+        "to stderr (see python -X importtime for the interpreter's own startup)",
+    )
+    args = parser.parse_args(argv)
+    if args.index and args.export_format != "binary":
+        parser.error("--index requires --export-format binary")
+    if args.follow and (len(args.data_paths) != 1 or args.since or args.until):
+        parser.error("--follow takes a single file and no --since/--until")
+    if args.serve and args.follow:
+        parser.error("--serve and --follow are mutually exclusive")
+    if args.incremental and (args.serve or args.follow):
+        parser.error("--incremental does not apply to --serve or --follow")
+    if args.configs and len(args.configs) > 1 and (
+        args.serve or args.follow or args.incremental
+    ):
+        parser.error("several --config files cannot be combined with --serve, --follow or "
+                     "--incremental")
+    if args.configs and len(args.configs) > 1:
+        # A multi-config run streams once through the sources and exports nothing
+        ignored = [
+            option
+            for option, given in (
+                ("--stream", args.stream),
+                ("--workers", args.workers is not None),
+                ("--columnar", args.columnar),
+                ("--cache", args.cache),
+                ("--export-format", args.export_format is not None),
+                ("--index", args.index),
+            )
+            if given
+        ]
+        if ignored:
+            parser.error(f"several --config files cannot be combined with {', '.join(ignored)}")
+    if args.workers is None:
+        args.workers = 1
+    if args.export_format is None:
+        args.export_format = "json"
+    return args
+
+def parse_query_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="main.py query",
+        description="Query indexed normalized events by time range and fields.",
+    )
+    parser.add_argument(
+        "--index-dir",
+        type=Path,
+        default=DEFAULT_INDEX_DIR,
+        help="Index built with --index (default: %(default)s)",
+    )
+    parser.add_argument("--since", help="Start of the time range (inclusive)")
+    parser.add_argument("--until", help="End of the time range (exclusive)")
+    for field in ("subsystem", "error-code", "severity"):
+        parser.add_argument(
+            f"--{field}",
+            action="append",
+            help="Match this value; repeat to match any of several",
+        )
+    resolved = parser.add_mutually_exclusive_group()
+    resolved.add_argument("--resolved", dest="resolved", action="store_true", default=None)
+    resolved.add_argument("--unresolved", dest="resolved", action="store_false")
+    parser.add_argument("--limit", type=int, default=None, help="Return at most N events")
+    parser.add_argument(
+        "--count",
+        action="store_true",
+        help="Only print the number of matching events, counting each occurrence of an episode",
+    )
+    parser.add_argument("--json", action="store_true", help="Print matches as JSON lines")
+    return parser.parse_args(argv)
+
+def parse_report_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="main.py report",
+        description="Render the report from a report snapshot without reading telemetry.",
+    )
+    parser.add_argument(
+        "--snapshot",
+        type=Path,
+        default=PROJECT_ROOT / "data" / SNAPSHOT_FILENAME,
+        help="Snapshot saved by an --incremental run (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--format",
+        dest="formats",
+        nargs="+",
+        choices=REPORT_FORMATS,
+        default=["text"],
+        help="Report formats to write (default: text)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=PROJECT_ROOT / "data",
+        help="Directory to write the reports to (default: %(default)s)",
+    )
+    return parser.parse_args(argv)
+
+def run_report(argv: List[str]) -> int:
+    args = parse_report_args(argv)
+    try:
+        snapshot = report_snapshot.ReportSnapshot.read(args.snapshot.resolve())
+    except (OSError, ValueError) as exc:
+        print(f"Cannot read report snapshot: {exc}", file=sys.stderr)
+        return 1
+
+    report_generator.generate_report(
+        snapshot.timeline, snapshot.summary(), args.output_dir, formats=args.formats
+    )
+    for report_format in args.formats:
+        print(report_generator.error_report_path(args.output_dir, report_format))
+    return 0
+
+def run_query(argv: List[str]) -> int:
+    from dataclasses import asdict
+
+    args = parse_query_args(argv)
+    filters: Dict[str, Any] = {
+        "start": args.since,
+        "end": args.until,
+        "subsystem": args.subsystem,
+        "error_code": args.error_code,
+        "severity": [value.upper() for value in args.severity] if args.severity else None,
+        "resolved": args.resolved,
+    }
+
+    try:
+        with event_index.EventIndex(args.index_dir.resolve()) as index:
+            if args.count:
+                print(index.count(**filters))
+                return 0
+            events = index.query(limit=args.limit, **filters)
+    except (OSError, ValueError) as exc:
+        print(f"Query failed: {exc}", file=sys.stderr)
+        return 1
+
+    for ev in events:
+        if args.json:
+            record = asdict(ev)
+            record["timestamp"] = ev.timestamp.isoformat()
+            if "last_timestamp" in record:
+                record["last_timestamp"] = record["last_timestamp"].isoformat()
+            print(json.dumps(record))
+        else:
+            line = (
+                f"{ev.timestamp.isoformat()} [{ev.severity}] {ev.subsystem} "
+                f"{ev.error_code} ({ev.telemetry_id}) "
+                f"{'resolved' if ev.resolved else 'unresolved'}: {ev.description}"
+            )
+            last_timestamp = getattr(ev, "last_timestamp", None)
+            if last_timestamp is not None:
+                count = ev.count  # type: ignore[attr-defined]
+                line += f" (x{count} until {last_timestamp.isoformat()})"
+            print(line)
+    return 0
+
+class _WarmState:
+    """
+    Settings files and parsed-event caches of the commands run by one
+    process. A cold run uses them once; a worker keeps them for every
+    request, re-reading a settings file when it changes on disk.
+    """
+
+    def __init__(self, resident: bool = False) -> None:
+        self.resident = resident
+        self._configs: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+        self._caches: Dict[str, ParsedEventCache] = {}
+
+    def config(self, path: Path) -> Dict[str, Any]:
+        path = path.resolve()
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {path}") from None
+        loaded = self._configs.get(path)
+        if loaded is None or loaded[0] != mtime:
+            loaded = self._configs[path] = (mtime, load_config(path))
+        return loaded[1]
+
+    def cache(self, config: Dict[str, Any]) -> ParsedEventCache:
+        key = json.dumps(config.get("cache", {}), sort_keys=True)
+        cache = self._caches.get(key)
+        if cache is None:
+            cache = self._caches[key] = event_cache.ParsedEventCache.from_config(
+                config, PROJECT_ROOT
+            )
+        return cache
+
+def parse_worker_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="main.py worker",
+        description="Keep the pipeline loaded and run the commands sent by main.py submit.",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=worker_client.DEFAULT_WORKER_SOCKET,
+        help="Unix socket to listen on (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--config",
+        dest="configs",
+        action="append",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Settings file to load up front; repeat for several "
+        f"(default: {CONFIG_PATH.relative_to(PROJECT_ROOT)})",
+    )
+    return parser.parse_args(argv)
+
+class _ClientStream:
+    """
+    Text stream that relays what a submitted command writes to the client,
+    one JSON line per write tagged with the stream name.
+    """
+
+    def __init__(self, wfile: Any, name: str) -> None:
+        self._wfile = wfile
+        self._name = name
+
+    def write(self, text: str) -> int:
+        if text:
+            self._wfile.write(json.dumps({self._name: text}) + "\n")
+        return len(text)
+
+    def flush(self) -> None:
+        self._wfile.flush()
+
+def _serve_request(conn: Any, state: _WarmState) -> None:
+    from contextlib import redirect_stderr, redirect_stdout
+
+    logger = logging.getLogger("worker")
+    with conn.makefile("r", encoding="utf-8") as rfile:
+        line = rfile.readline()
+    try:
+        request = json.loads(line)
+        argv = [str(arg) for arg in request["argv"]]
+        cwd = str(request["cwd"])
+    except (ValueError, KeyError, TypeError) as exc:
+        logger.warning("Ignoring malformed request: %r", exc)
+        return
+
+    wfile = conn.makefile("w", encoding="utf-8")
+    stdout, stderr = _ClientStream(wfile, "stdout"), _ClientStream(wfile, "stderr")
+    handler = logging.StreamHandler(stderr)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    previous_dir = os.getcwd()
+    started = time.perf_counter()
+    try:
+        os.chdir(cwd)
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            code = run_command(argv, state)
+    except SystemExit as exc:
+        # argparse exits on --help and on usage errors
+        code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+    except Exception as exc:
+        logger.exception("Command failed: %s", exc)
+        code = 1
+    finally:
+        root.removeHandler(handler)
+        os.chdir(previous_dir)
+    logger.info(
+        "Ran %s in %.1f ms (exit code %d)",
+        " ".join(argv) or "the default command",
+        (time.perf_counter() - started) * 1000,
+        code,
+    )
+    try:
+        wfile.write(json.dumps({"exit": code}) + "\n")
+        wfile.close()
+    except OSError:
+        logger.warning("Client went away before the command finished")
+
+def run_worker(argv: List[str]) -> int:
+    """
+    Serve submitted commands on a Unix socket with every pipeline module
+    imported, the settings files parsed and the parsed-event caches open,
+    so a command costs no interpreter start, imports or config parsing.
+    Commands run one at a time in the order they connect. Runs until
+    interrupted or sent SIGTERM.
+    """
+    import signal
+    import socket
+
+    args = parse_worker_args(argv)
+    setup_logging()
+    logger = logging.getLogger("worker")
+
+    state = _WarmState(resident=True)
+    started = time.perf_counter()
+    for subsystem in _SUBSYSTEMS:
+        subsystem._load()
+    try:
+        for path in args.configs or [CONFIG_PATH]:
+            state.config(path)
+    except Exception as exc:
+        logger.exception("Failed to load configuration: %s", exc)
+        return 1
+    logger.info(
+        "Loaded %d pipeline modules in %.0f ms",
+        len(_SUBSYSTEMS),
+        (time.perf_counter() - started) * 1000,
+    )
+
+    socket_path = args.socket.resolve()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        with socket.socket(socket.AF_UNIX) as probe:
+            try:
+                probe.connect(str(socket_path))
+            except OSError:
+                socket_path.unlink()
+            else:
+                logger.error("A worker is already listening on %s", socket_path)
+                return 1
+
+    server = socket.socket(socket.AF_UNIX)
+    server.bind(str(socket_path))
+    server.listen()
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    logger.info("Worker listening on %s", socket_path)
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                _serve_request(conn, state)
+    except KeyboardInterrupt:
+        logger.info("Worker stopped")
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
+    return 0
+
+def _print_import_times(elapsed: float) -> None:
+    """
+    Report the pipeline modules first imported during the command, each
+    including the modules it pulled in, next to the command's run time.
+    """
+    lines = ["Pipeline module imports (each including the modules it pulls in):"]
+    lines += [f"{seconds * 1000:9.1f} ms  {name}" for name, seconds in _IMPORT_TIMES.items()]
+    lines.append(f"{sum(_IMPORT_TIMES.values()) * 1000:9.1f} ms  all imports")
+    lines.append(f"{elapsed * 1000:9.1f} ms  command, imports included")
+    print("\n".join(lines), file=sys.stderr)
+
+def main(argv: List[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv[:1] == ["submit"]:
+        return worker_client.submit(argv[1:])
+    if argv[:1] == ["worker"]:
+        return run_worker(argv[1:])
+    return run_command(argv)
+
+def run_command(argv: List[str], state: _WarmState | None = None) -> int:
+    """
+    Run one command line: a query, a report rendering or an analysis.
+    ``state`` carries settings and caches over from earlier commands.
+    """
+    _IMPORT_TIMES.clear()
+    if argv[:1] == ["query"]:
+        return run_query(argv[1:])
+    if argv[:1] == ["report"]:
+        return run_report(argv[1:])
+
+    started = time.perf_counter()
+    args = parse_args(argv)
+    setup_logging()
+    code = run_analysis(args, state or _WarmState())
+    if args.import_time:
+        _print_import_times(time.perf_counter() - started)
+    return code
+
+def run_analysis(args: argparse.Namespace, state: _WarmState) -> int:
+    logger = logging.getLogger("main")
+    if state.resident and (args.follow or args.serve):
+        logger.error("--follow and --serve run until stopped; start them as their own process")
+        return 2
+
+    configs: Dict[str, Dict[str, Any]] = {}
+    try:
+        for path in args.configs or [CONFIG_PATH]:
+            name = path.stem
+            while name in configs:
+                name += "_"
+            configs[name] = state.config(path)
+    except Exception as exc:
+        logger.exception("Failed to load configuration: %s", exc)
+        return 1
+    config = next(iter(configs.values()))
+
+    dedup = None
+    if args.dedup or config.get("dedup", {}).get("enabled", False):
+        dedup = event_dedup.EventDeduplicator.from_config(config)
+
+    report_cfg = config.get("report", {})
+    report_formats = args.report_format or report_cfg.get("formats", ["text"])
+    output_dir = args.output_dir or PROJECT_ROOT / "data"
+
+    if args.serve:
+        try:
+            report_path = run_server(
+                config, output_dir, dedup=dedup, report_formats=report_formats
+            )
+        except Exception as exc:
+            logger.exception("Ingestion server failed: %s", exc)
+            return 1
+        logger.info("Report generated at: %s", report_path)
+        return 0
+
+    # Continue the report snapshot, reading only partitions that can hold
+    # newer events
+    snapshot_path = args.snapshot or PROJECT_ROOT / report_cfg.get(
+        "snapshot_path", f"data/{SNAPSHOT_FILENAME}"
+    )
+    snapshot = None
+    since = args.since
+    incremental = report_cfg.get("incremental", False) and not args.follow and len(configs) == 1
+    if args.incremental or incremental:
+        snapshot = report_snapshot.ReportSnapshot.load(snapshot_path, config, dedup)
+        mark = snapshot.high_water_mark
+        if mark is not None and (since is None or mark > since):
+            since = mark
+
+    # Never read back what the pipeline writes when scanning its output dir
+    outputs = [
+        *(
+            report_generator.error_report_path(output_dir, fmt)
+            for fmt in REPORT_FORMATS
+        ),
+        snapshot_path,
+        output_dir / pipeline_metrics.METRICS_FILENAME,
+        *(output_dir / name for name in configs if len(configs) > 1),
+        PROJECT_ROOT / config.get("cache", {}).get("directory", "data/cache"),
+        *(
+            event_exporter.normalized_events_path(output_dir, fmt)
+            for fmt in event_exporter.EXPORT_SUFFIXES
+        ),
+        *output_dir.glob("*.checkpoint.json"),
+    ]
+    sources = telemetry_sources.discover_sources(
+        args.data_paths, since, args.until, exclude=outputs
+    )
+    if not sources and snapshot is not None and snapshot.aggregator.total_events:
+        logger.info("No telemetry newer than the report snapshot; reporting from it")
+        report_path = report_generator.generate_report(
+            snapshot.timeline, snapshot.summary(), output_dir, formats=report_formats
+        )
+        logger.info("Report generated at: %s", report_path)
+        return 0
+    if not sources:
+        logger.error("No telemetry files found in %s", ", ".join(args.data_paths))
+        return 1
+    if args.follow and len(sources) != 1:
+        logger.error(
+            "--follow takes a single file, but %s resolves to %d telemetry files",
+            args.data_paths[0],
+            len(sources),
+        )
+        return 2
+
+    if len(configs) > 1:
+        try:
+            report_paths = run_multi_config(
+                configs,
+                sources,
+                output_dir,
+                since,
+                args.until,
+                metrics=pipeline_metrics.PipelineMetrics(profile_stage=args.profile),
+                dedup=args.dedup,
+                report_formats=args.report_format,
+            )
+        except Exception as exc:
+            logger.exception("Pipeline execution failed: %s", exc)
+            return 1
+        for name, report_path in zip(configs, report_paths):
+            logger.info("Report for %s generated at: %s", name, report_path)
+        return 0
+
+    data_path: Path | MergedTelemetry
+    if len(sources) == 1 and since is None and args.until is None:
+        data_path = sources[0]
+    else:
+        data_path = telemetry_sources.MergedTelemetry.from_config(
+            sources, config, since, args.until
+        )
+
+    cache = None
+    if args.cache or config.get("cache", {}).get("enabled", False):
+        cache = state.cache(config)
+
+    try:
+        if args.follow:
+            report_path = run_follow(
+                config,
+                sources[0],
+                output_dir,
+                checkpoint_path=args.checkpoint,
+                dedup=dedup,
+                report_formats=report_formats,
+            )
+        else:
+            report_path = run_pipeline(
+                config,
+                data_path,
+                streaming=args.stream,
+                output_dir=output_dir,
+                workers=args.workers,
+                columnar=args.columnar,
+                export_format=args.export_format,
+                cache=cache,
+                build_index=args.index,
+                metrics=pipeline_metrics.PipelineMetrics(profile_stage=args.profile),
+                dedup=dedup,
+                report_formats=report_formats,
+                snapshot=snapshot,
+            )
+    except Exception as exc:
+        logger.exception("Pipeline execution failed: %s", exc)
+        return 1
+
+    logger.info("Report generated at: %s", report_path)
+    return 0
\ No newline at end of file
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+from collections import Counter, deque
+from datetime import datetime, timezone
+from operator import itemgetter
+from typing import Any, Deque, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .error_parser import ErrorEvent
+from .event_table import EventTable
+
+class WindowedCounter:
+    """
+    Counts per key over a sliding event-time window.
+
+    Counts live in fixed-width time buckets held in a deque, with running
+    totals per key. The window advances with the largest timestamp seen (the
+    watermark); buckets that fall out of it are evicted from the front and
+    subtracted from the totals, so each bucket is created and evicted once
+    and updates are amortized O(1). The window edge is bucket-aligned, so a
+    count may include up to one bucket width of extra history.
+
+    Events older than ``watermark - allowed_lateness`` are dropped and
+    counted in ``late_events``.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        bucket_seconds: float = 60.0,
+        allowed_lateness: float = 0.0,
+    ) -> None:
+        if window_seconds <= 0 or bucket_seconds <= 0:
+            raise ValueError("window_seconds and bucket_seconds must be positive")
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.allowed_lateness = allowed_lateness
+        self.watermark: Optional[float] = None
+        self.late_events = 0
+        self.totals: Counter[Hashable] = Counter()
+        self._buckets: Deque[Tuple[int, Counter[Hashable]]] = deque()
+
+    def add(self, timestamp: float, *keys: Hashable) -> bool:
+        """
+        Count one event at ``timestamp`` (epoch seconds) under every key.
+
+        Returns False if the event was dropped as too late.
+        """
+        watermark = self.watermark
+        if watermark is None or timestamp > watermark:
+            self.watermark = watermark = timestamp
+            self._evict(watermark)
+        elif (
+            timestamp < watermark - self.allowed_lateness
+            or timestamp <= watermark - self.window_seconds
+        ):
+            self.late_events += 1
+            return False
+
+        bucket = self._bucket(int(timestamp // self.bucket_seconds))
+        for key in keys:
+            bucket[key] += 1
+            self.totals[key] += 1
+        return True
+
+    def count(self, key: Hashable) -> int:
+        return self.totals.get(key, 0)
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Return the window and its buckets as JSON-serializable data. Keys
+        must be tuples of JSON scalars, as the ones ``AlertEngine`` counts are.
+        """
+        return {
+            "window_seconds": self.window_seconds,
+            "bucket_seconds": self.bucket_seconds,
+            "allowed_lateness": self.allowed_lateness,
+            "watermark": self.watermark,
+            "late_events": self.late_events,
+            "buckets": [
+                [index, [[*key, count] for key, count in counts.items()]]  # type: ignore[misc]
+                for index, counts in self._buckets
+            ],
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "WindowedCounter":
+        """
+        Rebuild a counter from ``to_state`` output; totals are summed from
+        the buckets.
+        """
+        counter = cls(
+            float(state["window_seconds"]),
+            float(state["bucket_seconds"]),
+            float(state["allowed_lateness"]),
+        )
+        counter.watermark = state["watermark"]
+        counter.late_events = int(state["late_events"])
+        for index, rows in state["buckets"]:
+            counts: Counter[Hashable] = Counter({tuple(row[:-1]): row[-1] for row in rows})
+            counter._buckets.append((index, counts))
+            counter.totals.update(counts)
+        return counter
+
+    def _bucket(self, index: int) -> Counter[Hashable]:
+        buckets = self._buckets
+        if not buckets or index > buckets[-1][0]:
+            counts: Counter[Hashable] = Counter()
+            buckets.append((index, counts))
+            return counts
+
+        # Late event: walk back from the newest bucket (bounded by the
+        # lateness allowance) to find or insert its bucket.
+        position = len(buckets) - 1
+        while position >= 0 and buckets[position][0] > index:
+            position -= 1
+        if position >= 0 and buckets[position][0] == index:
+            return buckets[position][1]
+        counts = Counter()
+        buckets.insert(position + 1, (index, counts))
+        return counts
+
+    def _evict(self, watermark: float) -> None:
+        horizon = watermark - self.window_seconds
+        buckets = self._buckets
+        while buckets and (buckets[0][0] + 1) * self.bucket_seconds <= horizon:
+            _, counts = buckets.popleft()
+            self.totals.subtract(counts)
+            for key in counts:
+                if self.totals[key] <= 0:
+                    del self.totals[key]
+
+class AlertEngine:
+    """
+    Evaluates ``alerting.critical_error_threshold`` over a sliding window of
+    ``alerting.lookback_minutes``.
+
+    Events are fed in as they are parsed; an alert is raised when the number
+    of CRITICAL events in the window reaches the threshold, and the engine
+    re-arms once the windowed count drops below it again. Events may arrive
+    out of order by up to ``alerting.allowed_lateness_seconds``; batches
+    passed to ``observe_all`` are put in time order first.
+    """
+
+    SEVERITY = "CRITICAL"
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        alerting_cfg = config.get("alerting", {})
+        self.threshold = int(alerting_cfg.get("critical_error_threshold", 1))
+        self.lookback_minutes = float(alerting_cfg.get("lookback_minutes", 60))
+        self.counter = WindowedCounter(
+            window_seconds=self.lookback_minutes * 60,
+            bucket_seconds=float(alerting_cfg.get("bucket_seconds", 60)),
+            allowed_lateness=float(alerting_cfg.get("allowed_lateness_seconds", 300)),
+        )
+        self.alerts: List[Dict[str, Any]] = []
+        self.peak_count = 0
+        self._subsystems: set[str] = set()
+        self._active = False
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def critical_count(self) -> int:
+        return self.counter.count((None, self.SEVERITY))
+
+    def observe(self, ev: ErrorEvent) -> Optional[Dict[str, Any]]:
+        return self.observe_fields(ev.timestamp.timestamp(), ev.subsystem, ev.severity)
+
+    def observe_all(self, events: Iterable[ErrorEvent]) -> List[Dict[str, Any]]:
+        """
+        Feed a batch of events (a list or an ``EventTable``) and return the
+        alerts it raised.
+
+        The whole batch is at hand, so none of it is late: events are fed in
+        timestamp order (stable, so ties keep their order) rather than in
+        file order, where the lateness cutoff would drop them.
+        """
+        raised = len(self.alerts)
+        observe_fields = self.observe_fields
+        if isinstance(events, EventTable):
+            timestamps = events.timestamps
+            subsystems = events.subsystem.values
+            severities = events.severity.values
+            sub_codes = events.subsystem.codes
+            sev_codes = events.severity.codes
+            for row in sorted(range(len(timestamps)), key=timestamps.__getitem__):
+                observe_fields(
+                    timestamps[row] / 1_000_000,
+                    subsystems[sub_codes[row]],
+                    severities[sev_codes[row]],
+                )
+        else:
+            fields = sorted(
+                ((ev.timestamp.timestamp(), ev.subsystem, ev.severity) for ev in events),
+                key=itemgetter(0),
+            )
+            for timestamp, subsystem, severity in fields:
+                observe_fields(timestamp, subsystem, severity)
+        return self.alerts[raised:]
+
+    def observe_fields(
+        self, timestamp: float, subsystem: str, severity: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Count one event; return the alert if this event raised one.
+        """
+        if not self.counter.add(timestamp, (subsystem, severity), (None, severity)):
+            return None
+        self._subsystems.add(subsystem)
+
+        count = self.critical_count()
+        if count > self.peak_count:
+            self.peak_count = count
+
+        if count < self.threshold:
+            self._active = False
+            return None
+        if self._active:
+            return None
+
+        self._active = True
+        alert = {
+            "window_end": datetime.fromtimestamp(
+                self.counter.watermark, tz=timezone.utc  # type: ignore[arg-type]
+            ),
+            "lookback_minutes": self.lookback_minutes,
+            "count": count,
+            "threshold": self.threshold,
+            "by_subsystem": {
+                sub: n
+                for sub in sorted(self._subsystems)
+                if (n := self.counter.count((sub, self.SEVERITY)))
+            },
+        }
+        self.alerts.append(alert)
+        return alert
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Return the window and alert state as JSON-serializable data; alerts
+        already raised are not kept.
+        """
+        return {
+            "counter": self.counter.to_state(),
+            "peak_count": self.peak_count,
+            "subsystems": sorted(self._subsystems),
+            "active": self._active,
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> bool:
+        """
+        Continue from ``to_state`` output. The state is ignored unless it was
+        built with the same window, bucket width and lateness; returns
+        whether it was loaded.
+        """
+        counter = WindowedCounter.from_state(state["counter"])
+        current = self.counter
+        if (counter.window_seconds, counter.bucket_seconds, counter.allowed_lateness) != (
+            current.window_seconds,
+            current.bucket_seconds,
+            current.allowed_lateness,
+        ):
+            return False
+        self.counter = counter
+        self.peak_count = int(state["peak_count"])
+        self._subsystems = set(state["subsystems"])
+        self._active = bool(state["active"])
+        return True
\ No newline at end of file
@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .error_parser import ErrorEvent
+from .event_dedup import Episode
+from .event_table import EventTable, from_epoch_us, to_epoch_us
+
+# File layout (all integers little-endian):
+#
+#   header   magic (8 bytes) | version (u16) | padding (2) | event count (i64)
+#   records  body length (u32) | tag (u8) | body
+#
+# A string record (TAG_STRING) holds UTF-8 text and implicitly takes the next
+# dictionary id, starting from 0. It always precedes the first event that
+# refers to it, so the file can be written and read in a single pass. An
+# event record (TAG_EVENT) holds EVENT_BODY followed by the UTF-8 telemetry
+# id, which is rarely repeated and therefore kept inline. An episode record
+# (TAG_EPISODE, since version 2) holds EPISODE_BODY followed by the telemetry
+# id. The event count is -1 until the writer is closed.
+MAGIC = b"HWEVENTS"
+VERSION = 2
+# Version 1 files are version 2 files without episode records
+READABLE_VERSIONS = (1, 2)
+HEADER = struct.Struct("<8sHxxq")
+RECORD_HEADER = struct.Struct("<IB")
+# timestamp (epoch µs), subsystem, error_code, severity and description ids,
+# resolved flag
+EVENT_BODY = struct.Struct("<qIIIIB")
+# EVENT_BODY, then the last occurrence (epoch µs) and occurrence count
+EPISODE_BODY = struct.Struct("<qIIIIBqI")
+
+TAG_STRING = 0
+TAG_EVENT = 1
+TAG_EPISODE = 2
+
+UNKNOWN_COUNT = -1
+
+# Buffered bytes after which the writer hands data to the file
+_FLUSH_BYTES = 1 << 20
+_TIMESTAMP_MEMO_SIZE = 4096
+
+# The last two fields are the last occurrence (None for a plain event) and
+# the occurrence count (1 for a plain event)
+EventFields = Tuple[int, str, str, str, str, str, bool, Optional[int], int]
+
+def is_binary_event_file(path: Path) -> bool:
+    """
+    Check the magic bytes of ``path`` without reading the rest of the file.
+    """
+    try:
+        with path.open("rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+class BinaryEventWriter:
+    """
+    Write events in the binary format read by ``BinaryEventReader``.
+
+    Subsystem, error code, severity and description are written to an inline
+    string dictionary the first time they occur and referenced by id after
+    that. Episodes keep their last occurrence and count. The event count in
+    the header is filled in on ``close``. With ``append`` the events follow
+    those already in ``path``, if it exists, and reuse its dictionary;
+    ``count`` only covers the ones written by this writer.
+    """
+
+    def __init__(self, path: Path, append: bool = False) -> None:
+        self.path = path
+        self.append = append
+        self.count = 0
+        self._f: Optional[BinaryIO] = None
+        self._strings: Dict[str, int] = {}
+        self._buf = bytearray()
+        self._existing = 0
+
+    def __enter__(self) -> "BinaryEventWriter":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def open(self) -> None:
+        if self.append and self.path.exists() and self.path.stat().st_size:
+            with BinaryEventReader(self.path) as reader:
+                if reader.count is None:
+                    raise ValueError(f"Cannot append to unfinished binary event file {self.path}")
+                self._existing = reader.count
+                self._strings = {value: i for i, value in enumerate(reader.strings())}
+            self._f = self.path.open("r+b")
+        else:
+            self._f = self.path.open("wb")
+        self._f.write(HEADER.pack(MAGIC, VERSION, UNKNOWN_COUNT))
+        self._f.seek(0, os.SEEK_END)
+
+    def _string_id(self, value: str) -> int:
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = self._strings[value] = len(self._strings)
+            data = value.encode("utf-8")
+            self._buf += RECORD_HEADER.pack(len(data), TAG_STRING)
+            self._buf += data
+        return string_id
+
+    def write(self, event: ErrorEvent) -> None:
+        if self._f is None:
+            raise RuntimeError("Writer is not open")
+        string_id = self._string_id
+        fields = (
+            to_epoch_us(event.timestamp),
+            string_id(event.subsystem),
+            string_id(event.error_code),
+            string_id(event.severity),
+            string_id(event.description),
+            1 if event.resolved else 0,
+        )
+        if type(event) is Episode:
+            tag = TAG_EPISODE
+            body = EPISODE_BODY.pack(
+                *fields, to_epoch_us(event.last_timestamp), event.count  # type: ignore[arg-type]
+            )
+        else:
+            tag = TAG_EVENT
+            body = EVENT_BODY.pack(*fields)
+        body += event.telemetry_id.encode("utf-8")
+        self._buf += RECORD_HEADER.pack(len(body), tag)
+        self._buf += body
+        self.count += 1
+        if len(self._buf) >= _FLUSH_BYTES:
+            self._f.write(self._buf)
+            self._buf.clear()
+
+    def close(self) -> None:
+        if self._f is None:
+            return
+        self._f.write(self._buf)
+        self._buf.clear()
+        self._f.seek(0)
+        self._f.write(HEADER.pack(MAGIC, VERSION, self._existing + self.count))
+        self._f.close()
+        self._f = None
+
+class BinaryEventReader:
+    """
+    Memory-mapped reader for the binary event format written by
+    ``BinaryEventWriter``.
+
+    Records are decoded straight from the mapping, so no JSON is parsed and
+    the file contents never have to be copied into a Python buffer.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._f = path.open("rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._f.close()
+            raise ValueError(f"Empty binary event file: {path}") from None
+
+        if len(self._mm) < HEADER.size:
+            self.close()
+            raise ValueError(f"Truncated binary event file: {path}")
+        magic, version, count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a binary event file: {path}")
+        if version not in READABLE_VERSIONS:
+            self.close()
+            raise ValueError(f"Unsupported binary event format version {version} in {path}")
+        self.count: Optional[int] = None if count == UNKNOWN_COUNT else count
+
+    def __enter__(self) -> "BinaryEventReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._f.close()
+
+    def strings(self) -> List[str]:
+        """
+        Return the string dictionary in id order, skipping over the events.
+        """
+        mm = self._mm
+        if mm is None:
+            raise ValueError("Reader is closed")
+        strings: List[str] = []
+        end = len(mm)
+        pos = HEADER.size
+        while pos < end:
+            if pos + RECORD_HEADER.size > end:
+                raise ValueError(f"Truncated record at byte {pos} in {self.path}")
+            length, tag = RECORD_HEADER.unpack_from(mm, pos)
+            start = pos + RECORD_HEADER.size
+            pos = start + length
+            if pos > end:
+                raise ValueError(f"Truncated record at byte {start} in {self.path}")
+            if tag == TAG_STRING:
+                strings.append(mm[start:pos].decode("utf-8"))
+        return strings
+
+    def iter_fields(self) -> Iterator[EventFields]:
+        """
+        Yield ``(timestamp_us, subsystem, error_code, severity, description,
+        telemetry_id, resolved, last_timestamp_us, count)`` for each event in
+        file order; ``last_timestamp_us`` is None unless it is an episode.
+        """
+        mm = self._mm
+        if mm is None:
+            raise ValueError("Reader is closed")
+        strings: List[str] = []
+        end = len(mm)
+        pos = HEADER.size
+        record_header = RECORD_HEADER.unpack_from
+        event_body = EVENT_BODY.unpack_from
+        episode_body = EPISODE_BODY.unpack_from
+        header_size = RECORD_HEADER.size
+        body_size = EVENT_BODY.size
+        episode_size = EPISODE_BODY.size
+
+        while pos < end:
+            if pos + header_size > end:
+                raise ValueError(f"Truncated record at byte {pos} in {self.path}")
+            length, tag = record_header(mm, pos)
+            start = pos + header_size
+            pos = start + length
+            if pos > end:
+                raise ValueError(f"Truncated record at byte {start} in {self.path}")
+
+            if tag == TAG_EVENT:
+                ts_us, sub, code, sev, desc, resolved = event_body(mm, start)
+                yield (
+                    ts_us,
+                    strings[sub],
+                    strings[code],
+                    strings[sev],
+                    strings[desc],
+                    mm[start + body_size:pos].decode("utf-8"),
+                    bool(resolved),
+                    None,
+                    1,
+                )
+            elif tag == TAG_STRING:
+                strings.append(mm[start:pos].decode("utf-8"))
+            elif tag == TAG_EPISODE:
+                ts_us, sub, code, sev, desc, resolved, last_us, count = episode_body(mm, start)
+                yield (
+                    ts_us,
+                    strings[sub],
+                    strings[code],
+                    strings[sev],
+                    strings[desc],
+                    mm[start + episode_size:pos].decode("utf-8"),
+                    bool(resolved),
+                    last_us,
+                    count,
+                )
+            else:
+                raise ValueError(f"Unknown record tag {tag} at byte {start} in {self.path}")
+
+    def __iter__(self) -> Iterator[ErrorEvent]:
+        # Telemetry bursts share timestamps, so equal values share one datetime
+        timestamps: Dict[int, datetime] = {}
+        for ts_us, sub, code, sev, desc, telemetry_id, resolved, last_us, count in (
+            self.iter_fields()
+        ):
+            timestamp = timestamps.get(ts_us)
+            if timestamp is None:
+                if len(timestamps) >= _TIMESTAMP_MEMO_SIZE:
+                    timestamps.clear()
+                timestamp = timestamps[ts_us] = from_epoch_us(ts_us)
+            if last_us is None:
+                yield ErrorEvent(timestamp, sub, code, sev, desc, telemetry_id, resolved)
+            else:
+                yield Episode(
+                    timestamp,
+                    sub,
+                    code,
+                    sev,
+                    desc,
+                    telemetry_id,
+                    resolved,
+                    from_epoch_us(last_us),
+                    count,
+                )
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield events as raw telemetry records, so binary exports can be fed
+        back through the regular ingestion path. Episodes also carry
+        ``last_timestamp`` and ``count``.
+        """
+        for ts_us, sub, code, sev, desc, telemetry_id, resolved, last_us, count in (
+            self.iter_fields()
+        ):
+            record: Dict[str, Any] = {
+                "timestamp": from_epoch_us(ts_us),
+                "subsystem": sub,
+                "error_code": code,
+                "severity": sev,
+                "description": desc,
+                "telemetry_id": telemetry_id,
+                "resolved": resolved,
+            }
+            if last_us is not None:
+                record["last_timestamp"] = from_epoch_us(last_us)
+                record["count"] = count
+            yield record
+
+    def table(self) -> EventTable:
+        """
+        Load every event into an ``EventTable`` without building
+        ``ErrorEvent`` objects. The table has no episode columns, so files
+        holding episodes are rejected.
+        """
+        table = EventTable()
+        timestamps = table.timestamps
+        for ts_us, sub, code, sev, desc, telemetry_id, resolved, last_us, _ in (
+            self.iter_fields()
+        ):
+            if last_us is not None:
+                raise ValueError(f"{self.path} holds episodes, which an EventTable cannot store")
+            row = len(timestamps)
+            timestamps.append(ts_us)
+            table.subsystem.append(sub)
+            table.error_code.append(code)
+            table.severity.append(sev)
+            table.description.append(desc)
+            table.telemetry_id.append(telemetry_id)
+            if row % 8 == 0:
+                table.resolved_bits.append(0)
+            if resolved:
+                table.resolved_bits[row >> 3] |= 1 << (row & 7)
+        return table
+
+def iter_binary_records(path: Path) -> Iterator[Dict[str, Any]]:
+    with BinaryEventReader(path) as reader:
+        yield from reader.records()
+
+def read_binary_events(path: Path) -> List[ErrorEvent]:
+    with BinaryEventReader(path) as reader:
+        return list(reader)
+
+def write_binary_events(events: Iterable[ErrorEvent], path: Path) -> int:
+    with BinaryEventWriter(path) as writer:
+        for ev in events:
+            writer.write(ev)
+    return writer.count
\ No newline at end of file
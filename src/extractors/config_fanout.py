@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from .error_parser import ErrorEvent
+from .field_schema import FieldSchema, normalize_severity_value
+
+# Distinct severities of one raw value, and the index into them per level map
+_Plan = Tuple[Tuple[str, ...], Tuple[int, ...]]
+
+class SeverityFanout:
+    """
+    Normalizes events parsed once with their raw severity (see
+    ``iter_parse_events(..., raw_severity=True)``) under several severity
+    level maps, so configurations that only differ after field extraction
+    can share one parse.
+
+    ``fan_out`` returns the events once per level map. Maps that agree on
+    the severity of an event get the same event object, the parsed one, so
+    nothing is copied where the maps agree; events must therefore not be
+    modified downstream. The severities of a raw value are worked out once
+    per distinct raw string.
+    """
+
+    # Distinct raw severity strings remembered before the memo starts over
+    MEMO_LIMIT = 4096
+
+    def __init__(self, severity_levels: Sequence[Dict[str, int]]) -> None:
+        if not severity_levels:
+            raise ValueError("At least one severity level map is required")
+        self.severity_levels = list(severity_levels)
+        self._plans: Dict[str, _Plan] = {}
+
+    @classmethod
+    def from_configs(cls, configs: Sequence[Dict[str, Any]]) -> "SeverityFanout":
+        """
+        Raises ValueError unless the configurations read records the same way,
+        i.e. agree on ``field_aliases``.
+        """
+        schemas = [FieldSchema.from_config(config) for config in configs]
+        if any(schema.aliases != schemas[0].aliases for schema in schemas[1:]):
+            raise ValueError("Configurations evaluated together must share field_aliases")
+        return cls([schema.severity_levels for schema in schemas])
+
+    def _plan(self, raw: Any) -> _Plan:
+        severities = [normalize_severity_value(raw, levels) for levels in self.severity_levels]
+        distinct = tuple(dict.fromkeys(severities))
+        plan = (distinct, tuple(distinct.index(severity) for severity in severities))
+        if type(raw) is str:
+            if len(self._plans) >= self.MEMO_LIMIT:
+                self._plans.clear()
+            self._plans[raw] = plan
+        return plan
+
+    def fan_out(self, events: Iterable[ErrorEvent]) -> List[List[ErrorEvent]]:
+        """
+        Return the events normalized under each level map, one list per map
+        in the order the maps were given.
+        """
+        outputs: List[List[ErrorEvent]] = [[] for _ in self.severity_levels]
+        appends = [output.append for output in outputs]
+        plans = self._plans
+        for ev in events:
+            raw = ev.severity
+            plan = plans.get(raw) if type(raw) is str else None
+            if plan is None:
+                plan = self._plan(raw)
+            distinct, index = plan
+            ev.severity = distinct[0]
+            if len(distinct) == 1:
+                for append in appends:
+                    append(ev)
+                continue
+            variants = [ev]
+            for severity in distinct[1:]:
+                variants.append(
+                    ErrorEvent(
+                        ev.timestamp,
+                        ev.subsystem,
+                        ev.error_code,
+                        severity,
+                        ev.description,
+                        ev.telemetry_id,
+                        ev.resolved,
+                    )
+                )
+            for append, position in zip(appends, index):
+                append(variants[position])
+        return outputs
\ No newline at end of file
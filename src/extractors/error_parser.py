@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import heapq
 import logging
+import os
 from collections import Counter, defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from itertools import repeat
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from .utils_time import parse_timestamp
+from .field_schema import FieldExtractor, FieldSchema
+from .heavy_hitters import SpaceSaving
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEvent:
     timestamp: "datetime.datetime"
     subsystem: str
@@ -19,122 +25,496 @@ class ErrorEvent:
     telemetry_id: str
     resolved: bool
 
-def _normalize_severity(raw: Any, severity_levels: Dict[str, int]) -> str:
-    if raw is None:
-        return "UNKNOWN"
+def _top_k_capacity(config: Dict[str, Any]) -> Optional[int]:
+    capacity = config.get("aggregation", {}).get("top_k_capacity")
+    return int(capacity) if capacity is not None else None
 
-    text = str(raw).strip()
-    if not text:
-        return "UNKNOWN"
+# Records handed to a worker process at a time when parsing in parallel
+DEFAULT_CHUNK_SIZE = 5000
 
-    key = text.upper()
-    if key in severity_levels:
-        return key
-
-    # Simple mapping for common variants
-    aliases = {
-        "INFO": "LOW",
-        "WARN": "MEDIUM",
-        "WARNING": "MEDIUM",
-        "ERR": "HIGH",
-        "FATAL": "CRITICAL",
-    }
-    if key in aliases and aliases[key] in severity_levels:
-        return aliases[key]
+def available_cpus() -> int:
+    """
+    CPUs this process may run on, which in a container or under taskset can
+    be fewer than ``os.cpu_count()``.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
 
-    return "UNKNOWN"
+def effective_workers(workers: int) -> int:
+    """
+    Worker processes actually used for ``workers`` requested: at most one per
+    available CPU, since parse workers are CPU-bound and extra ones only add
+    start-up and pickling cost (see benchmarks/bench_workers.py).
+    """
+    return max(1, min(workers, available_cpus()))
 
 def parse_events(
-    raw_events: List[Dict[str, Any]], config: Dict[str, Any]
+    raw_events: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> List[ErrorEvent]:
     """
     Convert raw telemetry objects into normalized ErrorEvent instances.
+
+    With ``workers > 1`` the records are split into chunks of ``chunk_size``
+    and parsed in a process pool of at most one worker per available CPU.
+    Results are reassembled in input order and failures are logged with their
+    original record index, so the output is identical to the serial path.
+    """
+    workers = effective_workers(workers)
+    if workers <= 1 or len(raw_events) <= chunk_size:
+        return list(iter_parse_events(raw_events, config))
+
+    events, _ = _parse_parallel(
+        raw_events, FieldSchema.from_config(config), workers, chunk_size, aggregate=False
+    )
+    return events
+
+def parse_and_aggregate(
+    raw_events: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[List[ErrorEvent], "EventAggregator"]:
+    """
+    Parse ``raw_events`` and aggregate them in the same pass.
+
+    In parallel mode every worker pre-aggregates its own chunk and the partial
+    aggregates are merged in chunk order.
+    """
+    workers = effective_workers(workers)
+    if workers <= 1 or len(raw_events) <= chunk_size:
+        events = list(iter_parse_events(raw_events, config))
+        aggregator = EventAggregator.from_config(config)
+        aggregator.update(events)
+        return events, aggregator
+
+    events, aggregator = _parse_parallel(
+        raw_events,
+        FieldSchema.from_config(config),
+        workers,
+        chunk_size,
+        aggregate=True,
+        top_k_capacity=_top_k_capacity(config),
+    )
+    return events, aggregator
+
+def parse_event_table(
+    raw_events: Sequence[Dict[str, Any]],
+    config: Dict[str, Any],
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> "EventTable":
+    """
+    Parse ``raw_events`` straight into a columnar ``EventTable``.
+
+    Accepts the same options as ``parse_events`` and yields the same events,
+    without keeping an ErrorEvent object per record.
+    """
+    from .event_table import EventTable
+
+    workers = effective_workers(workers)
+    if workers <= 1 or len(raw_events) <= chunk_size:
+        table, failures, _ = _parse_chunk(
+            0, raw_events, FieldSchema.from_config(config), False, columnar=True
+        )
+        _log_failures(failures)
+        return table  # type: ignore[return-value]
+
+    table, _ = _parse_parallel(
+        raw_events,
+        FieldSchema.from_config(config),
+        workers,
+        chunk_size,
+        aggregate=False,
+        columnar=True,
+    )
+    return table  # type: ignore[return-value]
+
+def parse_sources(
+    paths: Sequence[Path],
+    config: Dict[str, Any],
+    workers: int = 1,
+    cache: Optional["ParsedEventCache"] = None,
+    since: Optional["datetime.datetime"] = None,
+    until: Optional["datetime.datetime"] = None,
+) -> Tuple[List[ErrorEvent], int]:
+    """
+    Read and parse several telemetry files, one file per task, and return
+    their events merged in timestamp order with the number of raw records
+    read.
+
+    The events are those ``MergedTelemetry`` yields over the same files:
+    every file's events in timestamp order, merged, with equal timestamps
+    kept in file order and only events in ``[since, until)``. Failure
+    indices refer to the records of all files in ``paths`` order.
+
+    With a ``cache``, unchanged sources are loaded from it and only the rest
+    are parsed (and then cached), so a run over many files only parses the
+    new and changed ones. Parse failures are only logged when a source is
+    actually parsed.
+    """
+    schema = FieldSchema.from_config(config)
+
+    cached: Dict[Path, Tuple[List[ErrorEvent], EventAggregator, int]] = {}
+    fingerprints: Dict[Path, Tuple[int, int, str]] = {}
+    if cache is not None:
+        for path in paths:
+            try:
+                fingerprints[path] = cache.fingerprint(path)
+            except OSError:
+                continue  # Reported when the source is read
+            hit = cache.load(path, config, fingerprint=fingerprints[path])
+            if hit is not None:
+                cached[path] = hit
+
+    def store(path: Path, result: _ChunkResult, count: int) -> None:
+        if cache is not None:
+            source_events, _, partial = result
+            cache.store(
+                path, config, source_events, partial, count, fingerprints.get(path)
+            )
+
+    to_parse = [path for path in paths if path not in cached]
+    workers = effective_workers(workers)
+    if workers <= 1 or len(to_parse) <= 1:
+        results = map(_parse_source, to_parse, repeat(schema))
+        per_source, offset = _collect_sources(paths, results, cached, store)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_parse_source, to_parse, repeat(schema))
+            per_source, offset = _collect_sources(paths, results, cached, store)
+
+    merged: Iterable[ErrorEvent] = heapq.merge(*per_source, key=attrgetter("timestamp"))
+    if since is not None or until is not None:
+        merged = (
+            ev
+            for ev in merged
+            if (since is None or ev.timestamp >= since) and (until is None or ev.timestamp < until)
+        )
+    events = list(merged)
+    logger.debug("Parsed %d of %d records from %d sources", len(events), offset, len(paths))
+    return events, offset
+
+def iter_parse_events(
+    raw_events: Iterable[Dict[str, Any]],
+    config: Dict[str, Any],
+    raw_severity: bool = False,
+) -> Iterator[ErrorEvent]:
+    """
+    Lazily convert a stream of raw telemetry objects into ErrorEvent instances.
+
+    Records that fail to parse are logged and skipped, exactly as in
+    ``parse_events``. With ``raw_severity`` events keep the severity value
+    of the record (see ``SeverityFanout``).
     """
-    severity_levels: Dict[str, int] = {
-        k.upper(): int(v)
-        for k, v in config.get("severity_levels", {}).items()
-    }
+    extract = FieldSchema.from_config(config).compile(raw_severity=raw_severity)
 
-    parsed: List[ErrorEvent] = []
     for idx, raw in enumerate(raw_events):
         try:
-            event = _parse_single(raw, severity_levels)
+            event = _parse_single(raw, extract)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Failed to parse event #%d: %s", idx, exc)
             continue
-        parsed.append(event)
+        yield event
 
-    return parsed
+_ChunkResult = Tuple[
+    Any, List[Tuple[int, BaseException]], Optional["EventAggregator"]
+]
 
-def _parse_single(raw: Dict[str, Any], severity_levels: Dict[str, int]) -> ErrorEvent:
-    from datetime import datetime  # Imported here to avoid circular type hints
+def _parse_chunk(
+    start: int,
+    records: Sequence[Dict[str, Any]],
+    schema: FieldSchema,
+    aggregate: bool,
+    columnar: bool = False,
+) -> _ChunkResult:
+    """
+    Worker entry point: parse one chunk, deferring failure logging to the caller.
 
-    ts_raw = raw.get("timestamp") or raw.get("time") or raw.get("ts")
-    if ts_raw is None:
-        raise ValueError("Missing timestamp field")
+    Events are returned as a list, or as an ``EventTable`` when ``columnar``.
+    """
+    failures: List[Tuple[int, BaseException]] = []
+    extract = schema.compile()
 
-    timestamp = parse_timestamp(str(ts_raw))
+    if columnar:
+        from .event_table import EventTable
 
-    subsystem = str(raw.get("subsystem") or raw.get("module") or "UNKNOWN").strip()
-    error_code = str(raw.get("error_code") or raw.get("code") or "UNKNOWN").strip()
-    description = str(
-        raw.get("description") or raw.get("message") or "No description provided"
-    ).strip()
-    telemetry_id = str(raw.get("telemetry_id") or raw.get("id") or "N/A").strip()
+        table = EventTable()
+        append_fields = table.append_fields
+        for offset, raw in enumerate(records):
+            try:
+                fields = extract(raw)
+            except Exception as exc:  # noqa: BLE001
+                failures.append((start + offset, exc))
+                continue
+            append_fields(*fields)
+        return table, failures, table.aggregate() if aggregate else None
 
-    severity_raw = raw.get("severity") or raw.get("level") or "UNKNOWN"
-    severity = _normalize_severity(severity_raw, severity_levels)
+    events: List[ErrorEvent] = []
+    aggregator = EventAggregator() if aggregate else None
 
-    resolved_raw = raw.get("resolved")
-    if isinstance(resolved_raw, bool):
-        resolved = resolved_raw
-    elif isinstance(resolved_raw, str):
-        resolved = resolved_raw.strip().lower() in {"true", "1", "yes", "y"}
+    for offset, raw in enumerate(records):
+        try:
+            event = _parse_single(raw, extract)
+        except Exception as exc:  # noqa: BLE001
+            failures.append((start + offset, exc))
+            continue
+        events.append(event)
+        if aggregator is not None:
+            aggregator.add(event)
+
+    return events, failures, aggregator
+
+def _log_failures(failures: Iterable[Tuple[int, BaseException]]) -> None:
+    for idx, exc in failures:
+        logger.error("Failed to parse event #%d: %s", idx, exc, exc_info=exc)
+
+def _parse_parallel(
+    raw_events: Sequence[Dict[str, Any]],
+    schema: FieldSchema,
+    workers: int,
+    chunk_size: int,
+    aggregate: bool,
+    columnar: bool = False,
+    top_k_capacity: Optional[int] = None,
+) -> Tuple[Any, "EventAggregator"]:
+    from concurrent.futures import ProcessPoolExecutor
+
+    if columnar:
+        from .event_table import EventTable
+
+        events: Any = EventTable()
     else:
-        resolved = False
-
-    return ErrorEvent(
-        timestamp=timestamp,
-        subsystem=subsystem or "UNKNOWN",
-        error_code=error_code or "UNKNOWN",
-        severity=severity,
-        description=description,
-        telemetry_id=telemetry_id,
-        resolved=resolved,
-    )
+        events = []
+    # Chunk partials stay exact (bounded by chunk_size); only the total is sketched
+    aggregator = EventAggregator(top_k_capacity)
+    starts = range(0, len(raw_events), chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            _parse_chunk,
+            starts,
+            (raw_events[start:start + chunk_size] for start in starts),
+            repeat(schema),
+            repeat(aggregate),
+            repeat(columnar),
+        )
+        # map() yields in submission order, which keeps the merge deterministic
+        for chunk_events, failures, partial in results:
+            _log_failures(failures)
+            events.extend(chunk_events)
+            if partial is not None:
+                aggregator.merge(partial)
+
+    return events, aggregator
+
+def _parse_source(
+    path: Path, schema: FieldSchema
+) -> Tuple[int, _ChunkResult, Optional[BaseException]]:
+    from .telemetry_reader import _read_source
 
-def aggregate_events(events: List[ErrorEvent]) -> Dict[str, Any]:
+    records, error = _read_source(path)
+    return len(records), _parse_chunk(0, records, schema, True), error
+
+def _collect_sources(
+    paths: Sequence[Path],
+    results: Iterable[Tuple[int, _ChunkResult, Optional[BaseException]]],
+    cached: Dict[Path, Tuple[List[ErrorEvent], "EventAggregator", int]],
+    store: Callable[[Path, _ChunkResult, int], None],
+) -> Tuple[List[List[ErrorEvent]], int]:
     """
-    Compute high-level statistics about the error stream.
+    Gather the events of every source in ``paths`` order, with the number of
+    raw records read. ``results`` covers the sources missing from
+    ``cached``; successfully read ones go to ``store``.
+    """
+    from .telemetry_reader import _log_source_error
+
+    results = iter(results)
+    per_source: List[List[ErrorEvent]] = []
+    offset = 0
+    for path in paths:
+        if path in cached:
+            source_events, _, count = cached[path]
+        else:
+            count, result, error = next(results)
+            source_events, failures, _ = result
+            if error is not None:
+                _log_source_error(path, error)
+            else:
+                store(path, result, count)
+            _log_failures((offset + idx, exc) for idx, exc in failures)
+        per_source.append(source_events)
+        offset += count
+    return per_source, offset
+
+def _parse_single(raw: Dict[str, Any], extract: FieldExtractor) -> ErrorEvent:
+    return ErrorEvent(*extract(raw))
+
+class EventAggregator:
     """
-    by_severity: Counter[str] = Counter()
-    by_subsystem: Counter[str] = Counter()
-    error_pairs: Counter[Tuple[str, str]] = Counter()
-    unresolved_by_subsystem: Dict[str, int] = defaultdict(int)
+    Online accumulator for the statistics produced by ``aggregate_events``.
+
+    Events are folded in one at a time with ``add``; partial aggregators built
+    over different parts of a stream (e.g. by parallel workers) can be combined
+    with ``merge``. Merging partials in stream order yields exactly the same
+    snapshot as adding every event to a single aggregator.
+
+    By default ``error_pairs`` is an exact Counter over every distinct
+    (subsystem, error_code) pair. With ``top_k_capacity`` set it is a
+    ``SpaceSaving`` sketch monitoring at most that many pairs instead, so
+    memory stays bounded however many distinct codes the stream holds. Counts
+    are exact as long as the number of distinct pairs fits the capacity; past
+    that, ``top_error_patterns`` reports how far each count may overestimate.
+    """
+
+    TOP_PATTERNS = 10
 
-    for ev in events:
-        by_severity[ev.severity] += 1
-        by_subsystem[ev.subsystem] += 1
-        error_pairs[(ev.subsystem, ev.error_code)] += 1
+    def __init__(self, top_k_capacity: Optional[int] = None) -> None:
+        self.top_k_capacity = top_k_capacity
+        self.total_events = 0
+        self.by_severity: Counter[str] = Counter()
+        self.by_subsystem: Counter[str] = Counter()
+        self.error_pairs: Any = (
+            Counter() if top_k_capacity is None else SpaceSaving(top_k_capacity)
+        )
+        self.unresolved_by_subsystem: Dict[str, int] = defaultdict(int)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "EventAggregator":
+        return cls(_top_k_capacity(config))
+
+    def __len__(self) -> int:
+        return self.total_events
+
+    def add(self, ev: ErrorEvent) -> None:
+        self.total_events += 1
+        self.by_severity[ev.severity] += 1
+        self.by_subsystem[ev.subsystem] += 1
+        if self.top_k_capacity is None:
+            self.error_pairs[(ev.subsystem, ev.error_code)] += 1
+        else:
+            self.error_pairs.add((ev.subsystem, ev.error_code))
         if not ev.resolved:
-            unresolved_by_subsystem[ev.subsystem] += 1
+            self.unresolved_by_subsystem[ev.subsystem] += 1
+
+    def update(self, events: Iterable[ErrorEvent]) -> None:
+        for ev in events:
+            self.add(ev)
+
+    def merge(self, other: "EventAggregator") -> None:
+        """
+        Fold the counts of ``other`` into this aggregator.
 
-    top_error_patterns = [
-        {
-            "subsystem": sub,
-            "error_code": code,
-            "count": count,
+        Merging a sketched aggregator into an exact one switches this one to
+        a sketch of the same capacity.
+        """
+        if self.top_k_capacity is None and other.top_k_capacity is not None:
+            sketch = SpaceSaving(other.top_k_capacity)
+            sketch.update(self.error_pairs)
+            self.error_pairs = sketch
+            self.top_k_capacity = other.top_k_capacity
+
+        self.total_events += other.total_events
+        self.by_severity.update(other.by_severity)
+        self.by_subsystem.update(other.by_subsystem)
+        self.error_pairs.update(other.error_pairs)
+        for sub, count in other.unresolved_by_subsystem.items():
+            self.unresolved_by_subsystem[sub] += count
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Return the raw counts as JSON-serializable data, in insertion order.
+        """
+        state: Dict[str, Any] = {
+            "total_events": self.total_events,
+            "by_severity": list(self.by_severity.items()),
+            "by_subsystem": list(self.by_subsystem.items()),
+            "unresolved_by_subsystem": list(self.unresolved_by_subsystem.items()),
         }
-        for (sub, code), count in error_pairs.most_common(10)
-    ]
-
-    summary: Dict[str, Any] = {
-        "total_events": len(events),
-        "by_severity": dict(by_severity),
-        "by_subsystem": dict(by_subsystem),
-        "top_error_patterns": top_error_patterns,
-        "unresolved_by_subsystem": dict(unresolved_by_subsystem),
-    }
+        if self.top_k_capacity is None:
+            state["error_pairs"] = [
+                [sub, code, count] for (sub, code), count in self.error_pairs.items()
+            ]
+        else:
+            state["error_pairs_sketch"] = self.error_pairs.to_state()
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "EventAggregator":
+        """
+        Rebuild an aggregator from ``to_state`` output.
+        """
+        aggregator = cls()
+        aggregator.total_events = int(state["total_events"])
+        aggregator.by_severity.update(dict(state["by_severity"]))
+        aggregator.by_subsystem.update(dict(state["by_subsystem"]))
+        if "error_pairs_sketch" in state:
+            aggregator.error_pairs = SpaceSaving.from_state(state["error_pairs_sketch"])
+            aggregator.top_k_capacity = aggregator.error_pairs.capacity
+        else:
+            for sub, code, count in state["error_pairs"]:
+                aggregator.error_pairs[(sub, code)] = count
+        for sub, count in state["unresolved_by_subsystem"]:
+            aggregator.unresolved_by_subsystem[sub] = count
+        return aggregator
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the summary dict for everything added so far.
+
+        Once a sketch has had to evict pairs, every top pattern carries a
+        ``max_error`` (its true count lies in ``[count - max_error, count]``)
+        and the summary gains ``top_error_patterns_error_bound``, the largest
+        overestimate of any reported count.
+        """
+        approximate = self.top_k_capacity is not None and not self.error_pairs.exact
+        top_error_patterns = []
+        for (sub, code), count in self.error_pairs.most_common(self.TOP_PATTERNS):
+            pattern: Dict[str, Any] = {
+                "subsystem": sub,
+                "error_code": code,
+                "count": count,
+            }
+            if approximate:
+                pattern["max_error"] = self.error_pairs.error((sub, code))
+            top_error_patterns.append(pattern)
+
+        summary: Dict[str, Any] = {
+            "total_events": self.total_events,
+            "by_severity": dict(self.by_severity),
+            "by_subsystem": dict(self.by_subsystem),
+            "top_error_patterns": top_error_patterns,
+            "unresolved_by_subsystem": dict(self.unresolved_by_subsystem),
+        }
+        if approximate:
+            summary["top_error_patterns_error_bound"] = self.error_pairs.error_bound()
+        return summary
+
+def aggregate_events(
+    events: Iterable[ErrorEvent], top_k_capacity: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Compute high-level statistics about the error stream.
+
+    ``events`` is consumed once, so a generator can be passed to aggregate a
+    stream without materializing it. An ``EventTable`` is counted column-wise.
+    ``top_k_capacity`` bounds the memory used for ``top_error_patterns`` (see
+    ``EventAggregator``).
+    """
+    from .event_table import EventTable
+
+    if isinstance(events, EventTable):
+        aggregator = events.aggregate(top_k_capacity)
+    else:
+        aggregator = EventAggregator(top_k_capacity)
+        aggregator.update(events)
+    summary = aggregator.snapshot()
 
     logger.debug("Aggregation summary: %s", summary)
     return summary
\ No newline at end of file
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .binary_events import BinaryEventReader, write_binary_events
+from .error_parser import ErrorEvent, EventAggregator, _top_k_capacity
+from .field_schema import FieldSchema
+
+logger = logging.getLogger(__name__)
+
+# Bump when the parsing rules change in a way that alters normalized output,
+# so existing entries stop matching.
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 256
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+Fingerprint = Tuple[int, int, str]
+
+class ParsedEventCache:
+    """
+    On-disk cache of parsed events and their partial aggregate, per source file.
+
+    Entries are keyed by a hash of the file contents together with the
+    ``severity_levels`` used to normalize them, so a modified file, or the
+    same file read under a different configuration, never hits a stale
+    entry. The path, size and mtime of each source are remembered as well:
+    when they are unchanged the stored content hash is reused and the file is
+    not read at all. When only the mtime changed (a touched or re-copied
+    archive), the hash is recomputed and still hits.
+
+    Events are stored in the binary event format and the aggregate as
+    ``EventAggregator`` state. The least recently used entries are evicted
+    once the cache holds more than ``max_bytes`` or ``max_entries``.
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._index = self._load_index()
+        # Apply the limits right away in case they were lowered
+        if len(self) > max_entries or self.nbytes() > max_bytes:
+            self._evict()
+            self._save_index()
+
+    @classmethod
+    def from_config(
+        cls, config: Dict[str, Any], base_dir: Path
+    ) -> "ParsedEventCache":
+        cache_cfg = config.get("cache", {})
+        directory = Path(cache_cfg.get("directory", "data/cache"))
+        if not directory.is_absolute():
+            directory = base_dir / directory
+        max_megabytes = cache_cfg.get("max_megabytes")
+        return cls(
+            directory,
+            max_bytes=int(max_megabytes * 1024 * 1024)
+            if max_megabytes is not None
+            else DEFAULT_MAX_BYTES,
+            max_entries=int(cache_cfg.get("max_entries", DEFAULT_MAX_ENTRIES)),
+        )
+
+    def _load_index(self) -> Dict[str, Any]:
+        empty: Dict[str, Any] = {"version": CACHE_FORMAT_VERSION, "sources": {}, "entries": {}}
+        path = self.directory / self.INDEX_NAME
+        if not path.exists():
+            return empty
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable cache index %s: %s", path, exc)
+            return empty
+        if index.get("version") != CACHE_FORMAT_VERSION:
+            logger.info("Cache format changed; discarding %s", self.directory)
+            for key in index.get("entries", {}):
+                self._remove_files(key)
+            return empty
+        return index
+
+    def _save_index(self) -> None:
+        path = self.directory / self.INDEX_NAME
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, path)
+
+    def _events_path(self, key: str) -> Path:
+        return self.directory / f"{key}.events"
+
+    def _aggregate_path(self, key: str) -> Path:
+        return self.directory / f"{key}.aggregate.json"
+
+    def _remove_files(self, key: str) -> None:
+        for path in (self._events_path(key), self._aggregate_path(key)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        with path.open("rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def fingerprint(
+        self, path: Path, previous: Optional[Fingerprint] = None
+    ) -> Fingerprint:
+        """
+        Return ``(size, mtime_ns, content_hash)`` for ``path``.
+
+        The file is only hashed if its size or mtime differ from both the
+        remembered fingerprint and ``previous``.
+        """
+        st = path.stat()
+        known = self._index["sources"].get(str(path))
+        if known and known["size"] == st.st_size and known["mtime_ns"] == st.st_mtime_ns:
+            return st.st_size, st.st_mtime_ns, known["digest"]
+        if previous is not None and previous[:2] == (st.st_size, st.st_mtime_ns):
+            return previous
+        return st.st_size, st.st_mtime_ns, self._hash_file(path)
+
+    @staticmethod
+    def entry_key(digest: str, config: Dict[str, Any]) -> str:
+        """
+        Key of the entry for content ``digest`` parsed under ``config``; only
+        the settings that affect normalization or aggregation take part.
+        """
+        settings = FieldSchema.from_config(config).cache_key()
+        capacity = _top_k_capacity(config)
+        if capacity is not None:
+            settings += f"\0top_k={capacity}"
+        key = hashlib.blake2b(digest_size=16)
+        key.update(f"{CACHE_FORMAT_VERSION}\0{digest}\0{settings}".encode("utf-8"))
+        return key.hexdigest()
+
+    def _remember_source(self, path: Path, fingerprint: Fingerprint) -> None:
+        size, mtime_ns, digest = fingerprint
+        self._index["sources"][str(path)] = {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "digest": digest,
+        }
+
+    def load(
+        self,
+        path: Path,
+        config: Dict[str, Any],
+        columnar: bool = False,
+        fingerprint: Optional[Fingerprint] = None,
+    ) -> Optional[Tuple[Any, EventAggregator, int]]:
+        """
+        Return ``(events, aggregator, raw_count)`` for ``path`` if cached, where
+        ``events`` is a list of ``ErrorEvent`` (or an ``EventTable`` when
+        ``columnar``) and ``raw_count`` the number of raw records the source
+        held. Returns None on a miss.
+        """
+        fingerprint = self.fingerprint(path, fingerprint)
+        key = self.entry_key(fingerprint[2], config)
+        entry = self._index["entries"].get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        try:
+            with BinaryEventReader(self._events_path(key)) as reader:
+                events: Any = reader.table() if columnar else list(reader)
+            with self._aggregate_path(key).open("r", encoding="utf-8") as f:
+                aggregator = EventAggregator.from_state(json.load(f))
+        except (OSError, ValueError) as exc:
+            logger.warning("Dropping unreadable cache entry for %s: %s", path, exc)
+            self._drop(key)
+            self._save_index()
+            self.misses += 1
+            return None
+
+        entry["last_used"] = time.time()
+        self._remember_source(path, fingerprint)
+        self._save_index()
+        self.hits += 1
+        logger.info("Loaded %d parsed events for %s from cache", len(events), path)
+        return events, aggregator, int(entry["raw_count"])
+
+    def store(
+        self,
+        path: Path,
+        config: Dict[str, Any],
+        events: Iterable[ErrorEvent],
+        aggregator: EventAggregator,
+        raw_count: int,
+        fingerprint: Optional[Fingerprint] = None,
+    ) -> None:
+        """
+        Cache the parse result of ``path``.
+
+        ``fingerprint`` should be taken before the file was read; if the file
+        has changed since, nothing is stored.
+        """
+        current = self.fingerprint(path, fingerprint)
+        if fingerprint is not None and fingerprint != current:
+            logger.info("%s changed while being parsed; not caching it", path)
+            return
+        key = self.entry_key(current[2], config)
+
+        events_path = self._events_path(key)
+        tmp_path = events_path.with_name(events_path.name + ".tmp")
+        count = write_binary_events(events, tmp_path)
+        os.replace(tmp_path, events_path)
+        aggregate_path = self._aggregate_path(key)
+        tmp_path = aggregate_path.with_name(aggregate_path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(aggregator.to_state(), f)
+        os.replace(tmp_path, aggregate_path)
+
+        self._index["entries"][key] = {
+            "source": str(path),
+            "raw_count": raw_count,
+            "digest": current[2],
+            "events": count,
+            "bytes": events_path.stat().st_size + aggregate_path.stat().st_size,
+            "last_used": time.time(),
+        }
+        self._remember_source(path, current)
+        self._evict()
+        self._save_index()
+
+    def _drop(self, key: str) -> None:
+        self._index["entries"].pop(key, None)
+        self._remove_files(key)
+
+    def _evict(self) -> None:
+        entries = self._index["entries"]
+        total = sum(entry["bytes"] for entry in entries.values())
+        by_age = sorted(entries, key=lambda key: entries[key]["last_used"])
+        for key in by_age:
+            if total <= self.max_bytes and len(entries) <= self.max_entries:
+                break
+            total -= entries[key]["bytes"]
+            logger.debug("Evicting cached events for %s", entries[key]["source"])
+            self._drop(key)
+
+        # Forget fingerprints of sources whose contents are no longer cached
+        digests = {entry["digest"] for entry in entries.values()}
+        self._index["sources"] = {
+            path: source
+            for path, source in self._index["sources"].items()
+            if source["digest"] in digests
+        }
+
+    def clear(self) -> None:
+        for key in list(self._index["entries"]):
+            self._drop(key)
+        self._index["sources"] = {}
+        self._save_index()
+
+    def nbytes(self) -> int:
+        return sum(entry["bytes"] for entry in self._index["entries"].values())
+
+    def __len__(self) -> int:
+        return len(self._index["entries"])
\ No newline at end of file
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .error_parser import ErrorEvent
+from .field_schema import _severity_levels
+
+# Telemetry ID of records that carry none; never treated as a duplicate
+MISSING_ID = "N/A"
+
+@dataclass(slots=True)
+class Episode(ErrorEvent):
+    """
+    A burst of events with the same (subsystem, error_code) collapsed into
+    one record.
+
+    ``timestamp`` is the first occurrence and ``last_timestamp`` the last,
+    ``resolved`` is the state of the last occurrence and ``severity`` the
+    highest seen. Description and telemetry ID are those of the first event.
+    """
+
+    last_timestamp: Optional[datetime] = None
+    count: int = 1
+
+class RecentIds:
+    """
+    Set of recently seen keys with memory bounded by ``capacity`` keys.
+
+    Keys are kept in two generations of ``capacity // 2`` keys each: when
+    the current one fills up it replaces the previous one, which is
+    dropped. At any time the last ``capacity // 2`` distinct keys (and up
+    to ``capacity``) are remembered. A key seen again is carried over into
+    the current generation, so a key that keeps recurring is never forgotten.
+    """
+
+    __slots__ = ("capacity", "_generation", "_current", "_previous")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self._generation = capacity // 2
+        self._current: Set[Hashable] = set()
+        self._previous: Set[Hashable] = set()
+
+    def __len__(self) -> int:
+        return len(self._current | self._previous)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._current or key in self._previous
+
+    def seen(self, key: Hashable) -> bool:
+        """
+        Record ``key`` and return whether it was already remembered.
+        """
+        current = self._current
+        if key in current:
+            return True
+        found = key in self._previous
+        current.add(key)
+        if len(current) >= self._generation:
+            self._previous = current
+            self._current = set()
+        return found
+
+    def to_state(self) -> List[List[Hashable]]:
+        """
+        Return the previous and current generation as JSON-serializable lists.
+        """
+        return [list(self._previous), list(self._current)]
+
+    def load_state(self, state: List[List[Hashable]]) -> None:
+        previous, current = state
+        self._previous = set(previous)
+        self._current = set(current)
+
+class EventDeduplicator:
+    """
+    Drops repeated telemetry IDs and collapses bursts of one error pattern
+    into episodes, with memory bounded however long the stream runs.
+
+    ``unique`` drops events whose telemetry ID was seen recently, so
+    retransmitted records are counted once. ``RecentIds`` remembers between
+    ``id_capacity / 2`` and ``id_capacity`` distinct IDs; copies further
+    apart than that are not recognized as duplicates.
+
+    ``collapse`` folds events with the same (subsystem, error_code) that
+    follow each other within ``episode_gap`` seconds into one ``Episode``.
+    An episode is emitted once the stream's latest timestamp has moved more
+    than the gap past its last occurrence, when more than
+    ``max_open_episodes`` patterns are open at once (the least recently
+    active one is closed early), or at the end of the stream. Episodes
+    therefore come out in the order they close, not in timestamp order, and
+    an event that closed as a single occurrence is emitted unchanged. With
+    no gap, events pass through and only duplicates are dropped.
+    """
+
+    def __init__(
+        self,
+        id_capacity: int = 65536,
+        episode_gap: Optional[float] = 300.0,
+        max_open_episodes: int = 4096,
+        severity_levels: Optional[Dict[str, int]] = None,
+    ) -> None:
+        if max_open_episodes < 1:
+            raise ValueError("max_open_episodes must be at least 1")
+        self.ids = RecentIds(id_capacity)
+        self.episode_gap = timedelta(seconds=episode_gap) if episode_gap else None
+        self.max_open_episodes = max_open_episodes
+        self.severity_levels = severity_levels or {}
+        self.duplicates = 0
+        self.events_in = 0
+        self.records_out = 0
+        self._open: OrderedDict[Tuple[str, str], ErrorEvent] = OrderedDict()
+        # When each open pattern's episode ends unless it recurs: last + gap
+        self._expiries: Dict[Tuple[str, str], datetime] = {}
+        self._watermark: Optional[datetime] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "EventDeduplicator":
+        dedup_cfg = config.get("dedup", {})
+        gap = dedup_cfg.get("episode_gap_seconds", 300)
+        return cls(
+            id_capacity=int(dedup_cfg.get("id_capacity", 65536)),
+            episode_gap=float(gap) if gap is not None else None,
+            max_open_episodes=int(dedup_cfg.get("max_open_episodes", 4096)),
+            severity_levels=_severity_levels(config),
+        )
+
+    def unique(self, events: Iterable[ErrorEvent]) -> Iterator[ErrorEvent]:
+        seen = self.ids.seen
+        for ev in events:
+            if ev.telemetry_id != MISSING_ID and seen(ev.telemetry_id):
+                self.duplicates += 1
+                continue
+            yield ev
+
+    def collapse(self, events: Iterable[ErrorEvent]) -> Iterator[ErrorEvent]:
+        add = self.add
+        for ev in events:
+            yield from add(ev)
+        yield from self.flush()
+
+    def process(self, events: Iterable[ErrorEvent]) -> Iterator[ErrorEvent]:
+        return self.collapse(self.unique(events))
+
+    def add(self, ev: ErrorEvent) -> Sequence[ErrorEvent]:
+        """
+        Fold one event in and return the records it closed, if any.
+        """
+        self.events_in += 1
+        gap = self.episode_gap
+        if gap is None:
+            self.records_out += 1
+            return (ev,)
+
+        ts = ev.timestamp
+        open_ = self._open
+        expiries = self._expiries
+        key = (ev.subsystem, ev.error_code)
+        current = open_.get(key)
+        closed: Sequence[ErrorEvent] = ()
+        if current is not None and ts <= expiries[key]:
+            if type(current) is not Episode:
+                current = open_[key] = _episode(current)
+            if self._fold(current, ev):  # type: ignore[arg-type]
+                expiries[key] = ts + gap
+            open_.move_to_end(key)
+        else:
+            if current is not None:
+                closed = [open_.pop(key)]
+            open_[key] = ev
+            expiries[key] = ts + gap
+            if len(open_) > self.max_open_episodes:
+                closed = [*closed, self._close(next(iter(open_)))]
+
+        watermark = self._watermark
+        if watermark is None or ts > watermark:
+            self._watermark = ts
+            # Least recently active first, so expired patterns sit at the front.
+            # The pattern of this event never expires here, so the loop ends.
+            oldest = next(iter(open_))
+            if ts > expiries[oldest]:
+                closed = list(closed)
+                while ts > expiries[oldest]:
+                    closed.append(self._close(oldest))
+                    oldest = next(iter(open_))
+
+        self.records_out += len(closed)
+        return closed
+
+    def flush(self) -> List[ErrorEvent]:
+        """
+        Close and return every open episode, e.g. at the end of a stream.
+        """
+        closed = list(self._open.values())
+        self._open.clear()
+        self._expiries.clear()
+        self.records_out += len(closed)
+        return closed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "duplicates_dropped": self.duplicates,
+            "events_collapsed": self.events_in - self.records_out - len(self._open),
+            "records": self.records_out,
+            "episode_gap_seconds": (
+                self.episode_gap.total_seconds() if self.episode_gap is not None else None
+            ),
+        }
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Return the remembered IDs, open episodes (least recently active
+        first) and counters as JSON-serializable data.
+        """
+        watermark = self._watermark
+        return {
+            "ids": self.ids.to_state(),
+            "open": [event_state(ev) for ev in self._open.values()],
+            "watermark": watermark.isoformat() if watermark is not None else None,
+            "duplicates": self.duplicates,
+            "events_in": self.events_in,
+            "records_out": self.records_out,
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """
+        Continue from ``to_state`` output. Expiries follow from the last
+        occurrence of each open episode, so they are recomputed with this
+        deduplicator's gap.
+        """
+        self.ids.load_state(state["ids"])
+        self._open.clear()
+        self._expiries.clear()
+        gap = self.episode_gap
+        for row in state["open"]:
+            ev = event_from_state(row)
+            key = (ev.subsystem, ev.error_code)
+            self._open[key] = ev
+            if gap is not None:
+                last = ev.last_timestamp if type(ev) is Episode else ev.timestamp
+                self._expiries[key] = last + gap  # type: ignore[operator]
+        watermark = state["watermark"]
+        self._watermark = datetime.fromisoformat(watermark) if watermark else None
+        self.duplicates = int(state["duplicates"])
+        self.events_in = int(state["events_in"])
+        self.records_out = int(state["records_out"])
+
+    def _close(self, key: Tuple[str, str]) -> ErrorEvent:
+        del self._expiries[key]
+        return self._open.pop(key)
+
+    def _fold(self, episode: Episode, ev: ErrorEvent) -> bool:
+        """
+        Count ``ev`` into ``episode``; return whether it is the latest
+        occurrence so far.
+        """
+        episode.count += 1
+        levels = self.severity_levels
+        if levels.get(ev.severity, 0) > levels.get(episode.severity, 0):
+            episode.severity = ev.severity
+        ts = ev.timestamp
+        if ts >= episode.last_timestamp:  # type: ignore[operator]
+            episode.last_timestamp = ts
+            episode.resolved = ev.resolved
+            return True
+        if ts < episode.timestamp:
+            episode.timestamp = ts
+        return False
+
+def _episode(ev: ErrorEvent) -> Episode:
+    return Episode(
+        ev.timestamp,
+        ev.subsystem,
+        ev.error_code,
+        ev.severity,
+        ev.description,
+        ev.telemetry_id,
+        ev.resolved,
+        ev.timestamp,
+    )
+
+def event_state(ev: ErrorEvent) -> List[Any]:
+    """
+    Return an event or episode as a JSON-serializable row.
+    """
+    row = [
+        ev.timestamp.isoformat(),
+        ev.subsystem,
+        ev.error_code,
+        ev.severity,
+        ev.description,
+        ev.telemetry_id,
+        ev.resolved,
+    ]
+    if type(ev) is Episode:
+        row += [ev.last_timestamp.isoformat(), ev.count]  # type: ignore[union-attr]
+    return row
+
+def event_from_state(row: List[Any]) -> ErrorEvent:
+    fields = [datetime.fromisoformat(row[0]), *row[1:7]]
+    if len(row) > 7:
+        return Episode(*fields, datetime.fromisoformat(row[7]), row[8])
+    return ErrorEvent(*fields)
\ No newline at end of file
@@ -0,0 +1,429 @@
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from heapq import merge
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from .binary_events import (
+    EPISODE_BODY,
+    EVENT_BODY,
+    HEADER,
+    RECORD_HEADER,
+    TAG_EPISODE,
+    TAG_EVENT,
+    TAG_STRING,
+    BinaryEventReader,
+)
+from .error_parser import ErrorEvent
+from .event_dedup import Episode
+from .event_table import from_epoch_us, to_epoch_us
+from .utils_time import parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+
+# Fields with an inverted index, in the order they are stored in an event record
+INDEXED_FIELDS = ("subsystem", "error_code", "severity")
+
+_MANIFEST = "manifest.json"
+_STRINGS = "strings.json"
+# name -> array typecode
+_ARRAYS = {
+    "timestamps": "q",  # epoch µs by row
+    "offsets": "Q",  # byte offset of each event record in the events file, by row
+    "time_order": "I",  # rows sorted by (timestamp, row)
+    "time_sorted": "q",  # timestamps in time_order, for binary search
+    "counts": "I",  # occurrences by row: 1 for an event, the count of an episode
+    "postings": "I",  # concatenated posting lists, each sorted by row
+}
+
+Filter = Union[str, Iterable[str], None]
+TimeBound = Union[datetime, str, int, float, None]
+
+def default_index_dir(events_path: Path) -> Path:
+    return events_path.with_suffix(".index")
+
+def _write_array(path: Path, values: array) -> None:
+    with path.open("wb") as f:
+        values.tofile(f)
+
+def build_event_index(events_path: Path, index_dir: Optional[Path] = None) -> Path:
+    """
+    Build the query index for a binary events file and return its directory.
+
+    Rows are numbered in file order; an episode is one row, indexed by its
+    first occurrence. Besides a row -> timestamp, row -> byte offset and
+    row -> occurrence count map, the index stores the rows sorted by
+    timestamp and one posting list (sorted rows) per subsystem, error code,
+    severity and resolved value. All arrays are raw machine-order files, memory-mapped by
+    ``EventIndex``.
+    """
+    if index_dir is None:
+        index_dir = default_index_dir(events_path)
+    index_dir.mkdir(parents=True, exist_ok=True)
+    (index_dir / _MANIFEST).unlink(missing_ok=True)
+
+    timestamps = array("q")
+    offsets = array("Q")
+    counts = array("I")
+    episodes = 0
+    strings: List[str] = []
+    # field -> string id -> rows; the resolved flag uses 0/1 as its ids
+    postings: Dict[str, Dict[int, array]] = {
+        field: {} for field in INDEXED_FIELDS + ("resolved",)
+    }
+
+    with BinaryEventReader(events_path) as reader:
+        mm = reader._mm
+        end = len(mm)
+        pos = HEADER.size
+        row = 0
+        while pos < end:
+            length, tag = RECORD_HEADER.unpack_from(mm, pos)
+            start = pos + RECORD_HEADER.size
+            if tag == TAG_EVENT or tag == TAG_EPISODE:
+                ts_us, sub, code, sev, _, resolved = EVENT_BODY.unpack_from(mm, start)
+                if tag == TAG_EPISODE:
+                    counts.append(EPISODE_BODY.unpack_from(mm, start)[-1])
+                    episodes += 1
+                else:
+                    counts.append(1)
+                timestamps.append(ts_us)
+                offsets.append(pos)
+                for field, value in zip(INDEXED_FIELDS, (sub, code, sev)):
+                    rows = postings[field].get(value)
+                    if rows is None:
+                        rows = postings[field][value] = array("I")
+                    rows.append(row)
+                resolved_rows = postings["resolved"].get(resolved)
+                if resolved_rows is None:
+                    resolved_rows = postings["resolved"][resolved] = array("I")
+                resolved_rows.append(row)
+                row += 1
+            elif tag == TAG_STRING:
+                strings.append(mm[start:start + length].decode("utf-8"))
+            pos = start + length
+
+    # Exports are usually already in time order, which makes the sort free
+    if all(a <= b for a, b in zip(timestamps, timestamps[1:])):
+        time_order = array("I", range(len(timestamps)))
+        time_sorted = timestamps
+    else:
+        time_order = array(
+            "I", sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        )
+        time_sorted = array("q", (timestamps[r] for r in time_order))
+
+    flat = array("I")
+    directory: Dict[str, Dict[str, List[int]]] = {}
+    for field, by_value in postings.items():
+        directory[field] = {}
+        for value, rows in by_value.items():
+            key = ("true" if value else "false") if field == "resolved" else strings[value]
+            directory[field][key] = [len(flat), len(rows)]
+            flat.extend(rows)
+
+    arrays = {
+        "timestamps": timestamps,
+        "offsets": offsets,
+        "time_order": time_order,
+        "time_sorted": time_sorted,
+        "counts": counts,
+        "postings": flat,
+    }
+    for name, values in arrays.items():
+        _write_array(index_dir / f"{name}.bin", values)
+    with (index_dir / _STRINGS).open("w", encoding="utf-8") as f:
+        json.dump(strings, f)
+
+    st = events_path.stat()
+    manifest = {
+        "version": INDEX_VERSION,
+        "byteorder": sys.byteorder,
+        "events_path": os.path.relpath(events_path.resolve(), index_dir.resolve()),
+        "events_size": st.st_size,
+        "events_mtime_ns": st.st_mtime_ns,
+        "count": len(timestamps),
+        "episodes": episodes,
+        "postings": directory,
+    }
+    # Written last: a directory without a manifest is an incomplete index
+    with (index_dir / _MANIFEST).open("w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+
+    logger.info("Indexed %d events from %s in %s", len(timestamps), events_path, index_dir)
+    return index_dir
+
+def _intersect(left: Sequence[int], right: Sequence[int]) -> List[int]:
+    """
+    Intersect two sorted row lists by galloping through the longer one.
+    """
+    if len(left) > len(right):
+        left, right = right, left
+    out: List[int] = []
+    lo = 0
+    hi = len(right)
+    for row in left:
+        lo = bisect_left(right, row, lo, hi)
+        if lo == hi:
+            break
+        if right[lo] == row:
+            out.append(row)
+    return out
+
+def _contains(rows: Sequence[int], row: int) -> bool:
+    i = bisect_left(rows, row)
+    return i < len(rows) and rows[i] == row
+
+class EventIndex:
+    """
+    Read-only view of an index written by ``build_event_index``.
+
+    Index arrays and the events file are memory-mapped; a query touches only
+    the posting lists it filters on, the matching slice of the time index
+    and the records it returns.
+    """
+
+    def __init__(self, index_dir: Path) -> None:
+        self.index_dir = index_dir
+        manifest_path = index_dir / _MANIFEST
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"Event index not found: {index_dir}")
+        with manifest_path.open("r", encoding="utf-8") as f:
+            self.manifest: Dict[str, Any] = json.load(f)
+        if self.manifest.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported event index version in {index_dir}")
+        if self.manifest.get("byteorder") != sys.byteorder:
+            raise ValueError(f"Event index {index_dir} was built on a different byte order")
+
+        self.events_path = (index_dir / self.manifest["events_path"]).resolve()
+        st = self.events_path.stat()
+        if (st.st_size, st.st_mtime_ns) != (
+            self.manifest["events_size"],
+            self.manifest["events_mtime_ns"],
+        ):
+            raise ValueError(
+                f"Event index {index_dir} is stale: {self.events_path} changed since it was built"
+            )
+
+        with (index_dir / _STRINGS).open("r", encoding="utf-8") as f:
+            self._strings: List[str] = json.load(f)
+
+        self._maps: List[mmap.mmap] = []
+        self._files = []
+        views = {name: self._map(index_dir / f"{name}.bin", code) for name, code in _ARRAYS.items()}
+        self.timestamps = views["timestamps"]
+        self.offsets = views["offsets"]
+        self.time_order = views["time_order"]
+        self.time_sorted = views["time_sorted"]
+        self.counts = views["counts"]
+        self._postings = views["postings"]
+        self._events = self._map(self.events_path, "B")
+
+    def _map(self, path: Path, typecode: str) -> Sequence[int]:
+        f = path.open("rb")
+        self._files.append(f)
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b"").cast(typecode)
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mm)
+        return memoryview(mm).cast(typecode)
+
+    def __enter__(self) -> "EventIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for name in (
+            "timestamps", "offsets", "time_order", "time_sorted", "counts", "_postings", "_events"
+        ):
+            view = getattr(self, name, None)
+            if isinstance(view, memoryview):
+                view.release()
+        for mm in self._maps:
+            try:
+                mm.close()
+            except BufferError:
+                # Row slices returned by rows() are still alive; the mapping
+                # is released once they are garbage collected.
+                pass
+        for f in self._files:
+            f.close()
+        self._maps = []
+        self._files = []
+
+    def __len__(self) -> int:
+        return int(self.manifest["count"])
+
+    def values(self, field: str) -> List[str]:
+        """
+        Distinct values of an indexed field.
+        """
+        return list(self.manifest["postings"].get(field, {}))
+
+    def postings(self, field: str, value: str) -> Sequence[int]:
+        """
+        Sorted rows whose ``field`` equals ``value``.
+        """
+        entry = self.manifest["postings"][field].get(value)
+        if entry is None:
+            return ()
+        start, count = entry
+        return self._postings[start:start + count]
+
+    def _field_rows(self, field: str, wanted: Filter) -> Optional[Sequence[int]]:
+        if wanted is None:
+            return None
+        if isinstance(wanted, str):
+            return self.postings(field, wanted)
+        lists = [self.postings(field, value) for value in wanted]
+        if len(lists) == 1:
+            return lists[0]
+        # Rows of different values are disjoint, so the union is a plain merge
+        return list(merge(*lists))
+
+    @staticmethod
+    def _time_bound(value: TimeBound) -> Optional[int]:
+        if value is None:
+            return None
+        return to_epoch_us(parse_timestamp(value))
+
+    def rows(
+        self,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        subsystem: Filter = None,
+        error_code: Filter = None,
+        severity: Filter = None,
+        resolved: Optional[bool] = None,
+    ) -> Sequence[int]:
+        """
+        Rows matching every given filter, in timestamp order.
+
+        ``start`` is inclusive and ``end`` exclusive. Each of ``subsystem``,
+        ``error_code`` and ``severity`` takes a value or a collection of
+        values (matching any of them).
+        """
+        filters = [
+            rows
+            for rows in (
+                self._field_rows("subsystem", subsystem),
+                self._field_rows("error_code", error_code),
+                self._field_rows("severity", severity),
+                self._field_rows(
+                    "resolved", None if resolved is None else ("true" if resolved else "false")
+                ),
+            )
+            if rows is not None
+        ]
+
+        lo = 0
+        hi = len(self.time_sorted)
+        start_us = self._time_bound(start)
+        end_us = self._time_bound(end)
+        if start_us is not None:
+            lo = bisect_left(self.time_sorted, start_us)
+        if end_us is not None:
+            hi = max(lo, bisect_left(self.time_sorted, end_us))
+
+        if not filters:
+            return self.time_order[lo:hi]
+
+        filters.sort(key=len)
+        if len(filters[0]) <= hi - lo:
+            # Filters are the more selective side: intersect them, then check
+            # each candidate's timestamp.
+            candidates: Sequence[int] = filters[0]
+            for rows in filters[1:]:
+                if not candidates:
+                    break
+                candidates = _intersect(candidates, rows)
+            timestamps = self.timestamps
+            if start_us is not None or end_us is not None:
+                low = start_us if start_us is not None else -(1 << 63)
+                high = end_us if end_us is not None else 1 << 63
+                candidates = [
+                    row for row in candidates if low <= timestamps[row] < high
+                ]
+            return sorted(candidates, key=lambda row: (timestamps[row], row))
+
+        # The time range is the more selective side: walk it and probe the
+        # posting lists.
+        return [
+            row
+            for row in self.time_order[lo:hi]
+            if all(_contains(rows, row) for rows in filters)
+        ]
+
+    def count(self, **filters: Any) -> int:
+        """
+        Occurrences matching ``filters`` (see ``rows``): an episode counts
+        as many times as it occurred.
+        """
+        rows = self.rows(**filters)
+        if not self.manifest["episodes"]:
+            return len(rows)
+        counts = self.counts
+        return sum(counts[row] for row in rows)
+
+    def event(self, row: int) -> ErrorEvent:
+        """
+        Decode the event or episode stored at ``row``.
+        """
+        pos = self.offsets[row]
+        events = self._events
+        length, tag = RECORD_HEADER.unpack_from(events, pos)
+        start = pos + RECORD_HEADER.size
+        strings = self._strings
+        if tag == TAG_EVENT:
+            ts_us, sub, code, sev, desc, resolved = EVENT_BODY.unpack_from(events, start)
+            return ErrorEvent(
+                from_epoch_us(ts_us),
+                strings[sub],
+                strings[code],
+                strings[sev],
+                strings[desc],
+                bytes(events[start + EVENT_BODY.size:start + length]).decode("utf-8"),
+                bool(resolved),
+            )
+        if tag == TAG_EPISODE:
+            ts_us, sub, code, sev, desc, resolved, last_us, count = EPISODE_BODY.unpack_from(
+                events, start
+            )
+            return Episode(
+                from_epoch_us(ts_us),
+                strings[sub],
+                strings[code],
+                strings[sev],
+                strings[desc],
+                bytes(events[start + EPISODE_BODY.size:start + length]).decode("utf-8"),
+                bool(resolved),
+                from_epoch_us(last_us),
+                count,
+            )
+        raise ValueError(f"Row {row} does not point at an event record")
+
+    def query(self, limit: Optional[int] = None, **filters: Any) -> List[ErrorEvent]:
+        """
+        Events matching ``filters`` (see ``rows``) in timestamp order, at most
+        ``limit`` of them.
+        """
+        rows = self.rows(**filters)
+        if limit is not None:
+            rows = rows[:limit]
+        return [self.event(row) for row in rows]
+
+def query_events(index_dir: Path, limit: Optional[int] = None, **filters: Any) -> List[ErrorEvent]:
+    with EventIndex(index_dir) as index:
+        return index.query(limit=limit, **filters)
\ No newline at end of file
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .error_parser import ErrorEvent, EventAggregator
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Byte value -> eight 0/1 flags (least significant bit first), used to expand
+# the resolved bitset into a selector for itertools.compress.
+_BITS = [bytes((b >> i) & 1 for i in range(8)) for b in range(256)]
+_INVERTED_BITS = [bytes(1 - flag for flag in bits) for bits in _BITS]
+
+def to_epoch_us(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+def from_epoch_us(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+class StringColumn:
+    """
+    Dictionary-encoded string column.
+
+    Each distinct value is stored once; rows hold a 32-bit code. Codes are
+    assigned in order of first appearance.
+    """
+
+    __slots__ = ("values", "codes", "_index")
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self.codes = array("I")
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> str:
+        return self.values[self.codes[row]]
+
+    def encode(self, value: str) -> int:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value: str) -> None:
+        self.codes.append(self.encode(value))
+
+    def extend(self, other: "StringColumn") -> None:
+        mapping = [self.encode(value) for value in other.values]
+        self.codes.extend(mapping[code] for code in other.codes)
+
+    def counts(self, codes: Iterable[int] | None = None) -> Dict[str, int]:
+        """
+        Count rows per value, in order of first appearance.
+        """
+        values = self.values
+        return {
+            values[code]: count
+            for code, count in Counter(self.codes if codes is None else codes).items()
+        }
+
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes)
+
+class EventTable:
+    """
+    Columnar container for parsed events.
+
+    Timestamps are stored as int64 epoch microseconds, subsystem, error code,
+    severity and description are dictionary-encoded, telemetry ids are kept
+    as plain strings and the resolved flags are packed into a bitset.
+    ``ErrorEvent`` objects are only built when a row is accessed.
+    """
+
+    def __init__(self, events: Iterable[ErrorEvent] = ()) -> None:
+        self.timestamps = array("q")
+        self.subsystem = StringColumn()
+        self.error_code = StringColumn()
+        self.severity = StringColumn()
+        self.description = StringColumn()
+        self.telemetry_id: List[str] = []
+        self.resolved_bits = bytearray()
+        self.extend(events)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append_fields(
+        self,
+        timestamp: datetime,
+        subsystem: str,
+        error_code: str,
+        severity: str,
+        description: str,
+        telemetry_id: str,
+        resolved: bool,
+    ) -> None:
+        row = len(self.timestamps)
+        self.timestamps.append(to_epoch_us(timestamp))
+        self.subsystem.append(subsystem)
+        self.error_code.append(error_code)
+        self.severity.append(severity)
+        self.description.append(description)
+        self.telemetry_id.append(telemetry_id)
+        if row % 8 == 0:
+            self.resolved_bits.append(0)
+        if resolved:
+            self.resolved_bits[row >> 3] |= 1 << (row & 7)
+
+    def append(self, ev: ErrorEvent) -> None:
+        self.append_fields(
+            ev.timestamp,
+            ev.subsystem,
+            ev.error_code,
+            ev.severity,
+            ev.description,
+            ev.telemetry_id,
+            ev.resolved,
+        )
+
+    def extend(self, events: Iterable[ErrorEvent]) -> None:
+        if isinstance(events, EventTable):
+            self._extend_table(events)
+            return
+        for ev in events:
+            self.append(ev)
+
+    def _extend_table(self, other: "EventTable") -> None:
+        start = len(self)
+        self.timestamps.extend(other.timestamps)
+        self.subsystem.extend(other.subsystem)
+        self.error_code.extend(other.error_code)
+        self.severity.extend(other.severity)
+        self.description.extend(other.description)
+        self.telemetry_id.extend(other.telemetry_id)
+        if start % 8 == 0:
+            self.resolved_bits.extend(other.resolved_bits)
+        else:
+            self.resolved_bits = self.resolved_bits[: (start + 7) // 8]
+            flags = self._flags(other.resolved_bits, len(other))
+            for offset, flag in enumerate(flags):
+                row = start + offset
+                if row % 8 == 0:
+                    self.resolved_bits.append(0)
+                if flag:
+                    self.resolved_bits[row >> 3] |= 1 << (row & 7)
+
+    @staticmethod
+    def _flags(bits: bytes, count: int, inverted: bool = False) -> bytes:
+        table = _INVERTED_BITS if inverted else _BITS
+        return b"".join([table[b] for b in bits])[:count]
+
+    def resolved(self, row: int) -> bool:
+        return bool(self.resolved_bits[row >> 3] >> (row & 7) & 1)
+
+    def timestamp(self, row: int) -> datetime:
+        return from_epoch_us(self.timestamps[row])
+
+    def __getitem__(self, row: int) -> ErrorEvent:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("EventTable index out of range")
+        return ErrorEvent(
+            self.timestamp(row),
+            self.subsystem[row],
+            self.error_code[row],
+            self.severity[row],
+            self.description[row],
+            self.telemetry_id[row],
+            self.resolved(row),
+        )
+
+    def __iter__(self) -> Iterator[ErrorEvent]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def _rows(self, severity: Optional[str] = None) -> Iterable[int]:
+        if severity is None:
+            return range(len(self))
+        code = self.severity._index.get(severity)
+        if code is None:
+            return ()
+        return (row for row, value in enumerate(self.severity.codes) if value == code)
+
+    def earliest(self, n: int, severity: Optional[str] = None) -> List[ErrorEvent]:
+        """
+        Return the ``n`` earliest events (of ``severity``, if given), ties kept
+        in insertion order.
+        """
+        rows = heapq.nsmallest(n, self._rows(severity), key=self.timestamps.__getitem__)
+        return [self[row] for row in rows]
+
+    def latest(self, n: int) -> List[ErrorEvent]:
+        """
+        Return the ``n`` latest events in time order, ties kept in insertion
+        order.
+        """
+        # nlargest keeps the first of equal keys, so scan backwards to prefer
+        # the later rows, as the tail of a stable sort would
+        rows = heapq.nlargest(
+            n, range(len(self) - 1, -1, -1), key=self.timestamps.__getitem__
+        )
+        return [self[row] for row in reversed(rows)]
+
+    def aggregate(self, top_k_capacity: Optional[int] = None) -> EventAggregator:
+        """
+        Build an ``EventAggregator`` by counting the code columns directly.
+
+        The result is identical to adding every row to an aggregator one by one
+        when exact; with ``top_k_capacity`` the pair counts are folded into a
+        sketch in first-seen order.
+        """
+        aggregator = EventAggregator(top_k_capacity)
+        aggregator.total_events = len(self)
+        aggregator.by_severity.update(self.severity.counts())
+        aggregator.by_subsystem.update(self.subsystem.counts())
+
+        subsystems = self.subsystem.values
+        codes = self.error_code.values
+        pairs: Counter[Tuple[int, int]] = Counter(
+            zip(self.subsystem.codes, self.error_code.codes)
+        )
+        aggregator.error_pairs.update(
+            {(subsystems[sub], codes[code]): count for (sub, code), count in pairs.items()}
+        )
+
+        unresolved = self._flags(self.resolved_bits, len(self), inverted=True)
+        unresolved_codes = compress(self.subsystem.codes, unresolved)
+        for sub, count in self.subsystem.counts(unresolved_codes).items():
+            aggregator.unresolved_by_subsystem[sub] = count
+
+        return aggregator
+
+    def nbytes(self) -> int:
+        """
+        Approximate memory held by the columns, excluding shared dictionaries.
+        """
+        return (
+            self.timestamps.itemsize * len(self.timestamps)
+            + self.subsystem.nbytes()
+            + self.error_code.nbytes()
+            + self.severity.nbytes()
+            + self.description.nbytes()
+            + 8 * len(self.telemetry_id)
+            + len(self.resolved_bits)
+        )
\ No newline at end of file
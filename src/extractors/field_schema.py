@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .utils_time import TimestampParser
+
+# Source keys accepted for each ErrorEvent field, in priority order: the
+# first key holding a truthy value wins.
+DEFAULT_FIELD_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "timestamp": ("timestamp", "time", "ts"),
+    "subsystem": ("subsystem", "module"),
+    "error_code": ("error_code", "code"),
+    "severity": ("severity", "level"),
+    "description": ("description", "message"),
+    "telemetry_id": ("telemetry_id", "id"),
+    "resolved": ("resolved",),
+}
+
+# Fields resolved through the alias probe, in ErrorEvent order
+_PROBED_FIELDS = ("timestamp", "subsystem", "error_code", "severity", "description", "telemetry_id")
+
+# Common severity spellings and the level they stand for
+SEVERITY_ALIASES: Dict[str, str] = {
+    "INFO": "LOW",
+    "WARN": "MEDIUM",
+    "WARNING": "MEDIUM",
+    "ERR": "HIGH",
+    "FATAL": "CRITICAL",
+}
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "y"})
+
+# Extracts the normalized ErrorEvent fields of one raw record, in field order
+FieldExtractor = Callable[[Dict[str, Any]], Tuple[Any, ...]]
+
+# Longest alias list compile_extractor unrolls into a fixed or-chain
+UNROLLED_ALIASES = 3
+
+def _normalize_severity(raw: Any, severity_levels: Dict[str, int]) -> str:
+    if raw is None:
+        return "UNKNOWN"
+
+    text = str(raw).strip()
+    if not text:
+        return "UNKNOWN"
+
+    key = text.upper()
+    if key in severity_levels:
+        return key
+
+    alias = SEVERITY_ALIASES.get(key)
+    if alias is not None and alias in severity_levels:
+        return alias
+
+    return "UNKNOWN"
+
+def normalize_severity_value(raw: Any, severity_levels: Dict[str, int]) -> str:
+    """
+    Normalized severity of a raw record value, missing or empty ones included.
+    """
+    return _normalize_severity(raw or "UNKNOWN", severity_levels)
+
+def _resolved_flag(raw: Any) -> bool:
+    if isinstance(raw, bool):
+        return raw
+    if isinstance(raw, str):
+        return raw.strip().lower() in _TRUE_STRINGS
+    return False
+
+def _first_truthy(raw: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """
+    ``raw.get(keys[0]) or raw.get(keys[1]) or ...``
+    """
+    value = None
+    for key in keys:
+        value = raw.get(key)
+        if value:
+            break
+    return value
+
+def _severity_levels(config: Dict[str, Any]) -> Dict[str, int]:
+    return {
+        k.upper(): int(v)
+        for k, v in config.get("severity_levels", {}).items()
+    }
+
+@dataclass(frozen=True)
+class FieldSchema:
+    """
+    How raw telemetry keys map onto ErrorEvent fields, plus the severity
+    levels severities are normalized against.
+
+    ``aliases`` may be overridden per field in the ``field_aliases`` config
+    section; fields left out keep their default keys. The schema is plain
+    data, so it can be handed to worker processes, and ``compile`` turns it
+    into the extractor for one source.
+    """
+
+    severity_levels: Dict[str, int] = field(default_factory=dict)
+    aliases: Dict[str, Tuple[str, ...]] = field(
+        default_factory=lambda: dict(DEFAULT_FIELD_ALIASES)
+    )
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "FieldSchema":
+        aliases = dict(DEFAULT_FIELD_ALIASES)
+        for name, keys in config.get("field_aliases", {}).items():
+            if name not in aliases:
+                raise ValueError(f"Unknown field in field_aliases: {name}")
+            if isinstance(keys, str):
+                keys = [keys]
+            if not keys:
+                raise ValueError(f"field_aliases.{name} must name at least one key")
+            aliases[name] = tuple(str(key) for key in keys)
+        return cls(_severity_levels(config), aliases)
+
+    def cache_key(self) -> str:
+        """
+        Text identifying every setting that affects normalized output.
+        """
+        key = json.dumps(sorted(self.severity_levels.items()))
+        if self.aliases != DEFAULT_FIELD_ALIASES:
+            key += "\0fields=" + json.dumps(sorted(self.aliases.items()))
+        return key
+
+    def compile(
+        self, parse_ts: Optional[Callable[[Any], Any]] = None, raw_severity: bool = False
+    ) -> "FieldExtractor":
+        return compile_extractor(self, parse_ts, raw_severity)
+
+def _memoized(
+    normalize: Callable[[Any], Any], limit: int = 4096
+) -> Tuple[Dict[str, Any], Callable[[Any], Any]]:
+    """
+    Return a memo of ``normalize`` over plain strings and a function that
+    computes a value and records it. Other types are computed every time.
+    """
+    memo: Dict[str, Any] = {}
+
+    def compute(value: Any) -> Any:
+        result = normalize(value)
+        if type(value) is str:
+            if len(memo) >= limit:
+                memo.clear()
+            memo[value] = result
+        return result
+
+    return memo, compute
+
+def _padded(keys: Tuple[str, ...], width: int) -> Tuple[str, ...]:
+    """
+    Repeat the last key up to ``width`` keys. Probing a key twice gives the
+    same result as probing it once, including the value of an exhausted
+    or-chain, which is that of the last key.
+    """
+    return keys + (keys[-1],) * (width - len(keys))
+
+def compile_extractor(
+    schema: FieldSchema,
+    parse_ts: Optional[Callable[[Any], Any]] = None,
+    raw_severity: bool = False,
+) -> FieldExtractor:
+    """
+    Build the field extractor for one source.
+
+    The aliases of every field are bound into a fixed chain of ``dict.get``
+    calls, so a record costs no loops or lookups of the schema itself, and
+    severity and resolved-flag normalization is memoized per distinct raw
+    string. Keys are probed in schema order and the first truthy value
+    wins, exactly as in the generic probe. Fields with more than
+    ``UNROLLED_ALIASES`` aliases fall back to that probe.
+
+    With ``raw_severity`` the severity is left as found in the record, for
+    ``normalize_severity`` to map under several level maps later.
+    """
+    parse_ts = parse_ts or TimestampParser()
+    aliases = schema.aliases
+    if any(len(aliases[name]) > UNROLLED_ALIASES for name in _PROBED_FIELDS):
+        return _generic_extractor(schema, parse_ts, raw_severity)
+
+    t1, t2, t3 = _padded(aliases["timestamp"], 3)
+    s1, s2, s3 = _padded(aliases["subsystem"], 3)
+    c1, c2, c3 = _padded(aliases["error_code"], 3)
+    v1, v2, v3 = _padded(aliases["severity"], 3)
+    d1, d2, d3 = _padded(aliases["description"], 3)
+    i1, i2, i3 = _padded(aliases["telemetry_id"], 3)
+    resolved_keys = aliases["resolved"]
+    resolved_key = resolved_keys[0] if len(resolved_keys) == 1 else None
+    severity_levels = schema.severity_levels
+    severities, normalize_severity = _memoized(
+        (lambda value: value)
+        if raw_severity
+        else lambda value: normalize_severity_value(value, severity_levels)
+    )
+    flags, resolved_flag = _memoized(_resolved_flag)
+
+    def extract(raw: Dict[str, Any]) -> Tuple[Any, ...]:
+        get = raw.get
+        ts_raw = get(t1) or get(t2) or get(t3)
+        if ts_raw is None:
+            raise ValueError("Missing timestamp field")
+
+        timestamp = parse_ts(ts_raw)
+
+        subsystem = get(s1) or get(s2) or get(s3)
+        error_code = get(c1) or get(c2) or get(c3)
+        severity = get(v1) or get(v2) or get(v3)
+        description = get(d1) or get(d2) or get(d3)
+        telemetry_id = get(i1) or get(i2) or get(i3)
+        if resolved_key is not None:
+            resolved = get(resolved_key)
+        else:
+            resolved = _first_truthy(raw, resolved_keys)
+
+        if type(severity) is not str or (normalized := severities.get(severity)) is None:
+            normalized = normalize_severity(severity)
+        if type(resolved) is not bool:
+            if type(resolved) is not str or (flag := flags.get(resolved)) is None:
+                flag = resolved_flag(resolved)
+            resolved = flag
+
+        return (
+            timestamp,
+            (str(subsystem).strip() if subsystem else "") or "UNKNOWN",
+            (str(error_code).strip() if error_code else "") or "UNKNOWN",
+            normalized,
+            str(description).strip() if description else "No description provided",
+            str(telemetry_id).strip() if telemetry_id else "N/A",
+            resolved,
+        )
+
+    return extract
+
+def _generic_extractor(
+    schema: FieldSchema, parse_ts: Callable[[Any], Any], raw_severity: bool = False
+) -> FieldExtractor:
+    probed = tuple(schema.aliases[name] for name in _PROBED_FIELDS)
+    resolved_keys = schema.aliases["resolved"]
+    severity_levels = schema.severity_levels
+
+    def extract(raw: Dict[str, Any]) -> Tuple[Any, ...]:
+        ts_raw, subsystem, error_code, severity, description, telemetry_id = (
+            _first_truthy(raw, keys) for keys in probed
+        )
+        if ts_raw is None:
+            raise ValueError("Missing timestamp field")
+
+        timestamp = parse_ts(ts_raw)
+
+        return (
+            timestamp,
+            (str(subsystem).strip() if subsystem else "") or "UNKNOWN",
+            (str(error_code).strip() if error_code else "") or "UNKNOWN",
+            severity if raw_severity else normalize_severity_value(severity, severity_levels),
+            str(description).strip() if description else "No description provided",
+            str(telemetry_id).strip() if telemetry_id else "N/A",
+            _resolved_flag(_first_truthy(raw, resolved_keys)),
+        )
+
+    return extract
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import heapq
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple, Union
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitter sketch (Metwally et al.) over at most
+    ``capacity`` monitored keys.
+
+    Every monitored key has an estimated count that never undercounts and an
+    error term bounding the overestimate, so its true count lies in
+    ``[count - error, count]``. Any key whose true count exceeds
+    ``total / capacity`` is guaranteed to be monitored. While no more than
+    ``capacity`` distinct keys have been seen nothing is evicted and all
+    counts are exact.
+
+    When full, a new key replaces the monitored key with the smallest count
+    and inherits that count as its error. The minimum is found through a heap
+    that is only built once the sketch first fills up, and whose entries are
+    refreshed lazily since counts only grow. Until then the sketch costs no
+    more than a Counter.
+
+    Sketches with the same capacity are mergeable (``merge``); the result
+    keeps the same guarantees relative to the combined stream.
+    """
+
+    __slots__ = ("capacity", "total", "_counts", "_errors", "_evicted", "_heap")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict[Hashable, int] = {}
+        # Non-zero errors only
+        self._errors: Dict[Hashable, int] = {}
+        # Largest count a merge dropped to stay within capacity; a key evicted
+        # by a merge of exact sketches leaves no error behind on the kept keys
+        self._evicted = 0
+        # (count when pushed, sequence, key); may hold stale counts
+        self._heap: List[Tuple[int, int, Hashable]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._counts
+
+    def __getitem__(self, key: Hashable) -> int:
+        return self._counts.get(key, 0)
+
+    def items(self) -> Iterable[Tuple[Hashable, int]]:
+        return self._counts.items()
+
+    def error(self, key: Hashable) -> int:
+        return self._errors.get(key, 0)
+
+    @property
+    def exact(self) -> bool:
+        """
+        True while nothing has been evicted, i.e. every count is exact.
+        """
+        return not self._errors and not self._evicted
+
+    def min_count(self) -> int:
+        """
+        Smallest monitored count once the sketch is full, else 0. An
+        unmonitored key occurred at most this many times.
+        """
+        if len(self._counts) < self.capacity:
+            return 0
+        return self._peek_min()[0]
+
+    def error_bound(self) -> int:
+        """
+        Largest possible overestimate of any reported count.
+        """
+        return max(self._errors.values(), default=0)
+
+    def _peek_min(self) -> Tuple[int, Hashable]:
+        heap = self._heap
+        counts = self._counts
+        if not heap:
+            heap.extend((count, seq, key) for seq, (key, count) in enumerate(counts.items()))
+            heapq.heapify(heap)
+        while True:
+            count, _, key = heap[0]
+            current = counts.get(key)
+            if current == count:
+                return count, key
+            if current is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (current, heap[0][1], key))
+
+    def add(self, key: Hashable, count: int = 1) -> None:
+        self.total += count
+        counts = self._counts
+        if key in counts:
+            counts[key] += count
+            return
+
+        if len(counts) < self.capacity:
+            counts[key] = count
+            return
+
+        floor, evicted = self._peek_min()
+        del counts[evicted]
+        self._errors.pop(evicted, None)
+        counts[key] = floor + count
+        if floor:
+            self._errors[key] = floor
+        heapq.heapreplace(self._heap, (floor + count, self.total, key))
+
+    def update(self, other: Union["SpaceSaving", Mapping[Hashable, int]]) -> None:
+        """
+        Fold in another sketch (see ``merge``) or a mapping of exact counts.
+        """
+        if isinstance(other, SpaceSaving):
+            self.merge(other)
+            return
+        for key, count in other.items():
+            self.add(key, count)
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """
+        Merge ``other`` into this sketch.
+
+        A key missing from one side may still have occurred there up to that
+        side's ``min_count`` times, which is added to both its count and its
+        error. The ``capacity`` keys with the largest merged counts are kept.
+        Keys keep their first-seen order, as with ``Counter.update``. The
+        largest count dropped is remembered, so the result is not ``exact``
+        even if both sides were.
+        """
+        own_floor = self.min_count()
+        other_floor = other.min_count()
+        counts: Dict[Hashable, int] = {}
+        errors: Dict[Hashable, int] = {}
+        for key, count in self._counts.items():
+            counts[key] = count + other._counts.get(key, other_floor)
+            error = self.error(key) + other._errors.get(key, other_floor)
+            if error:
+                errors[key] = error
+        for key, count in other._counts.items():
+            if key not in counts:
+                counts[key] = count + own_floor
+                error = other.error(key) + own_floor
+                if error:
+                    errors[key] = error
+
+        evicted = max(self._evicted, other._evicted)
+        if len(counts) > self.capacity:
+            keep = set(heapq.nlargest(self.capacity, counts, key=counts.__getitem__))
+            evicted = max(
+                evicted, max(count for key, count in counts.items() if key not in keep)
+            )
+            counts = {key: count for key, count in counts.items() if key in keep}
+            errors = {key: error for key, error in errors.items() if key in keep}
+
+        self.total += other.total
+        self._counts = counts
+        self._errors = errors
+        self._evicted = evicted
+        self._heap = []
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[Hashable, int]]:
+        """
+        Keys with the largest estimated counts, ties in first-seen order.
+        """
+        if n is None:
+            return sorted(self._counts.items(), key=lambda kv: kv[1], reverse=True)
+        return heapq.nlargest(n, self._counts.items(), key=lambda kv: kv[1])
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "total": self.total,
+            "items": [
+                [key, count, self.error(key)] for key, count in self._counts.items()
+            ],
+            "evicted": self._evicted,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any], key_type: Any = tuple) -> "SpaceSaving":
+        sketch = cls(int(state["capacity"]))
+        for key, count, error in state["items"]:
+            key = key_type(key)
+            sketch._counts[key] = count
+            if error:
+                sketch._errors[key] = error
+        sketch.total = int(state["total"])
+        sketch._evicted = int(state.get("evicted", 0))
+        return sketch
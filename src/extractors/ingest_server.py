@@ -0,0 +1,506 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from a stream connection at a time
+READ_SIZE = 64 * 1024
+# Longest JSON line accepted over a stream; longer ones are dropped as malformed
+MAX_LINE_BYTES = 1024 * 1024
+# Largest HTTP request body accepted
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+OVERFLOW_POLICIES = ("block", "drop")
+
+_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    503: "Service Unavailable",
+}
+
+@dataclass
+class IngestionStats:
+    """
+    Counters of an ``IngestionServer``; latencies run from when the oldest
+    record of a batch was queued to when the batch was handled.
+    """
+
+    received: int = 0
+    malformed: int = 0
+    dropped: int = 0
+    processed: int = 0
+    batches: int = 0
+    connections: int = 0
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+    last_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    total_latency_ms: float = 0.0
+
+    @property
+    def mean_latency_ms(self) -> float:
+        return self.total_latency_ms / self.batches if self.batches else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        del data["total_latency_ms"]
+        data["mean_latency_ms"] = round(self.mean_latency_ms, 3)
+        return data
+
+class RecordQueue:
+    """
+    Queue of record chunks bounded by the number of records it holds.
+
+    At most ``capacity`` records are queued: ``put`` queues what fits and
+    waits for room for the rest, which stops the producing connection from
+    being read and lets transport flow control push back on the sender;
+    ``put_nowait`` only queues what fits.
+    """
+
+    def __init__(self, capacity: int, stats: IngestionStats) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.stats = stats
+        self.closed = False
+        self._chunks: Deque[Tuple[float, List[Dict[str, Any]]]] = deque()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._not_empty = asyncio.Event()
+
+    def __len__(self) -> int:
+        return self.stats.queue_depth
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        self._chunks.append((time.monotonic(), records))
+        stats = self.stats
+        stats.queue_depth += len(records)
+        if stats.queue_depth > stats.peak_queue_depth:
+            stats.peak_queue_depth = stats.queue_depth
+        if stats.queue_depth >= self.capacity:
+            self._not_full.clear()
+        self._not_empty.set()
+
+    async def put(self, records: List[Dict[str, Any]]) -> None:
+        start = 0
+        while True:
+            while self.stats.queue_depth >= self.capacity and not self.closed:
+                await self._not_full.wait()
+            room = self.capacity - self.stats.queue_depth
+            if self.closed or len(records) - start <= room:
+                self._append(records[start:] if start else records)
+                return
+            self._append(records[start:start + room])
+            start += room
+
+    def put_nowait(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Queue as many of ``records`` as there is room for and return how many.
+        """
+        room = self.capacity - self.stats.queue_depth
+        if room <= 0:
+            return 0
+        if len(records) > room:
+            records = records[:room]
+        self._append(records)
+        return len(records)
+
+    def close(self) -> None:
+        """
+        Stop waiting for more records; what is queued can still be taken.
+        """
+        self.closed = True
+        self._not_empty.set()
+        self._not_full.set()
+
+    async def get_batch(self, size: int, latency: float) -> Tuple[List[Dict[str, Any]], float]:
+        """
+        Wait for records and return up to ``size`` of them, waiting at
+        most ``latency`` seconds after the oldest was queued for the batch to
+        fill up, with the time the oldest was queued. Returns an empty batch
+        once closed and drained.
+        """
+        chunks = self._chunks
+        while not chunks:
+            if self.closed:
+                return [], 0.0
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        queued_at = chunks[0][0]
+        while self.stats.queue_depth < size and not self.closed:
+            timeout = queued_at + latency - time.monotonic()
+            if timeout <= 0:
+                break
+            self._not_empty.clear()
+            try:
+                await asyncio.wait_for(self._not_empty.wait(), timeout)
+            except asyncio.TimeoutError:
+                break
+
+        batch: List[Dict[str, Any]] = []
+        while chunks and len(batch) < size:
+            chunk_queued_at, records = chunks.popleft()
+            room = size - len(batch)
+            if len(records) > room:
+                chunks.appendleft((chunk_queued_at, records[room:]))
+                records = records[:room]
+            batch.extend(records)
+        self.stats.queue_depth -= len(batch)
+        if self.stats.queue_depth < self.capacity:
+            self._not_full.set()
+        return batch, queued_at
+
+class IngestionServer:
+    """
+    Receives JSONL telemetry over TCP, a Unix socket and HTTP and hands it
+    to ``handle_batch`` in micro-batches.
+
+    Stream connections send one JSON object per line. HTTP clients POST
+    JSON lines (or a JSON array) to ``/ingest`` and get 202 with the number
+    of records accepted; ``GET /metrics`` returns the ``IngestionStats``.
+    Decoded records go to a ``RecordQueue`` of ``queue_size`` records. With
+    the ``block`` overflow policy a full queue stops reading from senders
+    (HTTP requests wait for room); with ``drop`` the records that do not fit
+    are counted as dropped and HTTP requests get 503 with the number of
+    records accepted and dropped.
+
+    A single batching task takes at most ``batch_size`` records, or whatever
+    arrived within ``batch_latency`` seconds of the oldest one, and calls
+    ``handle_batch`` in the event loop. Reading pauses while a batch is
+    handled, which is the backpressure. On stop the listeners and
+    connections are closed and the queue is drained before ``run`` returns.
+
+    A listener whose address is None in the config is not started; port 0
+    picks a free port, reported in ``addresses`` once ``ready`` is set.
+    """
+
+    def __init__(
+        self,
+        handle_batch: Callable[[List[Dict[str, Any]]], Any],
+        host: str = "127.0.0.1",
+        tcp_port: Optional[int] = 5140,
+        http_port: Optional[int] = 8080,
+        unix_path: Optional[Path] = None,
+        queue_size: int = 10000,
+        batch_size: int = 1000,
+        batch_latency: float = 0.2,
+        overflow: str = "block",
+        stats_interval: Optional[float] = 10.0,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        if queue_size < 1 or batch_size < 1:
+            raise ValueError("queue_size and batch_size must be at least 1")
+        self.handle_batch = handle_batch
+        self.host = host
+        self.tcp_port = tcp_port
+        self.http_port = http_port
+        self.unix_path = unix_path
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.batch_latency = batch_latency
+        self.overflow = overflow
+        self.stats_interval = stats_interval
+        self.stats = IngestionStats()
+        self.addresses: Dict[str, Any] = {}
+        self.ready = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._queue: Optional[RecordQueue] = None
+        # Open connections and the tasks serving them
+        self._connections: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    @classmethod
+    def from_config(
+        cls, config: Dict[str, Any], handle_batch: Callable[[List[Dict[str, Any]]], Any]
+    ) -> "IngestionServer":
+        server_cfg = config.get("server", {})
+        unix_path = server_cfg.get("unix_socket")
+        return cls(
+            handle_batch,
+            host=server_cfg.get("host", "127.0.0.1"),
+            tcp_port=server_cfg.get("tcp_port", 5140),
+            http_port=server_cfg.get("http_port", 8080),
+            unix_path=Path(unix_path) if unix_path else None,
+            queue_size=int(server_cfg.get("queue_size", 10000)),
+            batch_size=int(server_cfg.get("batch_size", 1000)),
+            batch_latency=float(server_cfg.get("batch_latency_ms", 200)) / 1000,
+            overflow=server_cfg.get("overflow", "block"),
+            stats_interval=server_cfg.get("stats_interval_seconds", 10.0),
+        )
+
+    def request_stop(self) -> None:
+        """
+        Ask a running server to stop; safe to call from any thread.
+        """
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+
+    async def run(self, stop: Optional[threading.Event] = None) -> None:
+        """
+        Serve until ``request_stop`` is called or ``stop`` is set, then
+        drain the queue.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self._queue = RecordQueue(self.queue_size, self.stats)
+
+        servers = await self._start_listeners()
+        batcher = asyncio.create_task(self._batch_loop())
+        helpers = []
+        if stop is not None:
+            helpers.append(asyncio.create_task(self._watch(stop)))
+        if self.stats_interval:
+            helpers.append(asyncio.create_task(self._log_stats(self.stats_interval)))
+        self.ready.set()
+        try:
+            await self._stop.wait()
+        finally:
+            for helper in helpers:
+                helper.cancel()
+            for server in servers:
+                server.close()
+            # Ends the connections; what they already read is still queued
+            for writer in list(self._connections):
+                writer.close()
+            if self._connections:
+                await asyncio.wait(list(self._connections.values()), timeout=5)
+            for server in servers:
+                await server.wait_closed()
+            if self.unix_path is not None:
+                self.unix_path.unlink(missing_ok=True)
+            self._queue.close()
+            await batcher
+            logger.info("Ingestion server stopped: %s", self.stats.to_dict())
+
+    async def _watch(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            await asyncio.sleep(0.2)
+        self._stop.set()  # type: ignore[union-attr]
+
+    async def _log_stats(self, interval: float) -> None:
+        stats = self.stats
+        last_received = stats.received
+        while True:
+            await asyncio.sleep(interval)
+            if stats.received != last_received or stats.queue_depth:
+                logger.info(
+                    "Received %d records (%.0f/s), queue depth %d, dropped %d, "
+                    "malformed %d, mean batch latency %.1f ms",
+                    stats.received,
+                    (stats.received - last_received) / interval,
+                    stats.queue_depth,
+                    stats.dropped,
+                    stats.malformed,
+                    stats.mean_latency_ms,
+                )
+                last_received = stats.received
+
+    async def _start_listeners(self) -> List[asyncio.AbstractServer]:
+        servers: List[asyncio.AbstractServer] = []
+        if self.tcp_port is not None:
+            server = await asyncio.start_server(
+                self._handle_stream, self.host, self.tcp_port, limit=READ_SIZE
+            )
+            self.addresses["tcp"] = server.sockets[0].getsockname()[:2]
+            servers.append(server)
+        if self.unix_path is not None:
+            self.unix_path.unlink(missing_ok=True)
+            server = await asyncio.start_unix_server(
+                self._handle_stream, str(self.unix_path), limit=READ_SIZE
+            )
+            self.addresses["unix"] = str(self.unix_path)
+            servers.append(server)
+        if self.http_port is not None:
+            server = await asyncio.start_server(self._handle_http, self.host, self.http_port)
+            self.addresses["http"] = server.sockets[0].getsockname()[:2]
+            servers.append(server)
+        if not servers:
+            raise ValueError(
+                "No listener configured: set server.tcp_port, http_port or unix_socket"
+            )
+        logger.info("Ingestion server listening on %s", self.addresses)
+        return servers
+
+    def _decode(self, lines: List[bytes]) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        loads = json.loads
+        malformed = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = loads(line)
+            except ValueError:
+                malformed += 1
+                continue
+            if type(record) is dict:
+                records.append(record)
+            else:
+                malformed += 1
+        self.stats.received += len(records)
+        self.stats.malformed += malformed
+        return records
+
+    async def _enqueue(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Queue ``records`` under the overflow policy; returns how many were
+        dropped.
+        """
+        queue = self._queue
+        if self.overflow == "block":
+            await queue.put(records)  # type: ignore[union-attr]
+            return 0
+        dropped = len(records) - queue.put_nowait(records)  # type: ignore[union-attr]
+        self.stats.dropped += dropped
+        return dropped
+
+    async def _handle_stream(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.stats.connections += 1
+        self._connections[writer] = asyncio.current_task()  # type: ignore[assignment]
+        pending = b""
+        try:
+            while chunk := await reader.read(READ_SIZE):
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                if len(pending) > MAX_LINE_BYTES:
+                    self.stats.malformed += 1
+                    pending = b""
+                records = self._decode(lines)
+                if records:
+                    await self._enqueue(records)
+            if pending:
+                records = self._decode([pending])
+                if records:
+                    await self._enqueue(records)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[writer]
+            writer.close()
+
+    async def _handle_http(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.stats.connections += 1
+        self._connections[writer] = asyncio.current_task()  # type: ignore[assignment]
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers: Dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                status, payload = await self._http_response(request_line, headers, reader)
+                body = json.dumps(payload).encode("utf-8")
+                if status >= 400 and status != 503:
+                    keep_alive = False
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("ascii")
+                    + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[writer]
+            writer.close()
+
+    async def _http_response(
+        self, request_line: bytes, headers: Dict[str, str], reader: asyncio.StreamReader
+    ) -> Tuple[int, Dict[str, Any]]:
+        parts = request_line.decode("latin-1").split()
+        if len(parts) != 3:
+            return 400, {"error": "malformed request line"}
+        method, target, _ = parts
+        path = target.split("?", 1)[0]
+
+        if path == "/metrics":
+            if method != "GET":
+                return 405, {"error": "use GET"}
+            return 200, self.stats.to_dict()
+        if path not in ("/", "/ingest"):
+            return 404, {"error": f"unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": "use POST"}
+        if "content-length" not in headers:
+            return 411, {"error": "Content-Length required"}
+        try:
+            length = int(headers["content-length"])
+        except ValueError:
+            return 400, {"error": "invalid Content-Length"}
+        if length > MAX_BODY_BYTES:
+            return 413, {"error": f"body larger than {MAX_BODY_BYTES} bytes"}
+
+        body = await reader.readexactly(length)
+        malformed = self.stats.malformed
+        if body.lstrip()[:1] == b"[":
+            try:
+                items = json.loads(body)
+            except ValueError:
+                items = None
+            if not isinstance(items, list):
+                self.stats.malformed += 1
+                return 400, {"error": "malformed JSON array"}
+            records = [item for item in items if type(item) is dict]
+            self.stats.received += len(records)
+            self.stats.malformed += len(items) - len(records)
+        else:
+            records = self._decode(body.split(b"\n"))
+        malformed = self.stats.malformed - malformed
+
+        dropped = await self._enqueue(records) if records else 0
+        if dropped:
+            return 503, {
+                "accepted": len(records) - dropped,
+                "dropped": dropped,
+                "malformed": malformed,
+            }
+        return 202, {"accepted": len(records), "malformed": malformed}
+
+    async def _batch_loop(self) -> None:
+        queue: RecordQueue = self._queue  # type: ignore[assignment]
+        stats = self.stats
+        while True:
+            batch, queued_at = await queue.get_batch(self.batch_size, self.batch_latency)
+            if not batch:
+                return
+            try:
+                self.handle_batch(batch)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Failed to process a batch of %d records: %s", len(batch), exc)
+            latency_ms = (time.monotonic() - queued_at) * 1000
+            stats.processed += len(batch)
+            stats.batches += 1
+            stats.last_latency_ms = latency_ms
+            stats.total_latency_ms += latency_ms
+            if latency_ms > stats.max_latency_ms:
+                stats.max_latency_ms = latency_ms
+            # Let connections run between batches even if the queue stays full
+            await asyncio.sleep(0)
\ No newline at end of file
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of bytes consumed per poll, which bounds how long a single
+# poll can take when catching up on a large backlog.
+DEFAULT_READ_SIZE = 4 * 1024 * 1024
+
+class TelemetryTail:
+    """
+    Follow a growing JSONL telemetry file.
+
+    Each ``poll`` returns the records from complete lines appended since the
+    previous poll; a trailing partial line is left for the next one. Rotation
+    (the path now refers to a different file) is handled by draining the old
+    file before switching, and truncation by starting over from the beginning.
+
+    The byte offset of the last consumed line is persisted to
+    ``checkpoint_path`` so a restarted follower resumes where it stopped,
+    along with whatever state the caller derived from the lines before it.
+    When a poll resumes from a checkpoint, that state is in
+    ``resume_state`` until the caller takes it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        checkpoint_path: Optional[Path] = None,
+        read_size: int = DEFAULT_READ_SIZE,
+    ) -> None:
+        self.path = path
+        self.checkpoint_path = checkpoint_path
+        self.read_size = read_size
+        self.offset = 0
+        self._f: Optional[BinaryIO] = None
+        self._inode: Optional[int] = None
+        self._saved_offset: Optional[int] = None
+        self.resume_state: Optional[Dict[str, Any]] = None
+
+    def __enter__(self) -> "TelemetryTail":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def _open(self) -> bool:
+        try:
+            f = self.path.open("rb")
+        except FileNotFoundError:
+            return False
+
+        self._f = f
+        self._inode = os.fstat(f.fileno()).st_ino
+        self.offset = 0
+
+        checkpoint = self._load_checkpoint()
+        if checkpoint and checkpoint.get("inode") == self._inode:
+            offset = int(checkpoint.get("offset", 0))
+            if offset <= os.fstat(f.fileno()).st_size:
+                self.offset = offset
+                self.resume_state = checkpoint.get("state")
+                logger.info("Resuming %s at byte offset %d", self.path, offset)
+        return True
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return None
+        try:
+            with self.checkpoint_path.open("r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable checkpoint %s: %s", self.checkpoint_path, exc)
+            return None
+        if checkpoint.get("path") != str(self.path):
+            return None
+        return checkpoint
+
+    def save_checkpoint(self, state: Optional[Callable[[], Dict[str, Any]]] = None) -> None:
+        """
+        Atomically persist the current offset, and the result of ``state``
+        if given, if the offset changed since the last save.
+        """
+        if self.checkpoint_path is None or self._inode is None:
+            return
+        if self._saved_offset == self.offset:
+            return
+
+        checkpoint: Dict[str, Any] = {
+            "path": str(self.path),
+            "inode": self._inode,
+            "offset": self.offset,
+        }
+        if state is not None:
+            checkpoint["state"] = state()
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+        self._saved_offset = self.offset
+
+    def _read_lines(self, limit: int) -> List[bytes]:
+        assert self._f is not None
+        while True:
+            self._f.seek(self.offset)
+            data = self._f.read(limit)
+            end = data.rfind(b"\n")
+            if end >= 0:
+                break
+            if len(data) < limit:
+                # Only a partial line so far; wait for the writer to finish it
+                return []
+            # A single line longer than the read window
+            limit *= 2
+        self.offset += end + 1
+        return data[:end].split(b"\n")
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Return the records appended since the previous poll.
+        """
+        if self._f is None and not self._open():
+            return []
+        assert self._f is not None
+
+        size = os.fstat(self._f.fileno()).st_size
+        if size < self.offset:
+            logger.warning("%s was truncated; reading from the start", self.path)
+            self.offset = 0
+
+        start = self.offset
+        lines = self._read_lines(self.read_size)
+
+        if not lines:
+            try:
+                inode = os.stat(self.path).st_ino
+            except FileNotFoundError:
+                inode = None
+            if inode is not None and inode != self._inode:
+                logger.info("%s was rotated; following the new file", self.path)
+                self.close()
+                if self._open():
+                    self.offset = 0
+                    start = 0
+                    lines = self._read_lines(self.read_size)
+
+        return self._decode(lines, start)
+
+    def _decode(self, lines: List[bytes], start: int) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        position = start
+        for line in lines:
+            line_start = position
+            position += len(line) + 1
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                obj = json.loads(stripped)
+            except ValueError as exc:
+                logger.warning(
+                    "Skipping invalid JSON line at byte %d in %s: %s",
+                    line_start,
+                    self.path,
+                    exc,
+                )
+                continue
+            if isinstance(obj, dict):
+                records.append(obj)
+            else:
+                logger.warning(
+                    "Skipping non-object JSON line at byte %d in %s", line_start, self.path
+                )
+        return records
\ No newline at end of file
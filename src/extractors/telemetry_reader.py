@@ -1,28 +1,207 @@
 from __future__ import annotations
 
+import importlib
 import json
 import logging
+import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .binary_events import is_binary_event_file, iter_binary_records
+from .error_parser import effective_workers
 
 logger = logging.getLogger(__name__)
 
-def _read_json_array(path: Path) -> List[Dict[str, Any]]:
-    with path.open("r", encoding="utf-8") as f:
+# Keys that commonly wrap the record list in a top-level JSON object
+_WRAPPER_KEYS = ("records", "events", "data")
+
+_CHUNK_SIZE = 1 << 16
+# Upper bound for a single buffered JSON value; protects against reading a
+# corrupt file into memory while waiting for a value that never terminates.
+_MAX_VALUE_CHARS = 64 * 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+# Leading bytes of the compressed formats that are decompressed on the fly,
+# with the stdlib module that reads each
+_COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "lzma"),
+)
+_COMPRESSION_SUFFIXES = {".gz", ".gzip", ".bz2", ".xz"}
+
+def detect_compression(path: Path) -> Optional[str]:
+    """
+    Return the module that decompresses ``path`` ("gzip", "bz2" or "lzma"),
+    judged by its magic bytes, or None for an uncompressed file.
+    """
+    try:
+        with path.open("rb") as f:
+            head = f.read(6)
+    except OSError:
+        return None
+    for magic, module in _COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return module
+    return None
+
+def _format_suffix(path: Path) -> str:
+    """
+    Suffix naming the record format, ignoring a compression suffix
+    (``x.json.gz`` -> ``.json``).
+    """
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if suffixes and suffixes[-1] in _COMPRESSION_SUFFIXES:
+        suffixes.pop()
+    return suffixes[-1] if suffixes else ""
+
+def _open_text(path: Path, compression: Optional[str] = None) -> TextIO:
+    if compression is None:
+        return path.open("r", encoding="utf-8")
+    try:
+        module = importlib.import_module(compression)
+    except ImportError as exc:
+        raise ValueError(
+            f"Cannot read {path}: this Python lacks {compression} support"
+        ) from exc
+    return module.open(path, "rt", encoding="utf-8")
+
+def _read_json_array(path: Path, compression: Optional[str] = None) -> List[Dict[str, Any]]:
+    with _open_text(path, compression) as f:
         data = json.load(f)
 
     if isinstance(data, list):
         return data
     if isinstance(data, dict):
         # Common pattern: {"records": [...]} or {"events": [...]}
-        for key in ("records", "events", "data"):
+        for key in _WRAPPER_KEYS:
             if key in data and isinstance(data[key], list):
                 return data[key]  # type: ignore[return-value]
     raise ValueError(f"Unsupported JSON structure in {path}")
 
-def _read_json_lines(path: Path) -> List[Dict[str, Any]]:
-    records: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
+class _JsonStream:
+    """
+    Incremental cursor over a JSON document read from a text stream.
+
+    Only a bounded window of the file is buffered at any time, so arrays of
+    arbitrary length can be walked element by element.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int = _CHUNK_SIZE) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int | None = None) -> bool:
+        if self._eof:
+            return False
+        chunk = self._f.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Drop everything already consumed before growing the buffer
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Return the next non-whitespace character without consuming it,
+        or an empty string at end of input.
+        """
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found or 'end of input'!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """
+        Decode the next complete JSON value.
+        """
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                pending = len(self._buf) - self._pos
+                if pending > _MAX_VALUE_CHARS or not self._fill(max(pending, self._chunk_size)):
+                    raise
+                continue
+            # A value ending exactly at the buffer edge may be truncated
+            # (e.g. a number split across chunks); read ahead before trusting it.
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+    def iter_array(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            sep = self.peek()
+            self._pos += 1
+            if sep == "]":
+                return
+            if sep != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array but found {sep!r}")
+
+def _iter_json_array(path: Path, compression: Optional[str] = None) -> Iterator[Any]:
+    """
+    Stream the elements of a JSON array file without loading the whole document.
+
+    The array may be the top-level value or wrapped in an object under one of
+    the ``records``/``events``/``data`` keys; the first wrapper key encountered
+    is used.
+    """
+    with _open_text(path, compression) as f:
+        stream = _JsonStream(f)
+        first = stream.peek()
+
+        if first == "[":
+            yield from stream.iter_array()
+        elif first == "{":
+            stream.expect("{")
+            found = False
+            sep = stream.peek()
+            while sep != "}":
+                key = stream.value()
+                stream.expect(":")
+                if not found and key in _WRAPPER_KEYS and stream.peek() == "[":
+                    found = True
+                    yield from stream.iter_array()
+                else:
+                    stream.value()
+                sep = stream.peek()
+                if sep == ",":
+                    stream.expect(",")
+                elif sep != "}":
+                    raise ValueError(f"Expected ',' or '}}' in JSON object but found {sep!r}")
+            stream.expect("}")
+            if not found:
+                raise ValueError(f"Unsupported JSON structure in {path}")
+        else:
+            raise ValueError(f"Unsupported JSON structure in {path}")
+
+        if stream.peek():
+            raise ValueError(f"Unexpected trailing data in {path}")
+
+def _iter_json_lines(path: Path, compression: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    with _open_text(path, compression) as f:
         for line_no, line in enumerate(f, start=1):
             stripped = line.strip()
             if not stripped:
@@ -35,12 +214,14 @@ def _read_json_lines(path: Path) -> List[Dict[str, Any]]:
                 )
                 continue
             if isinstance(obj, dict):
-                records.append(obj)
+                yield obj
             else:
                 logger.warning(
                     "Skipping non-object JSON line %d in %s", line_no, path
                 )
-    return records
+
+def _read_json_lines(path: Path, compression: Optional[str] = None) -> List[Dict[str, Any]]:
+    return list(_iter_json_lines(path, compression))
 
 def read_telemetry_file(path: Path) -> List[Dict[str, Any]]:
     """
@@ -49,36 +230,113 @@ def read_telemetry_file(path: Path) -> List[Dict[str, Any]]:
     Supported formats:
       - JSON array of objects
       - JSONL / NDJSON (one JSON object per line) when the JSON array parse fails
+      - either of the above compressed with gzip, bzip2 or xz, detected by
+        magic bytes and decompressed while reading (``x.json.gz`` is read as
+        a JSON array)
+      - the binary normalized event format, detected by its magic bytes and
+        read through a memory map
     """
     if not path.exists():
         raise FileNotFoundError(f"Telemetry file not found: {path}")
 
-    if path.suffix.lower() == ".json":
+    if is_binary_event_file(path):
+        return list(iter_binary_records(path))
+
+    compression = detect_compression(path)
+    if _format_suffix(path) == ".json":
         try:
-            return _read_json_array(path)
+            return _read_json_array(path, compression)
         except Exception as exc:  # noqa: BLE001
             logger.warning(
                 "Failed to parse %s as JSON array (%s). Trying JSON lines.", path, exc
             )
-            return _read_json_lines(path)
+            return _read_json_lines(path, compression)
 
     # Fallback: assume JSON lines for other text formats
-    return _read_json_lines(path)
+    return _read_json_lines(path, compression)
 
-def merge_sources(paths: Iterable[Path]) -> List[Dict[str, Any]]:
+def iter_telemetry(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Stream telemetry records from a file one at a time.
+
+    Accepts the same formats as ``read_telemetry_file`` but keeps memory usage
+    independent of the file size; compressed files are decompressed as they
+    are consumed. The JSON lines fallback is only attempted if the array parse
+    fails before any record has been produced.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Telemetry file not found: {path}")
+
+    if is_binary_event_file(path):
+        yield from iter_binary_records(path)
+        return
+
+    compression = detect_compression(path)
+    if _format_suffix(path) == ".json":
+        produced = False
+        try:
+            for record in _iter_json_array(path, compression):
+                produced = True
+                yield record
+            return
+        except ValueError as exc:
+            if produced:
+                raise
+            logger.warning(
+                "Failed to parse %s as JSON array (%s). Trying JSON lines.", path, exc
+            )
+
+    # Fallback: assume JSON lines for other text formats
+    yield from _iter_json_lines(path, compression)
+
+def _read_source(path: Path) -> Tuple[List[Dict[str, Any]], Optional[BaseException]]:
+    """
+    Read one source, returning the error instead of raising so that worker
+    processes can hand it back to the caller for logging.
+    """
+    try:
+        return read_telemetry_file(path), None
+    except Exception as exc:  # noqa: BLE001
+        return [], exc
+
+def _log_source_error(path: Path, exc: BaseException) -> None:
+    if isinstance(exc, FileNotFoundError):
+        logger.error("Telemetry source not found: %s", path)
+    else:
+        logger.error("Failed to read telemetry from %s: %s", path, exc, exc_info=exc)
+
+def merge_sources(paths: Iterable[Path], workers: int = 1) -> List[Dict[str, Any]]:
     """
     Utility to ingest multiple files and merge telemetry streams.
+
+    With ``workers > 1`` files are read concurrently in a process pool of at
+    most one worker per available CPU; records are still concatenated in the
+    order of ``paths``. Use ``error_parser.parse_sources`` for parsed events
+    in timestamp order.
     """
+    paths = list(paths)
+    workers = effective_workers(workers)
     all_records: List[Dict[str, Any]] = []
-    for p in paths:
-        try:
-            records = read_telemetry_file(p)
-        except FileNotFoundError:
-            logger.error("Telemetry source not found: %s", p)
-            continue
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("Failed to read telemetry from %s: %s", p, exc)
-            continue
-        all_records.extend(records)
+
+    if workers <= 1 or len(paths) <= 1:
+        results: Iterable[Tuple[List[Dict[str, Any]], Optional[BaseException]]] = map(
+            _read_source, paths
+        )
+        pool = None
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(paths)))
+        results = pool.map(_read_source, paths)
+
+    try:
+        for p, (records, error) in zip(paths, results):
+            if error is not None:
+                _log_source_error(p, error)
+                continue
+            all_records.extend(records)
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     return all_records
\ No newline at end of file
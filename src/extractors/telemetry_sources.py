@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import glob
+import heapq
+import logging
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .error_parser import ErrorEvent, iter_parse_events
+from .telemetry_reader import _format_suffix, _log_source_error, iter_telemetry
+
+logger = logging.getLogger(__name__)
+
+# Files picked up when scanning a directory, judged by the suffix left after
+# dropping a compression suffix
+TELEMETRY_SUFFIXES = {".json", ".jsonl", ".ndjson"}
+
+_GLOB_MAGIC = re.compile(r"[*?[]")
+_YEAR = re.compile(r"\d{4}")
+_TWO_DIGITS = re.compile(r"\d{2}")
+# Other four-digit directory names (build numbers, ports) are not partitions
+PARTITION_YEARS = range(1970, 2100)
+
+def partition_span(parts: Sequence[str]) -> Optional[Tuple[datetime, datetime]]:
+    """
+    Time span covered by a ``YYYY[/MM[/DD]]`` run of directory names in
+    ``parts``, or None if there is none. Only years in ``PARTITION_YEARS``
+    count. The span is half-open and in UTC.
+    """
+    for i, part in enumerate(parts):
+        if not _YEAR.fullmatch(part):
+            continue
+        year = int(part)
+        if year not in PARTITION_YEARS:
+            continue
+        start = datetime(year, 1, 1, tzinfo=timezone.utc)
+        end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+
+        rest = parts[i + 1:i + 3]
+        if rest and _TWO_DIGITS.fullmatch(rest[0]) and 1 <= int(rest[0]) <= 12:
+            month = int(rest[0])
+            start = start.replace(month=month)
+            end = start.replace(year=year + month // 12, month=month % 12 + 1)
+            if len(rest) > 1 and _TWO_DIGITS.fullmatch(rest[1]):
+                try:
+                    start = start.replace(day=int(rest[1]))
+                except ValueError:
+                    pass  # Not a day of this month, so not a partition
+                else:
+                    end = datetime.fromordinal(start.toordinal() + 1).replace(tzinfo=timezone.utc)
+        return start, end
+    return None
+
+def _overlaps(parts: Sequence[str], since: Optional[datetime], until: Optional[datetime]) -> bool:
+    span = partition_span(parts)
+    if span is None:
+        return True
+    start, end = span
+    return (since is None or end > since) and (until is None or start < until)
+
+def _scan_directory(
+    root: Path, since: Optional[datetime], until: Optional[datetime]
+) -> List[Path]:
+    """
+    Telemetry files below ``root`` in path order, skipping hidden entries and
+    time partitions outside ``[since, until)``.
+    """
+    found: List[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_parts = Path(dirpath).relative_to(root).parts
+        dirnames[:] = sorted(
+            name
+            for name in dirnames
+            if not name.startswith(".") and _overlaps(rel_parts + (name,), since, until)
+        )
+        for name in sorted(filenames):
+            path = Path(dirpath) / name
+            if not name.startswith(".") and _format_suffix(path) in TELEMETRY_SUFFIXES:
+                found.append(path)
+    return found
+
+def _expand_glob(
+    pattern: str, since: Optional[datetime], until: Optional[datetime]
+) -> List[Path]:
+    # Partitions are only looked for below the literal part of the pattern
+    parts = Path(pattern).parts
+    anchor = next((i for i, part in enumerate(parts) if _GLOB_MAGIC.search(part)), len(parts))
+
+    found: List[Path] = []
+    for match in sorted(glob.glob(pattern, recursive=True)):
+        path = Path(match)
+        if path.is_file() and _overlaps(path.parent.parts[anchor:], since, until):
+            found.append(path)
+    return found
+
+def discover_sources(
+    specs: Iterable[Any],
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    exclude: Iterable[Path] = (),
+) -> List[Path]:
+    """
+    Resolve files, directories and glob patterns into telemetry files.
+
+    Directories are scanned recursively for JSON and JSON lines files
+    (compressed or not); glob patterns may use ``**``. Directories named
+    ``YYYY``, ``MM`` and ``DD`` (e.g. ``2025/11/10/``) are taken as time
+    partitions, and partitions entirely outside ``[since, until)`` are not
+    entered. Plain file paths are returned as given, even if missing, so the
+    reader reports them. Files in ``exclude``, or below a directory in it,
+    are left out of scans and glob matches. Each file is listed once.
+    """
+    excluded = {path.resolve() for path in exclude}
+
+    def discovered(found: List[Path]) -> List[Path]:
+        resolved = (path.resolve() for path in found)
+        return [path for path in resolved if excluded.isdisjoint((path, *path.parents))]
+
+    seen = set()
+    sources: List[Path] = []
+    for spec in specs:
+        text = str(spec)
+        path = Path(text)
+        if _GLOB_MAGIC.search(text) and not path.exists():
+            found = discovered(_expand_glob(text, since, until))
+            if not found:
+                logger.warning("No telemetry files match %s", text)
+        elif path.is_dir():
+            found = discovered(_scan_directory(path, since, until))
+            if not found:
+                logger.warning("No telemetry files found in %s", path)
+        else:
+            found = [path.resolve()]
+
+        for source in found:
+            if source not in seen:
+                seen.add(source)
+                sources.append(source)
+    return sources
+
+class MergedTelemetry:
+    """
+    Parsed events of several telemetry files as one stream in timestamp order.
+
+    Files are read and parsed on a pool of ``workers`` threads, each stream
+    keeping one chunk of ``CHUNK_SIZE`` events in flight ahead of the merge,
+    so reading, decompression and parsing of different files overlap while
+    memory stays bounded by the number of files. The streams are combined
+    with a k-way heap merge; the result is in timestamp order as long as
+    every file is, and events with equal timestamps keep file order.
+
+    With ``since``/``until`` only events in ``[since, until)`` are yielded.
+    A file that cannot be read is logged and contributes what was read
+    before the error. ``records`` counts the raw records read so far.
+    With ``raw_severity`` events keep the severity value of the record.
+    """
+
+    CHUNK_SIZE = 1024
+
+    def __init__(
+        self,
+        paths: Sequence[Path],
+        config: Dict[str, Any],
+        workers: int = 4,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        raw_severity: bool = False,
+    ) -> None:
+        self.paths = list(paths)
+        self.config = config
+        self.workers = max(1, workers)
+        self.since = since
+        self.until = until
+        self.raw_severity = raw_severity
+        self._counts = [0] * len(self.paths)
+
+    @classmethod
+    def from_config(
+        cls,
+        paths: Sequence[Path],
+        config: Dict[str, Any],
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        raw_severity: bool = False,
+    ) -> "MergedTelemetry":
+        workers = int(config.get("ingestion", {}).get("read_workers", 4))
+        return cls(paths, config, workers, since, until, raw_severity)
+
+    @property
+    def records(self) -> int:
+        return sum(self._counts)
+
+    def __str__(self) -> str:
+        return f"{len(self.paths)} telemetry sources"
+
+    def _events(self, index: int) -> Iterator[ErrorEvent]:
+        path = self.paths[index]
+        counts = self._counts
+
+        def records() -> Iterator[Dict[str, Any]]:
+            for record in iter_telemetry(path):
+                counts[index] += 1
+                yield record
+
+        try:
+            yield from iter_parse_events(records(), self.config, self.raw_severity)
+        except Exception as exc:  # noqa: BLE001
+            _log_source_error(path, exc)
+
+    def _prefetched(
+        self, pool: ThreadPoolExecutor, events: Iterator[ErrorEvent]
+    ) -> Iterator[ErrorEvent]:
+        chunk_size = self.CHUNK_SIZE
+
+        def next_chunk() -> List[ErrorEvent]:
+            return list(islice(events, chunk_size))
+
+        pending: Future = pool.submit(next_chunk)
+        while True:
+            chunk = pending.result()
+            if not chunk:
+                return
+            pending = pool.submit(next_chunk)
+            yield from chunk
+
+    def __iter__(self) -> Iterator[ErrorEvent]:
+        self._counts = [0] * len(self.paths)
+        sources = [self._events(index) for index in range(len(self.paths))]
+        with ThreadPoolExecutor(
+            max_workers=min(self.workers, max(1, len(sources))),
+            thread_name_prefix="telemetry-reader",
+        ) as pool:
+            streams = [self._prefetched(pool, events) for events in sources]
+            try:
+                merged = heapq.merge(*streams, key=attrgetter("timestamp"))
+                since, until = self.since, self.until
+                if since is None and until is None:
+                    yield from merged
+                else:
+                    for ev in merged:
+                        if (since is None or ev.timestamp >= since) and (
+                            until is None or ev.timestamp < until
+                        ):
+                            yield ev
+            finally:
+                for stream in streams:
+                    stream.close()
+        for events in sources:
+            events.close()
\ No newline at end of file
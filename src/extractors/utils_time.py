@@ -1,9 +1,43 @@
 from __future__ import annotations
 
+import re
+import sys
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
-def parse_timestamp(value: str) -> datetime:
+# datetime.fromisoformat() understands a trailing "Z" from Python 3.11 on
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Epoch values at or above this magnitude are taken to be milliseconds
+# (1e11 seconds would be in the year 5138).
+_EPOCH_MS_THRESHOLD = 10**11
+
+# Plain numeric strings long enough to be epoch values rather than a compact
+# ISO date such as 20251110.
+_EPOCH_TEXT = re.compile(r"-?\d{9,}(?:\.\d+)?")
+
+def _from_epoch(value: Any) -> datetime:
+    if isinstance(value, str):
+        value = float(value) if "." in value else int(value)
+
+    if abs(value) >= _EPOCH_MS_THRESHOLD:
+        # Exact to the millisecond: the float error is far below 1 microsecond
+        value = value / 1000
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+def _is_epoch(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    # ISO dates have a dash at index 4, which rules them out cheaply
+    return (
+        isinstance(value, str)
+        and value[4:5] != "-"
+        and _EPOCH_TEXT.fullmatch(value) is not None
+    )
+
+def parse_timestamp(value: Any) -> datetime:
     """
     Parse an ISO-8601-like timestamp into a timezone-aware UTC datetime.
 
@@ -11,29 +45,38 @@ def parse_timestamp(value: str) -> datetime:
       - 2025-11-10T10:15:30Z
       - 2025-11-10T10:15:30+00:00
       - 2025-11-10 10:15:30
+      - epoch seconds or milliseconds (int, float or numeric string)
+      - datetime instances (naive values are taken as UTC)
     """
-    if not value:
-        raise ValueError("Empty timestamp")
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _from_epoch(value)
+    else:
+        if not value:
+            raise ValueError("Empty timestamp")
 
-    text = value.strip()
+        text = value.strip() if isinstance(value, str) else str(value).strip()
+        if text[4:5] != "-" and _EPOCH_TEXT.fullmatch(text):
+            return _from_epoch(text)
 
-    # Normalize trailing Z to +00:00
-    if text.endswith("Z"):
-        text = text[:-1] + "+00:00"
+        # Normalize trailing Z to +00:00
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
 
-    # Try full ISO parsing first
-    try:
-        dt = datetime.fromisoformat(text)
-    except ValueError:
-        # Fallback formats
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
-            try:
-                dt = datetime.strptime(text, fmt)
-                break
-            except ValueError:
-                continue
-        else:
-            raise
+        # Try full ISO parsing first
+        try:
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            # Fallback formats
+            for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
+                try:
+                    dt = datetime.strptime(text, fmt)
+                    break
+                except ValueError:
+                    continue
+            else:
+                raise
 
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
@@ -42,6 +85,115 @@ def parse_timestamp(value: str) -> datetime:
 
     return dt
 
+class TimestampParser:
+    """
+    Timestamp parser specialized for a single source.
+
+    The first value decides which fast path serves the rest of the source:
+    ISO strings with an explicit zone, naive ISO strings (taken as UTC) or
+    epoch numbers. When values have whole-second resolution they are memoized,
+    since bursts of telemetry share them heavily. Values the fast path rejects
+    go through ``parse_timestamp``, and a steady stream of such misses makes
+    the parser sniff the format again.
+    """
+
+    CACHE_SIZE = 4096
+    RESNIFF_EVERY = 64
+
+    def __init__(self) -> None:
+        self._fast: Optional[Callable[[Any], Optional[datetime]]] = None
+        self._memo: Dict[Any, datetime] = {}
+        self.misses = 0
+
+    def __call__(self, value: Any) -> datetime:
+        fast = self._fast
+        if fast is None:
+            fast = self._fast = self._sniff(value)
+
+        dt = fast(value)
+        if dt is None:
+            self.misses += 1
+            if self.misses % self.RESNIFF_EVERY == 0:
+                self._fast = None
+            return parse_timestamp(value)
+        return dt
+
+    def _sniff(self, value: Any) -> Callable[[Any], Optional[datetime]]:
+        if _is_epoch(value):
+            candidates = [self._epoch_parser()]
+        elif isinstance(value, str):
+            candidates = [self._iso_parser(), self._naive_parser()]
+        else:
+            candidates = []
+
+        for parser in candidates:
+            if parser(value) is not None:
+                return parser
+        return parse_timestamp
+
+    def _memoized(
+        self, parse: Callable[[Any], Optional[datetime]], key_type: type
+    ) -> Callable[[Any], Optional[datetime]]:
+        memo = self._memo
+        limit = self.CACHE_SIZE
+
+        def parse_memoized(value: Any) -> Optional[datetime]:
+            # Sub-second values rarely repeat, so they bypass the memo
+            if type(value) is not key_type or (key_type is str and "." in value):
+                return parse(value)
+            dt = memo.get(value)
+            if dt is None:
+                dt = parse(value)
+                if dt is not None:
+                    if len(memo) >= limit:
+                        memo.clear()
+                    memo[value] = dt
+            return dt
+
+        return parse_memoized
+
+    def _epoch_parser(self) -> Callable[[Any], Optional[datetime]]:
+        def parse_epoch(value: Any) -> Optional[datetime]:
+            if not _is_epoch(value):
+                return None
+            return _from_epoch(value)
+
+        return self._memoized(parse_epoch, int)
+
+    def _iso_parser(self) -> Callable[[Any], Optional[datetime]]:
+        fromisoformat = datetime.fromisoformat
+        utc = timezone.utc
+
+        def parse_iso(value: Any) -> Optional[datetime]:
+            if type(value) is not str:
+                return None
+            if not _FROMISOFORMAT_ACCEPTS_Z and value[-1:] == "Z":
+                value = value[:-1] + "+00:00"
+            try:
+                dt = fromisoformat(value)
+            except ValueError:
+                return None
+            tz = dt.tzinfo
+            if tz is None:
+                return None
+            return dt if tz is utc else dt.astimezone(utc)
+
+        return self._memoized(parse_iso, str)
+
+    def _naive_parser(self) -> Callable[[Any], Optional[datetime]]:
+        fromisoformat = datetime.fromisoformat
+
+        def parse_naive(value: Any) -> Optional[datetime]:
+            if type(value) is not str:
+                return None
+            # Appending the zone is much cheaper than datetime.replace(tzinfo=...)
+            try:
+                return fromisoformat(value + "+00:00")
+            except ValueError:
+                return None
+
+        return self._memoized(parse_naive, str)
+
 def format_timestamp(dt: datetime, *, with_timezone: bool = True) -> str:
     """
     Format a datetime in a consistent ISO representation.
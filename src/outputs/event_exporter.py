@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from json.encoder import encode_basestring_ascii
+from pathlib import Path
+from typing import Dict, Iterable, Optional, TextIO, Union
+
+from extractors.binary_events import BinaryEventWriter
+from extractors.error_parser import ErrorEvent
+from extractors.event_dedup import Episode
+
+logger = logging.getLogger(__name__)
+
+# One event as json.dumps(asdict(event), default=str, indent=2) renders it,
+# indented by one more level to sit inside the top-level array.
+_JSON_EVENT = (
+    "{{\n"
+    '    "timestamp": {},\n'
+    '    "subsystem": {},\n'
+    '    "error_code": {},\n'
+    '    "severity": {},\n'
+    '    "description": {},\n'
+    '    "telemetry_id": {},\n'
+    '    "resolved": {}{}\n'
+    "  }}"
+)
+_JSON_EPISODE_FIELDS = ',\n    "last_timestamp": {},\n    "count": {}'
+
+_JSONL_EVENT = (
+    '{{"timestamp":{},"subsystem":{},"error_code":{},"severity":{},'
+    '"description":{},"telemetry_id":{},"resolved":{}{}}}\n'
+)
+_JSONL_EPISODE_FIELDS = ',"last_timestamp":{},"count":{}'
+
+def _json_value(value: object) -> str:
+    if type(value) is str:
+        return encode_basestring_ascii(value)
+    return json.dumps(value, default=str)
+
+def _json_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+def _reopen_json_array(path: Path) -> bool:
+    """
+    Cut the closing bracket off the JSON array in ``path`` so more events can
+    be written after it, and return whether the array holds any yet.
+    """
+    with path.open("r+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        start = f.seek(max(0, size - 64))
+        tail = f.read().rstrip()
+        if not tail.endswith(b"]"):
+            raise ValueError(f"{path} does not end in a JSON array")
+        tail = tail[:-1].rstrip()
+        f.truncate(start + len(tail))
+    return not tail.endswith(b"[")
+
+class _EventWriter(ABC):
+    """
+    Base class for incremental event writers: ``open``, ``write`` once per
+    event, ``close``. Usable as a context manager. With ``append`` the
+    events are added to those already in ``path``, if it exists; ``count``
+    only covers the ones written by this writer.
+    """
+
+    def __init__(self, path: Path, append: bool = False) -> None:
+        self.path = path
+        self.append = append
+        self.count = 0
+
+    def __enter__(self) -> "_EventWriter":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @abstractmethod
+    def open(self) -> None:
+        ...
+
+    @abstractmethod
+    def write(self, event: ErrorEvent) -> None:
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        ...
+
+class NormalizedEventWriter(_EventWriter):
+    """
+    Incrementally write normalized events as a JSON array.
+
+    The output is identical to ``json.dump(events, f, default=str, indent=2)``
+    with events as ``asdict`` renders them (so episodes end with
+    ``last_timestamp`` and ``count``), but events are serialized one at a
+    time, so the full list never has to be held in memory, and straight from
+    their fields rather than through an intermediate dict.
+    """
+
+    def __init__(self, path: Path, append: bool = False) -> None:
+        super().__init__(path, append)
+        self._f: Optional[TextIO] = None
+        self._empty = True
+
+    def open(self) -> None:
+        if self.append and self.path.exists() and self.path.stat().st_size:
+            self._empty = not _reopen_json_array(self.path)
+            self._f = self.path.open("a", encoding="utf-8")
+        else:
+            self._empty = True
+            self._f = self.path.open("w", encoding="utf-8")
+            self._f.write("[")
+
+    def write(self, event: ErrorEvent) -> None:
+        if self._f is None:
+            raise RuntimeError("Writer is not open")
+        self._f.write("\n  " if self._empty else ",\n  ")
+        self._f.write(
+            _JSON_EVENT.format(
+                _json_value(str(event.timestamp)),
+                _json_value(event.subsystem),
+                _json_value(event.error_code),
+                _json_value(event.severity),
+                _json_value(event.description),
+                _json_value(event.telemetry_id),
+                _json_bool(event.resolved),
+                _JSON_EPISODE_FIELDS.format(
+                    _json_value(str(event.last_timestamp)),  # type: ignore[attr-defined]
+                    event.count,  # type: ignore[attr-defined]
+                )
+                if type(event) is Episode
+                else "",
+            )
+        )
+        self.count += 1
+        self._empty = False
+
+    def close(self) -> None:
+        if self._f is None:
+            return
+        self._f.write("]" if self._empty else "\n]")
+        self._f.close()
+        self._f = None
+
+class JsonLinesEventWriter(_EventWriter):
+    """
+    Write normalized events as compact JSON lines, one object per event,
+    with ISO-8601 timestamps. Episodes add ``last_timestamp`` and ``count``.
+    """
+
+    def __init__(self, path: Path, append: bool = False) -> None:
+        super().__init__(path, append)
+        self._f: Optional[TextIO] = None
+
+    def open(self) -> None:
+        self._f = self.path.open("a" if self.append else "w", encoding="utf-8")
+
+    def write(self, event: ErrorEvent) -> None:
+        if self._f is None:
+            raise RuntimeError("Writer is not open")
+        self._f.write(
+            _JSONL_EVENT.format(
+                _json_value(event.timestamp.isoformat()),
+                _json_value(event.subsystem),
+                _json_value(event.error_code),
+                _json_value(event.severity),
+                _json_value(event.description),
+                _json_value(event.telemetry_id),
+                _json_bool(event.resolved),
+                _JSONL_EPISODE_FIELDS.format(
+                    _json_value(event.last_timestamp.isoformat()),  # type: ignore[attr-defined]
+                    event.count,  # type: ignore[attr-defined]
+                )
+                if type(event) is Episode
+                else "",
+            )
+        )
+        self.count += 1
+
+    def close(self) -> None:
+        if self._f is None:
+            return
+        self._f.close()
+        self._f = None
+
+EventWriter = Union[_EventWriter, BinaryEventWriter]
+
+EXPORT_FORMATS: Dict[str, type] = {
+    "json": NormalizedEventWriter,
+    "jsonl": JsonLinesEventWriter,
+    "binary": BinaryEventWriter,
+}
+
+EXPORT_SUFFIXES = {"json": ".json", "jsonl": ".jsonl", "binary": ".bin"}
+
+def normalized_events_path(output_dir: Path, export_format: str = "json") -> Path:
+    return output_dir / f"normalized_events{EXPORT_SUFFIXES[export_format]}"
+
+def open_event_writer(
+    path: Path, export_format: str = "json", append: bool = False
+) -> EventWriter:
+    try:
+        writer_cls = EXPORT_FORMATS[export_format]
+    except KeyError:
+        raise ValueError(f"Unknown export format: {export_format}") from None
+    return writer_cls(path, append)
+
+def write_normalized_events(
+    events: Iterable[ErrorEvent], path: Path, export_format: str = "json", append: bool = False
+) -> int:
+    """
+    Stream ``events`` to ``path`` in ``export_format`` ("json", "jsonl" or
+    "binary"), after the events already there with ``append``.
+
+    Returns the number of events written.
+    """
+    with open_event_writer(path, export_format, append) as writer:
+        for ev in events:
+            writer.write(ev)
+
+    logger.debug("Wrote %d normalized events to %s", writer.count, path)
+    return writer.count
\ No newline at end of file
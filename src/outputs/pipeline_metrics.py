@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    import cProfile
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+METRICS_FILENAME = "pipeline_metrics.json"
+
+# Stages run_pipeline reports, in pipeline order. A streaming run reads,
+# parses, exports and alerts in the single "stream" stage.
+STAGES = (
+    "cache_load",
+    "read",
+    "parse",
+    "stream",
+    "aggregate",
+    "cache_store",
+    "dedup",
+    "snapshot",
+    "report",
+    "export",
+    "index",
+    "alerts",
+)
+
+def _cpu_seconds() -> float:
+    """
+    CPU time of this process and of its reaped children (e.g. parse workers).
+    """
+    t = os.times()
+    return time.process_time() + t.children_user + t.children_system
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Peak resident set size of this process so far, or None if unknown.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def _rate(records: Optional[int], seconds: float) -> Optional[float]:
+    if records is None or seconds <= 0:
+        return None
+    return round(records / seconds, 1)
+
+class StageMetrics:
+    """
+    Timings of one pipeline stage. ``records`` may be set inside the stage.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.records: Optional[int] = None
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_rss_bytes: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "records": self.records,
+            "records_per_second": _rate(self.records, self.wall_seconds),
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+
+class PipelineMetrics:
+    """
+    Per-stage wall/CPU time, throughput and peak memory of a pipeline run.
+
+    Stages are timed with the ``stage`` context manager. Peak memory is the
+    process RSS high-water mark when each stage ends, which costs nothing to
+    read, unlike tracemalloc. When ``profile_stage`` names a stage, that stage
+    runs under cProfile and the stats are dumped next to the metrics file.
+    """
+
+    def __init__(self, profile_stage: Optional[str] = None) -> None:
+        self.profile_stage = profile_stage
+        self.stages: List[StageMetrics] = []
+        self.info: Dict[str, Any] = {}
+        self.records: Optional[int] = None
+        self.events: Optional[int] = None
+        self.started_at = datetime.now(timezone.utc)
+        self._wall_start = time.perf_counter()
+        self._cpu_start = _cpu_seconds()
+        self._profile: Optional[cProfile.Profile] = None
+
+    @contextmanager
+    def stage(self, name: str, records: Optional[int] = None) -> Iterator[StageMetrics]:
+        metrics = StageMetrics(name)
+        metrics.records = records
+        profile = None
+        if name == self.profile_stage:
+            import cProfile
+
+            profile = self._profile = self._profile or cProfile.Profile()
+        wall_start = time.perf_counter()
+        cpu_start = _cpu_seconds()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield metrics
+        finally:
+            if profile is not None:
+                profile.disable()
+            metrics.wall_seconds = time.perf_counter() - wall_start
+            metrics.cpu_seconds = _cpu_seconds() - cpu_start
+            metrics.peak_rss_bytes = peak_rss_bytes()
+            self.stages.append(metrics)
+            logger.debug(
+                "Stage %s took %.3fs wall, %.3fs CPU",
+                name,
+                metrics.wall_seconds,
+                metrics.cpu_seconds,
+            )
+
+    @property
+    def parse_failures(self) -> Optional[int]:
+        if self.records is None or self.events is None:
+            return None
+        return self.records - self.events
+
+    def to_dict(self) -> Dict[str, Any]:
+        wall = time.perf_counter() - self._wall_start
+        return {
+            "started_at": self.started_at.isoformat(),
+            **self.info,
+            "wall_seconds": round(wall, 6),
+            "cpu_seconds": round(_cpu_seconds() - self._cpu_start, 6),
+            "records": self.records,
+            "events": self.events,
+            "parse_failures": self.parse_failures,
+            "records_per_second": _rate(self.records, wall),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "stages": [stage.to_dict() for stage in self.stages],
+        }
+
+    def write(self, output_dir: Path) -> Path:
+        """
+        Write the metrics (and the profile, if one was taken) to ``output_dir``.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        path = output_dir / METRICS_FILENAME
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logger.info("Pipeline metrics written to %s", path)
+
+        if self._profile is not None:
+            profile_path = output_dir / f"profile_{self.profile_stage}.prof"
+            self._profile.dump_stats(str(profile_path))
+            logger.info(
+                "Profile of stage %r written to %s (inspect with python -m pstats)",
+                self.profile_stage,
+                profile_path,
+            )
+        elif self.profile_stage is not None:
+            logger.warning("Stage %r did not run; no profile written", self.profile_stage)
+        return path
\ No newline at end of file
@@ -1,19 +1,228 @@
 from __future__ import annotations
 
+import csv
+import heapq
+import json
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 from extractors.error_parser import ErrorEvent
+from extractors.event_dedup import Episode, event_from_state, event_state
+from extractors.event_table import EventTable
 from extractors.utils_time import format_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Number of events shown in the timeline section
+TIMELINE_LIMIT = 20
+
+@dataclass(frozen=True)
+class TimelineOptions:
+    """
+    Which events the timeline sections show: the ``head`` earliest and
+    ``tail`` latest events overall, and the ``per_severity`` earliest events
+    of each severity in a section of their own (0 disables a window).
+    """
+
+    head: int = TIMELINE_LIMIT
+    tail: int = 0
+    per_severity: int = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "TimelineOptions":
+        report_cfg = config.get("report", {})
+        return cls(
+            head=int(report_cfg.get("timeline_head", TIMELINE_LIMIT)),
+            tail=int(report_cfg.get("timeline_tail", 0)),
+            per_severity=int(report_cfg.get("timeline_per_severity", 0)),
+        )
+
+class Timeline(NamedTuple):
+    """
+    The selected timeline windows, each in time order.
+    """
+
+    head: List[ErrorEvent]
+    tail: List[ErrorEvent]
+    # severity -> (earliest events, number of events of that severity)
+    by_severity: Dict[str, Tuple[List[ErrorEvent], int]]
+    total_events: int
+
+class TimelineBuffer:
+    """
+    Bounded buffer of the earliest (and optionally latest) events seen in a
+    stream.
+
+    Keeps at most ``head + tail`` events plus ``per_severity`` per severity,
+    so the timeline sections can be rendered without retaining the whole
+    stream. Ties keep arrival order, matching a stable sort of the full event
+    list.
+    """
+
+    def __init__(self, options: Optional[TimelineOptions] = None) -> None:
+        self.options = options or TimelineOptions()
+        self.total_events = 0
+        # Max-heap via negated keys: the root is the latest retained event
+        self._heap: List[Any] = []
+        # Min-heap: the root is the earliest of the latest events
+        self._tail_heap: List[Any] = []
+        self._by_severity: Dict[str, TimelineBuffer] = {}
+
+    def add(self, ev: ErrorEvent) -> None:
+        options = self.options
+        ts = ev.timestamp.timestamp()
+        seq = self.total_events
+        self.total_events += 1
+
+        key = (-ts, -seq)
+        if len(self._heap) < options.head:
+            heapq.heappush(self._heap, (key, ev))
+        elif options.head and key > self._heap[0][0]:
+            heapq.heapreplace(self._heap, (key, ev))
+
+        if options.tail:
+            key = (ts, seq)
+            if len(self._tail_heap) < options.tail:
+                heapq.heappush(self._tail_heap, (key, ev))
+            elif key > self._tail_heap[0][0]:
+                heapq.heapreplace(self._tail_heap, (key, ev))
+
+        if options.per_severity:
+            buffer = self._by_severity.get(ev.severity)
+            if buffer is None:
+                buffer = self._by_severity[ev.severity] = TimelineBuffer(
+                    TimelineOptions(head=options.per_severity)
+                )
+            buffer.add(ev)
+
+    def update(self, events: Iterable[ErrorEvent]) -> None:
+        for ev in events:
+            self.add(ev)
+
+    def events(self) -> List[ErrorEvent]:
+        """
+        Return the retained earliest events in time order.
+        """
+        return [ev for _, ev in sorted(self._heap, key=lambda item: item[0], reverse=True)]
+
+    def latest(self) -> List[ErrorEvent]:
+        """
+        Return the retained latest events in time order.
+        """
+        return [ev for _, ev in sorted(self._tail_heap, key=lambda item: item[0])]
+
+    def timeline(self) -> Timeline:
+        return Timeline(
+            self.events(),
+            self.latest(),
+            {
+                sev: (buffer.events(), buffer.total_events)
+                for sev, buffer in self._by_severity.items()
+            },
+            self.total_events,
+        )
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Return the buffer as JSON-serializable data; each retained event is
+        stored with its arrival number so ties still resolve the same way.
+        """
+        options = self.options
+        return {
+            "options": [options.head, options.tail, options.per_severity],
+            "total_events": self.total_events,
+            "head": [[-key[1], event_state(ev)] for key, ev in self._heap],
+            "tail": [[key[1], event_state(ev)] for key, ev in self._tail_heap],
+            "by_severity": {
+                sev: buffer.to_state() for sev, buffer in self._by_severity.items()
+            },
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "TimelineBuffer":
+        """
+        Rebuild a buffer from ``to_state`` output.
+        """
+        buffer = cls(TimelineOptions(*state["options"]))
+        buffer.total_events = int(state["total_events"])
+        # Stored in heap order, and the keys come out the same, so the
+        # lists are valid heaps as they are
+        for seq, row in state["head"]:
+            ev = event_from_state(row)
+            buffer._heap.append(((-ev.timestamp.timestamp(), -seq), ev))
+        for seq, row in state["tail"]:
+            ev = event_from_state(row)
+            buffer._tail_heap.append(((ev.timestamp.timestamp(), seq), ev))
+        buffer._by_severity = {
+            sev: cls.from_state(sub_state) for sev, sub_state in state["by_severity"].items()
+        }
+        return buffer
+
+def _timestamp(ev: ErrorEvent) -> Any:
+    return ev.timestamp
+
+def select_timeline(
+    events: Sequence[ErrorEvent],
+    options: TimelineOptions,
+    total_events: Optional[int] = None,
+) -> Timeline:
+    """
+    Pick the timeline windows out of ``events`` (a list or an ``EventTable``)
+    by bounded selection rather than sorting the whole sequence.
+    """
+    if total_events is None:
+        total_events = len(events)
+    if isinstance(events, EventTable):
+        head = events.earliest(options.head)
+        tail = events.latest(options.tail) if options.tail else []
+        by_severity = {}
+        if options.per_severity:
+            for sev, count in events.severity.counts().items():
+                by_severity[sev] = (events.earliest(options.per_severity, sev), count)
+        return Timeline(head, tail, by_severity, total_events)
+
+    head = heapq.nsmallest(options.head, events, key=_timestamp)
+    tail: List[ErrorEvent] = []
+    if options.tail:
+        # nlargest keeps the first of equal keys, so scan backwards to prefer
+        # the later events, as the tail of a stable sort would
+        tail = heapq.nlargest(options.tail, reversed(events), key=_timestamp)
+        tail.reverse()
+    by_severity = {}
+    if options.per_severity:
+        buffer = TimelineBuffer(TimelineOptions(head=0, per_severity=options.per_severity))
+        buffer.update(events)
+        by_severity = buffer.timeline().by_severity
+    return Timeline(head, tail, by_severity, total_events)
+
 def _format_summary(summary: Dict[str, Any]) -> str:
     lines: List[str] = []
 
     lines.append("=== Error Summary ===")
     lines.append(f"Total events: {summary.get('total_events', 0)}")
+    dedup = summary.get("dedup")
+    if dedup is not None:
+        lines.append(f"Duplicate events dropped: {dedup['duplicates_dropped']}")
+        if dedup["episode_gap_seconds"] is not None:
+            lines.append(
+                f"Repeats collapsed into episodes: {dedup['events_collapsed']} "
+                f"(gap {dedup['episode_gap_seconds']:g}s); counts below are per episode"
+            )
     lines.append("")
 
     lines.append("By severity:")
@@ -30,15 +239,22 @@ def _format_summary(summary: Dict[str, Any]) -> str:
         lines.append(f"  - {sub}: {count}")
     lines.append("")
 
-    lines.append("Top recurring error patterns:")
+    error_bound = summary.get("top_error_patterns_error_bound")
+    if error_bound is None:
+        lines.append("Top recurring error patterns:")
+    else:
+        lines.append(
+            f"Top recurring error patterns (approximate, counts overestimate by at most {error_bound}):"
+        )
     patterns: Iterable[Dict[str, Any]] = summary.get("top_error_patterns", [])
     if not patterns:
         lines.append("  (none)")
     else:
         for entry in patterns:
-            lines.append(
-                f"  - {entry['subsystem']} / {entry['error_code']}: {entry['count']} occurrences"
-            )
+            line = f"  - {entry['subsystem']} / {entry['error_code']}: {entry['count']} occurrences"
+            if entry.get("max_error"):
+                line += f" (may overcount by up to {entry['max_error']})"
+            lines.append(line)
 
     lines.append("")
     lines.append("Unresolved errors by subsystem:")
@@ -51,53 +267,195 @@ def _format_summary(summary: Dict[str, Any]) -> str:
 
     return "\n".join(lines)
 
-def _format_timeline(events: List[ErrorEvent]) -> str:
-    if not events:
-        return "No events recorded."
+def _format_event(ev: ErrorEvent) -> str:
+    ts = format_timestamp(ev.timestamp)
+    status = "RESOLVED" if ev.resolved else "UNRESOLVED"
+    line = (
+        f"[{ts}] [{ev.severity}] [{status}] "
+        f"{ev.subsystem} / {ev.error_code} - {ev.description}"
+    )
+    if type(ev) is Episode:
+        line += f" (x{ev.count} until {format_timestamp(ev.last_timestamp)})"
+    return line
 
-    # Sort by time ascending
-    sorted_events = sorted(events, key=lambda e: e.timestamp)
+def _tail_window(timeline: Timeline) -> Tuple[List[ErrorEvent], int]:
+    """
+    The latest events not already listed among the earliest ones, and how
+    many events neither window shows.
+    """
+    total = timeline.total_events
+    tail_count = min(len(timeline.tail), max(total - len(timeline.head), 0))
+    omitted = total - len(timeline.head) - tail_count
+    return timeline.tail[len(timeline.tail) - tail_count:], omitted
 
-    lines: List[str] = []
-    lines.append("=== Event Timeline (first 20 events) ===")
+def _format_timeline(timeline: Timeline, options: TimelineOptions) -> Iterator[str]:
+    if not timeline.total_events:
+        yield "No events recorded."
+        return
 
-    for ev in sorted_events[:20]:
-        ts = format_timestamp(ev.timestamp)
-        status = "RESOLVED" if ev.resolved else "UNRESOLVED"
-        lines.append(
-            f"[{ts}] [{ev.severity}] [{status}] "
-            f"{ev.subsystem} / {ev.error_code} - {ev.description}"
+    if options.tail:
+        yield (
+            f"=== Event Timeline (first {options.head} and last {options.tail} events) ==="
         )
+    else:
+        yield f"=== Event Timeline (first {options.head} events) ==="
 
-    if len(sorted_events) > 20:
-        lines.append(f"... {len(sorted_events) - 20} more events omitted for brevity.")
+    for ev in timeline.head:
+        yield _format_event(ev)
 
-    return "\n".join(lines)
+    tail, omitted = _tail_window(timeline)
+    if omitted > 0:
+        yield f"... {omitted} more events omitted for brevity."
+    for ev in tail:
+        yield _format_event(ev)
+
+def _format_severity_timeline(
+    severity: str, events: List[ErrorEvent], total: int, limit: int
+) -> Iterator[str]:
+    yield f"=== {severity} Timeline (first {limit} events) ==="
+    for ev in events:
+        yield _format_event(ev)
+    if total > len(events):
+        yield f"... {total - len(events)} more {severity} events omitted for brevity."
+
+def _write_section(f: TextIO, lines: Iterable[str]) -> None:
+    f.write("\n\n")
+    f.write("\n".join(lines))
+
+def _render_text(
+    f: TextIO, summary: Dict[str, Any], timeline: Timeline, options: TimelineOptions
+) -> None:
+    f.write("HOUSTON, WE HAVE A PROBLEM! - ERROR REPORT")
+    _write_section(f, [_format_summary(summary)])
+    _write_section(f, _format_timeline(timeline, options))
+    for sev in sorted(timeline.by_severity):
+        sev_events, count = timeline.by_severity[sev]
+        _write_section(
+            f, _format_severity_timeline(sev, sev_events, count, options.per_severity)
+        )
+
+def _event_dict(ev: ErrorEvent) -> Dict[str, Any]:
+    record: Dict[str, Any] = {
+        "timestamp": format_timestamp(ev.timestamp),
+        "subsystem": ev.subsystem,
+        "error_code": ev.error_code,
+        "severity": ev.severity,
+        "description": ev.description,
+        "telemetry_id": ev.telemetry_id,
+        "resolved": ev.resolved,
+    }
+    if type(ev) is Episode:
+        record["count"] = ev.count
+        record["last_timestamp"] = format_timestamp(ev.last_timestamp)  # type: ignore[arg-type]
+    return record
+
+def _render_json(
+    f: TextIO, summary: Dict[str, Any], timeline: Timeline, options: TimelineOptions
+) -> None:
+    tail, omitted = _tail_window(timeline)
+    document = {
+        "summary": summary,
+        "timeline": {
+            "total_events": timeline.total_events,
+            "earliest": [_event_dict(ev) for ev in timeline.head],
+            "latest": [_event_dict(ev) for ev in tail],
+            "omitted": max(omitted, 0),
+            "by_severity": {
+                sev: {
+                    "total": count,
+                    "earliest": [_event_dict(ev) for ev in sev_events],
+                }
+                for sev, (sev_events, count) in sorted(timeline.by_severity.items())
+            },
+        },
+    }
+    json.dump(document, f, indent=2)
+    f.write("\n")
+
+def _render_csv(
+    f: TextIO, summary: Dict[str, Any], timeline: Timeline, options: TimelineOptions
+) -> None:
+    """
+    The summary as one row per count, for spreadsheets; the timeline is
+    left to the text and JSON reports.
+    """
+    writer = csv.writer(f, lineterminator="\n")
+    writer.writerow(("section", "subsystem", "error_code", "severity", "count", "max_error"))
+    writer.writerow(("total_events", "", "", "", summary.get("total_events", 0), ""))
+    dedup = summary.get("dedup")
+    if dedup is not None:
+        writer.writerow(("duplicates_dropped", "", "", "", dedup["duplicates_dropped"], ""))
+        if dedup["episode_gap_seconds"] is not None:
+            writer.writerow(("events_collapsed", "", "", "", dedup["events_collapsed"], ""))
+    for sev, count in sorted(summary.get("by_severity", {}).items()):
+        writer.writerow(("by_severity", "", "", sev, count, ""))
+    for sub, count in sorted(summary.get("by_subsystem", {}).items()):
+        writer.writerow(("by_subsystem", sub, "", "", count, ""))
+    for entry in summary.get("top_error_patterns", []):
+        writer.writerow((
+            "top_error_pattern",
+            entry["subsystem"],
+            entry["error_code"],
+            "",
+            entry["count"],
+            entry.get("max_error", ""),
+        ))
+    for sub, count in sorted(summary.get("unresolved_by_subsystem", {}).items()):
+        writer.writerow(("unresolved", sub, "", "", count, ""))
+
+Renderer = Callable[[TextIO, Dict[str, Any], Timeline, TimelineOptions], None]
+
+REPORT_FORMATS: Dict[str, Renderer] = {
+    "text": _render_text,
+    "json": _render_json,
+    "csv": _render_csv,
+}
+
+REPORT_SUFFIXES = {"text": ".txt", "json": ".json", "csv": ".csv"}
+
+def error_report_path(output_dir: Path, report_format: str = "text") -> Path:
+    return output_dir / f"error_report{REPORT_SUFFIXES[report_format]}"
 
 def generate_report(
-    events: List[ErrorEvent], summary: Dict[str, Any], output_dir: Path
+    events: Union[Sequence[ErrorEvent], TimelineBuffer],
+    summary: Dict[str, Any],
+    output_dir: Path,
+    total_events: Optional[int] = None,
+    options: Optional[TimelineOptions] = None,
+    formats: Sequence[str] = ("text",),
 ) -> Path:
     """
-    Generate a human-readable text report.
+    Generate the error report in each of ``formats`` ("text", "json",
+    "csv").
+
+    ``events`` may be a list, an ``EventTable`` or the ``TimelineBuffer`` of a
+    streaming run. A list may also be a subset of the stream; pass
+    ``total_events`` so the timeline reports the correct number of omitted
+    events. ``options`` selects the timeline windows; a buffer uses its own.
+    The timeline is selected once and shared by all renderers.
 
-    Returns the path to the generated report file.
+    Sections are written to the file one at a time. Returns the path of
+    the report in the first format.
     """
+    if not formats:
+        raise ValueError("No report format given")
+    for report_format in formats:
+        if report_format not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format: {report_format}")
     output_dir.mkdir(parents=True, exist_ok=True)
-    report_path = output_dir / "error_report.txt"
 
-    summary_section = _format_summary(summary)
-    timeline_section = _format_timeline(events)
-
-    content = "\n\n".join(
-        [
-            "HOUSTON, WE HAVE A PROBLEM! - ERROR REPORT",
-            summary_section,
-            timeline_section,
-        ]
-    )
-
-    with report_path.open("w", encoding="utf-8") as f:
-        f.write(content)
+    if isinstance(events, TimelineBuffer):
+        options = events.options
+        timeline = events.timeline()
+    else:
+        options = options or TimelineOptions()
+        timeline = select_timeline(events, options, total_events)
 
-    logger.info("Report written to %s", report_path)
-    return report_path
\ No newline at end of file
+    paths = []
+    for report_format in formats:
+        path = error_report_path(output_dir, report_format)
+        with path.open("w", encoding="utf-8") as f:
+            REPORT_FORMATS[report_format](f, summary, timeline, options)
+        logger.info("Report written to %s", path)
+        paths.append(path)
+    return paths[0]
\ No newline at end of file
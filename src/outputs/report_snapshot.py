@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Set
+
+from extractors.error_parser import ErrorEvent, EventAggregator, _top_k_capacity
+from extractors.event_dedup import MISSING_ID, EventDeduplicator
+from extractors.field_schema import FieldSchema
+from outputs.report_generator import TimelineBuffer, TimelineOptions
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the aggregate or timeline state changes, so older
+# snapshots are rebuilt rather than misread.
+SNAPSHOT_FORMAT_VERSION = 1
+
+SNAPSHOT_FILENAME = "report_snapshot.json"
+
+def snapshot_settings(config: Dict[str, Any], dedup: Optional[EventDeduplicator] = None) -> str:
+    """
+    Key of the settings that shape what a snapshot holds: normalization,
+    top-k capacity, timeline windows and episode collapsing.
+    """
+    import hashlib
+
+    options = TimelineOptions.from_config(config)
+    parts = [
+        FieldSchema.from_config(config).cache_key(),
+        f"top_k={_top_k_capacity(config)}",
+        f"timeline={options.head},{options.tail},{options.per_severity}",
+    ]
+    if dedup is not None:
+        gap = dedup.episode_gap.total_seconds() if dedup.episode_gap is not None else None
+        parts.append(f"dedup={gap}")
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+class ReportSnapshot:
+    """
+    Aggregate state and timeline buffer of every event reported so far,
+    persisted so the next run only has to apply newer events.
+
+    ``new_events`` passes events later than ``high_water_mark``, the latest
+    timestamp applied by earlier runs, and events at exactly that time whose
+    telemetry ID was not among those applied there, so records sharing the
+    boundary timestamp across two runs are neither lost nor counted twice
+    (events at the mark without an ID are taken as seen). Older events are
+    skipped: late records, and the archive re-read on every run. Editing
+    archived records is therefore not noticed; delete the snapshot to
+    rebuild it. The mark only advances in ``save``, so events within one
+    run may arrive in any order.
+
+    The snapshot remembers the settings it was built under (see
+    ``snapshot_settings``); ``load`` starts afresh when they or the format
+    version differ.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        settings: str,
+        aggregator: EventAggregator,
+        timeline: TimelineBuffer,
+    ) -> None:
+        self.path = path
+        self.settings = settings
+        self.aggregator = aggregator
+        self.timeline = timeline
+        self.high_water_mark: Optional[datetime] = None
+        self.runs = 0
+        # Dedup stats summed over every run
+        self.dedup: Optional[Dict[str, Any]] = None
+        self.skipped = 0
+        self._boundary_ids: Set[str] = set()
+        self._next_mark: Optional[datetime] = None
+        self._next_boundary_ids: Set[str] = set()
+
+    @classmethod
+    def empty(
+        cls,
+        path: Path,
+        config: Dict[str, Any],
+        dedup: Optional[EventDeduplicator] = None,
+    ) -> "ReportSnapshot":
+        return cls(
+            path,
+            snapshot_settings(config, dedup),
+            EventAggregator.from_config(config),
+            TimelineBuffer(TimelineOptions.from_config(config)),
+        )
+
+    @classmethod
+    def read(cls, path: Path) -> "ReportSnapshot":
+        """
+        Read the snapshot at ``path`` whatever settings it was built under.
+        Raises ``OSError`` or ``ValueError`` if it cannot be used.
+        """
+        with path.open("r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"unsupported snapshot version {state.get('version')!r}")
+        try:
+            snapshot = cls(
+                path,
+                state["settings"],
+                EventAggregator.from_state(state["aggregate"]),
+                TimelineBuffer.from_state(state["timeline"]),
+            )
+            mark = state["high_water_mark"]
+            snapshot.high_water_mark = datetime.fromisoformat(mark) if mark else None
+            snapshot._boundary_ids = set(state["boundary_ids"])
+            snapshot.runs = int(state["runs"])
+            snapshot.dedup = state.get("dedup")
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"malformed snapshot: {exc!r}") from None
+        snapshot._next_mark = snapshot.high_water_mark
+        snapshot._next_boundary_ids = set(snapshot._boundary_ids)
+        return snapshot
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        config: Dict[str, Any],
+        dedup: Optional[EventDeduplicator] = None,
+    ) -> "ReportSnapshot":
+        """
+        Load the snapshot at ``path`` to continue it, or return an empty one
+        if there is none or it was built under other settings.
+        """
+        if not path.exists():
+            return cls.empty(path, config, dedup)
+        try:
+            snapshot = cls.read(path)
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable report snapshot %s: %s", path, exc)
+            return cls.empty(path, config, dedup)
+        if snapshot.settings != snapshot_settings(config, dedup):
+            logger.info("Report settings changed; rebuilding the snapshot %s", path)
+            return cls.empty(path, config, dedup)
+        logger.info(
+            "Loaded report snapshot with %d events up to %s",
+            snapshot.aggregator.total_events,
+            snapshot.high_water_mark.isoformat() if snapshot.high_water_mark else "-",
+        )
+        return snapshot
+
+    def new_events(self, events: Iterable[ErrorEvent]) -> Iterator[ErrorEvent]:
+        """
+        Yield the events of ``events`` not yet in the snapshot and note how
+        far they reach.
+        """
+        mark = self.high_water_mark
+        boundary = self._boundary_ids
+        next_mark = self._next_mark
+        next_ids = self._next_boundary_ids
+        try:
+            for ev in events:
+                ts = ev.timestamp
+                if mark is not None and ts <= mark:
+                    if ts < mark or ev.telemetry_id == MISSING_ID or ev.telemetry_id in boundary:
+                        self.skipped += 1
+                        continue
+                if next_mark is None or ts > next_mark:
+                    next_mark = ts
+                    next_ids = {ev.telemetry_id}
+                elif ts == next_mark:
+                    next_ids.add(ev.telemetry_id)
+                yield ev
+        finally:
+            self._next_mark = next_mark
+            self._next_boundary_ids = next_ids
+
+    def add_dedup_stats(self, stats: Dict[str, Any]) -> None:
+        """
+        Add the dedup stats of a run to the totals kept in the snapshot.
+        """
+        totals = self.dedup or {"duplicates_dropped": 0, "events_collapsed": 0}
+        self.dedup = {
+            "duplicates_dropped": totals["duplicates_dropped"] + stats["duplicates_dropped"],
+            "events_collapsed": totals["events_collapsed"] + stats["events_collapsed"],
+            "episode_gap_seconds": stats["episode_gap_seconds"],
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return the summary dict for every run so far, as ``generate_report``
+        takes it.
+        """
+        summary = self.aggregator.snapshot()
+        if self.dedup is not None:
+            summary["dedup"] = {**self.dedup, "records": self.aggregator.total_events}
+        return summary
+
+    def to_state(self) -> Dict[str, Any]:
+        mark = self._next_mark
+        return {
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "settings": self.settings,
+            "runs": self.runs,
+            "high_water_mark": mark.isoformat() if mark is not None else None,
+            "boundary_ids": sorted(self._next_boundary_ids - {MISSING_ID}),
+            "dedup": self.dedup,
+            "aggregate": self.aggregator.to_state(),
+            "timeline": self.timeline.to_state(),
+        }
+
+    def save(self) -> Path:
+        """
+        Write the snapshot, moving the high-water mark past this run's events.
+        """
+        self.runs += 1
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(self.to_state(), f)
+        os.replace(tmp_path, self.path)
+        self.high_water_mark = self._next_mark
+        self._boundary_ids = set(self._next_boundary_ids)
+        logger.info("Report snapshot saved to %s", self.path)
+        return self.path
\ No newline at end of file
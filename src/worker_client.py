@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+# ``main.py submit`` loads this module without cli or the pipeline, so it
+# only imports what a client needs
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_WORKER_SOCKET = PROJECT_ROOT / "data" / "worker.sock"
+
+def split_socket(argv: List[str]) -> Tuple[Path, List[str]]:
+    """
+    Split ``main.py submit [--socket PATH] [--] COMMAND...`` arguments into
+    the worker socket and the command. Only a leading ``--socket`` is
+    taken, so ``-h`` and any option the command shares reach the command.
+    """
+    socket_path = DEFAULT_WORKER_SOCKET
+    if argv[:1] == ["--socket"]:
+        if len(argv) < 2:
+            raise ValueError("--socket expects a path")
+        socket_path, argv = Path(argv[1]), argv[2:]
+    elif argv[:1] and argv[0].startswith("--socket="):
+        socket_path, argv = Path(argv[0][len("--socket="):]), argv[1:]
+    if argv[:1] == ["--"]:
+        argv = argv[1:]
+    return socket_path, argv
+
+def submit(argv: List[str]) -> int:
+    """
+    Run a main.py command line in the worker listening on ``--socket`` and
+    relay its output and exit code; everything after a leading ``--socket``
+    is passed on as is. Without a worker the command runs in this process
+    instead.
+    """
+    import socket
+
+    try:
+        socket_path, command = split_socket(argv)
+    except ValueError as exc:
+        print(f"usage: main.py submit [--socket PATH] [--] ARGS...\n{exc}", file=sys.stderr)
+        return 2
+
+    sock = socket.socket(socket.AF_UNIX)
+    try:
+        sock.connect(str(socket_path))
+    except OSError as exc:
+        sock.close()
+        print(
+            f"No worker on {socket_path} ({exc.strerror}); running the command here",
+            file=sys.stderr,
+        )
+        import cli
+
+        return cli.run_command(command)
+
+    with sock, sock.makefile("rw", encoding="utf-8") as stream:
+        stream.write(json.dumps({"argv": command, "cwd": os.getcwd()}) + "\n")
+        stream.flush()
+        for line in stream:
+            message = json.loads(line)
+            if "exit" in message:
+                return int(message["exit"])
+            if "stdout" in message:
+                sys.stdout.write(message["stdout"])
+            else:
+                sys.stderr.write(message.get("stderr", ""))
+    print("The worker closed the connection before the command finished", file=sys.stderr)
+    return 1
\ No newline at end of file
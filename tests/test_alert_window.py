@@ -0,0 +1,98 @@
+import random
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from extractors.alert_window import AlertEngine, WindowedCounter
+from extractors.error_parser import ErrorEvent
+from extractors.event_table import EventTable
+
+START = datetime(2025, 11, 10, 10, 0, tzinfo=timezone.utc)
+
+def config(threshold, lookback_minutes=10, lateness=300):
+    return {
+        "alerting": {
+            "critical_error_threshold": threshold,
+            "lookback_minutes": lookback_minutes,
+            "bucket_seconds": 60,
+            "allowed_lateness_seconds": lateness,
+        }
+    }
+
+def event(second, subsystem="Power", severity="CRITICAL"):
+    return ErrorEvent(
+        START + timedelta(seconds=second),
+        subsystem,
+        "PWR-1",
+        severity,
+        "test",
+        f"TLM-{second}",
+        False,
+    )
+
+class WindowedCounterTest(unittest.TestCase):
+    def test_buckets_expire_with_the_watermark(self):
+        counter = WindowedCounter(600, 60)
+        counter.add(0, "k")
+        counter.add(300, "k")
+        self.assertEqual(counter.count("k"), 2)
+        counter.add(660, "other")
+        self.assertEqual(counter.count("k"), 1)
+        counter.add(1000, "other")
+        self.assertEqual(counter.count("k"), 0)
+        self.assertEqual(counter.count("other"), 2)
+
+    def test_late_events_within_the_allowance_are_counted(self):
+        counter = WindowedCounter(600, 60, allowed_lateness=120)
+        self.assertTrue(counter.add(1000, "k"))
+        self.assertTrue(counter.add(900, "k"))
+        self.assertFalse(counter.add(800, "k"))
+        self.assertEqual(counter.count("k"), 2)
+        self.assertEqual(counter.late_events, 1)
+
+    def test_events_before_the_window_are_late_whatever_the_allowance(self):
+        counter = WindowedCounter(600, 60, allowed_lateness=10_000)
+        counter.add(1000, "k")
+        self.assertFalse(counter.add(400, "k"))
+        self.assertTrue(counter.add(500, "k"))
+        self.assertEqual(counter.count("k"), 2)
+
+class AlertEngineTest(unittest.TestCase):
+    def test_rearms_once_the_count_drops(self):
+        engine = AlertEngine(config(threshold=2))
+        self.assertIsNone(engine.observe(event(0)))
+        self.assertEqual(engine.observe(event(30))["count"], 2)
+        self.assertIsNone(engine.observe(event(60)))
+        self.assertIsNone(engine.observe(event(90, severity="HIGH")))
+        self.assertTrue(engine.active)
+
+        # The first burst has left the window
+        self.assertIsNone(engine.observe(event(1500)))
+        self.assertFalse(engine.active)
+        alert = engine.observe(event(1510, subsystem="Comms"))
+        self.assertEqual(alert["by_subsystem"], {"Comms": 1, "Power": 1})
+        self.assertEqual(len(engine.alerts), 2)
+        self.assertEqual(engine.peak_count, 3)
+
+    def test_batch_alerts_do_not_depend_on_file_order(self):
+        rng = random.Random(7)
+        # Two bursts of CRITICAL events an hour apart, among HIGH noise
+        seconds = [rng.randrange(0, 600) for _ in range(40)]
+        seconds += [rng.randrange(3600, 4200) for _ in range(40)]
+        events = [event(s) for s in seconds]
+        events += [event(rng.randrange(0, 4200), severity="HIGH") for _ in range(200)]
+        in_order = sorted(events, key=lambda ev: ev.timestamp)
+        expected = AlertEngine(config(threshold=30)).observe_all(in_order)
+        self.assertEqual(len(expected), 2)
+
+        shuffled = list(events)
+        rng.shuffle(shuffled)
+        one_by_one = AlertEngine(config(threshold=30))
+        for ev in shuffled:
+            one_by_one.observe(ev)
+        self.assertGreater(one_by_one.counter.late_events, 0)
+
+        engine = AlertEngine(config(threshold=30))
+        self.assertEqual(engine.observe_all(shuffled), expected)
+        self.assertEqual(engine.counter.late_events, 0)
+        table_engine = AlertEngine(config(threshold=30))
+        self.assertEqual(table_engine.observe_all(EventTable(shuffled)), expected)
@@ -0,0 +1,123 @@
+import io
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+
+import cli
+from extractors import event_index
+from outputs import event_exporter
+from worker_client import DEFAULT_WORKER_SOCKET, split_socket
+
+# Print the pipeline modules a command line imports to stderr; --help goes to stdout
+IMPORTED_MODULES = """
+import sys
+sys.path.insert(0, {src!r})
+import cli
+try:
+    cli.main({argv!r})
+except SystemExit:
+    pass
+modules = sorted(m for m in sys.modules if m.split(".")[0] in ("extractors", "outputs"))
+print(" ".join(modules), file=sys.stderr)
+"""
+
+def imported_modules(argv):
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORTED_MODULES.format(src=str(cli.SRC_DIR), argv=argv)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stderr.split()
+
+class LazyImportTest(unittest.TestCase):
+    def test_help_imports_no_pipeline_module(self):
+        for argv in (["--help"], ["query", "--help"], ["report", "--help"]):
+            with self.subTest(argv=argv):
+                self.assertEqual(imported_modules(argv), [])
+
+    def test_copied_choices_match_the_modules(self):
+        for subsystem in cli._SUBSYSTEMS:
+            with self.subTest(module=subsystem._name):
+                subsystem._load()
+
+    def test_default_index_dir(self):
+        export_path = event_exporter.normalized_events_path(cli.PROJECT_ROOT / "data", "binary")
+        self.assertEqual(cli.DEFAULT_INDEX_DIR, event_index.default_index_dir(export_path))
+
+    def test_out_of_date_copy_fails_to_load(self):
+        subsystem = cli._Subsystem("outputs.report_generator", REPORT_FORMATS=("text",))
+        cli._SUBSYSTEMS.remove(subsystem)
+        with self.assertRaises(RuntimeError):
+            subsystem._load()
+
+class SplitSocketTest(unittest.TestCase):
+    def test_help_reaches_the_command(self):
+        self.assertEqual(split_socket(["--help"]), (DEFAULT_WORKER_SOCKET, ["--help"]))
+        self.assertEqual(split_socket(["query", "-h"]), (DEFAULT_WORKER_SOCKET, ["query", "-h"]))
+
+    def test_only_a_leading_socket_is_taken(self):
+        self.assertEqual(
+            split_socket(["--socket", "w.sock", "--", "--socket", "x"]),
+            (Path("w.sock"), ["--socket", "x"]),
+        )
+        self.assertEqual(split_socket(["--socket=w.sock", "-h"]), (Path("w.sock"), ["-h"]))
+        self.assertEqual(
+            split_socket(["data.jsonl", "--socket", "x"]),
+            (DEFAULT_WORKER_SOCKET, ["data.jsonl", "--socket", "x"]),
+        )
+
+    def test_missing_socket_path(self):
+        with self.assertRaises(ValueError):
+            split_socket(["--socket"])
+
+class ParseArgsTest(unittest.TestCase):
+    def parse_error(self, argv):
+        with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()) as stderr:
+            cli.parse_args(argv)
+        return stderr.getvalue()
+
+    def test_multi_config_rejects_single_config_options(self):
+        configs = ["--config", "a.json", "--config", "b.json"]
+        for options in (
+            ["--stream"],
+            ["--workers", "2"],
+            ["--columnar"],
+            ["--cache"],
+            ["--export-format", "json"],
+            ["--export-format", "binary", "--index"],
+        ):
+            with self.subTest(options=options):
+                error = self.parse_error(configs + options).splitlines()[-1]
+                for option in options:
+                    if option.startswith("--"):
+                        self.assertIn(option, error)
+
+    def test_defaults(self):
+        args = cli.parse_args(["--config", "a.json", "--config", "b.json"])
+        self.assertEqual((args.workers, args.export_format), (1, "json"))
+        args = cli.parse_args(["--workers", "2", "--cache"])
+        self.assertEqual((args.workers, args.cache), (2, True))
+
+class FollowSourcesTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        for name in ("a.jsonl", "b.jsonl"):
+            (self.tmp / name).touch()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_follow_needs_exactly_one_file(self):
+        output_dir = self.tmp / "out"
+        for spec in (self.tmp, self.tmp / "*.jsonl"):
+            with self.subTest(spec=spec):
+                args = cli.parse_args(["--follow", str(spec), "--output-dir", str(output_dir)])
+                with self.assertLogs("main", "ERROR") as logs:
+                    self.assertEqual(cli.run_analysis(args, cli._WarmState()), 2)
+                self.assertIn("resolves to 2 telemetry files", logs.output[0])
+        self.assertFalse(output_dir.exists())
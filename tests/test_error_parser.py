@@ -0,0 +1,21 @@
+import unittest
+from unittest.mock import patch
+
+from extractors import error_parser
+from extractors.error_parser import effective_workers
+
+class EffectiveWorkersTest(unittest.TestCase):
+    def test_capped_at_available_cpus(self):
+        with patch.object(error_parser, "available_cpus", return_value=4):
+            self.assertEqual(effective_workers(16), 4)
+            self.assertEqual(effective_workers(3), 3)
+            self.assertEqual(effective_workers(0), 1)
+
+    def test_one_cpu_parses_serially(self):
+        records = [{"timestamp": "2025-11-10T10:00:00Z", "subsystem": "Power"}] * 10
+        with patch.object(error_parser, "available_cpus", return_value=1), patch.object(
+            error_parser, "_parse_parallel"
+        ) as parallel:
+            events = error_parser.parse_events(records, {}, workers=8, chunk_size=2)
+        parallel.assert_not_called()
+        self.assertEqual(len(events), 10)
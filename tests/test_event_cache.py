@@ -0,0 +1,81 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from extractors import error_parser
+from extractors.error_parser import parse_sources
+from extractors.event_cache import ParsedEventCache
+from extractors.telemetry_sources import MergedTelemetry
+from extractors.utils_time import parse_timestamp
+
+CONFIG = {"severity_levels": {"LOW": 1, "MEDIUM": 2, "HIGH": 3, "CRITICAL": 4}}
+
+def timestamp(minute):
+    return f"2025-11-10T10:{minute:02d}:00Z"
+
+def record(minute, subsystem, code, severity="HIGH"):
+    return {
+        "timestamp": timestamp(minute),
+        "subsystem": subsystem,
+        "error_code": code,
+        "severity": severity,
+        "description": "test",
+        "telemetry_id": f"TLM-{subsystem}-{minute}",
+        "resolved": False,
+    }
+
+def write_jsonl(path, records):
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+
+class ParseSourcesCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.paths = [self.tmp / "a.jsonl", self.tmp / "b.jsonl"]
+        write_jsonl(self.paths[0], [record(1, "Power", "PWR-1"), record(4, "Power", "PWR-2")])
+        write_jsonl(self.paths[1], [record(2, "Comms", "COM-1"), record(3, "Comms", "COM-2")])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def cache(self):
+        # A new instance per run, as every nightly invocation opens the cache afresh
+        return ParsedEventCache(self.tmp / "cache")
+
+    def test_matches_merged_telemetry(self):
+        events, records = parse_sources(self.paths, CONFIG, cache=self.cache())
+        self.assertEqual(events, list(MergedTelemetry(self.paths, CONFIG)))
+        self.assertEqual([ev.error_code for ev in events], ["PWR-1", "COM-1", "COM-2", "PWR-2"])
+        self.assertEqual(records, 4)
+
+    def test_only_changed_sources_are_reparsed(self):
+        parse_sources(self.paths, CONFIG, cache=self.cache())
+
+        write_jsonl(
+            self.paths[1],
+            [record(2, "Comms", "COM-1"), record(3, "Comms", "COM-2"), record(5, "Comms", "COM-3")],
+        )
+        cache = self.cache()
+        with patch.object(error_parser, "_parse_source", wraps=error_parser._parse_source) as parse:
+            events, records = parse_sources(self.paths, CONFIG, cache=cache)
+
+        self.assertEqual([call.args[0] for call in parse.call_args_list], [self.paths[1]])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(records, 5)
+        self.assertEqual(events, list(MergedTelemetry(self.paths, CONFIG)))
+        self.assertEqual(events[-1].error_code, "COM-3")
+
+    def test_time_range(self):
+        events, _ = parse_sources(
+            self.paths,
+            CONFIG,
+            cache=self.cache(),
+            since=parse_timestamp(timestamp(2)),
+            until=parse_timestamp(timestamp(4)),
+        )
+        self.assertEqual([ev.error_code for ev in events], ["COM-1", "COM-2"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from extractors.error_parser import ErrorEvent
+from extractors.event_dedup import MISSING_ID, Episode, EventDeduplicator, RecentIds
+
+LEVELS = {"LOW": 1, "MEDIUM": 2, "HIGH": 3, "CRITICAL": 4}
+START = datetime(2025, 11, 10, 10, 0, tzinfo=timezone.utc)
+
+def event(second, code="PWR-1", telemetry_id=None, severity="HIGH", resolved=False):
+    return ErrorEvent(
+        START + timedelta(seconds=second),
+        "Power",
+        code,
+        severity,
+        "test",
+        telemetry_id or f"TLM-{code}-{second}",
+        resolved,
+    )
+
+class RecentIdsTest(unittest.TestCase):
+    def test_forgets_ids_two_generations_back(self):
+        ids = RecentIds(4)
+        for key in ("A", "B", "C", "D"):
+            self.assertFalse(ids.seen(key))
+        # A fell out with its generation: a copy this far apart is not caught
+        self.assertNotIn("A", ids)
+        self.assertFalse(ids.seen("A"))
+        self.assertTrue(ids.seen("D"))
+
+    def test_recurring_id_is_carried_over(self):
+        ids = RecentIds(4)
+        ids.seen("A")
+        ids.seen("B")
+        self.assertTrue(ids.seen("A"))
+        for key in ("C", "D", "E"):
+            ids.seen(key)
+        self.assertIn("E", ids)
+        self.assertFalse(ids.seen("A"))
+
+    def test_capacity_bounds_memory(self):
+        ids = RecentIds(10)
+        for i in range(1000):
+            ids.seen(i)
+        self.assertLessEqual(len(ids), 10)
+        self.assertTrue(all(i in ids for i in range(995, 1000)))
+
+class EventDeduplicatorTest(unittest.TestCase):
+    def dedup(self, **kwargs):
+        kwargs.setdefault("severity_levels", LEVELS)
+        return EventDeduplicator(**kwargs)
+
+    def test_duplicate_ids_are_dropped(self):
+        dedup = self.dedup(episode_gap=None)
+        events = [
+            event(0, telemetry_id="T1"),
+            event(1, telemetry_id="T1"),
+            event(2, telemetry_id="T2"),
+        ]
+        self.assertEqual(list(dedup.process(events)), [events[0], events[2]])
+        self.assertEqual(dedup.duplicates, 1)
+
+    def test_missing_ids_are_never_duplicates(self):
+        dedup = self.dedup(episode_gap=None)
+        events = [event(0, telemetry_id=MISSING_ID), event(1, telemetry_id=MISSING_ID)]
+        self.assertEqual(list(dedup.process(events)), events)
+
+    def test_evicted_duplicate_id_passes_as_new(self):
+        dedup = self.dedup(id_capacity=4, episode_gap=None)
+        events = [event(i, telemetry_id=key) for i, key in enumerate("ABCDA")]
+        self.assertEqual(list(dedup.process(events)), events)
+        self.assertEqual(dedup.duplicates, 0)
+
+        dedup = self.dedup(id_capacity=6, episode_gap=None)
+        self.assertEqual(list(dedup.process(events)), events[:4])
+        self.assertEqual(dedup.duplicates, 1)
+
+    def test_burst_collapses_into_an_episode(self):
+        dedup = self.dedup(episode_gap=60)
+        events = [
+            event(0),
+            event(30, severity="CRITICAL"),
+            event(20),
+            event(80, resolved=True),
+            event(200),
+        ]
+        records = list(dedup.process(events))
+        self.assertEqual(len(records), 2)
+        episode, single = records
+        self.assertIs(type(episode), Episode)
+        self.assertEqual(episode.count, 4)
+        self.assertEqual(episode.timestamp, START)
+        self.assertEqual(episode.last_timestamp, START + timedelta(seconds=80))
+        self.assertEqual(episode.severity, "CRITICAL")
+        self.assertTrue(episode.resolved)
+        self.assertEqual(episode.telemetry_id, "TLM-PWR-1-0")
+        self.assertIs(type(single), ErrorEvent)
+        self.assertEqual(single, events[4])
+        self.assertEqual(dedup.stats()["events_collapsed"], 3)
+
+    def test_patterns_collapse_independently(self):
+        dedup = self.dedup(episode_gap=60)
+        events = [event(0, "A"), event(10, "B"), event(20, "A"), event(30, "B"), event(40, "A")]
+        records = list(dedup.process(events))
+        self.assertEqual(sorted((r.error_code, r.count) for r in records), [("A", 3), ("B", 2)])
+
+    def test_expired_episode_is_emitted_before_the_stream_ends(self):
+        dedup = self.dedup(episode_gap=60)
+        self.assertEqual(dedup.add(event(0, "A")), ())
+        self.assertEqual(dedup.add(event(10, "A")), ())
+        closed = dedup.add(event(100, "B"))
+        self.assertEqual([(r.error_code, r.count) for r in closed], [("A", 2)])
+
+    def test_least_recently_active_pattern_closes_first(self):
+        dedup = self.dedup(episode_gap=600, max_open_episodes=2)
+        dedup.add(event(0, "A"))
+        dedup.add(event(1, "B"))
+        dedup.add(event(2, "A"))
+        closed = dedup.add(event(3, "C"))
+        self.assertEqual([r.error_code for r in closed], ["B"])
+        self.assertEqual(sorted(r.error_code for r in dedup.flush()), ["A", "C"])
+
+    def test_state_round_trip(self):
+        events = [event(0, "A"), event(10, "A", telemetry_id="T"), event(20, "B")]
+        rest = [event(30, "A"), event(40, "B", telemetry_id="T"), event(200, "C")]
+
+        whole = self.dedup(episode_gap=60)
+        expected = list(whole.process(events + rest))
+
+        first = self.dedup(episode_gap=60)
+        closed = [r for ev in first.unique(events) for r in first.add(ev)]
+        resumed = self.dedup(episode_gap=60)
+        resumed.load_state(first.to_state())
+        closed += list(resumed.process(rest))
+        self.assertEqual(closed, expected)
+        self.assertEqual(resumed.stats(), whole.stats())
@@ -0,0 +1,108 @@
+import json
+import tempfile
+import unittest
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from extractors.binary_events import read_binary_events
+from extractors.error_parser import ErrorEvent
+from extractors.event_dedup import Episode, EventDeduplicator
+from extractors.event_index import EventIndex, build_event_index
+from outputs.event_exporter import write_normalized_events
+
+START = datetime(2025, 11, 10, 10, 0, tzinfo=timezone.utc)
+
+def event(second, subsystem="Power", code="PWR-1", telemetry_id=None, resolved=False):
+    return ErrorEvent(
+        START + timedelta(seconds=second),
+        subsystem,
+        code,
+        "HIGH",
+        "test",
+        telemetry_id or f"TLM-{subsystem}-{second}",
+        resolved,
+    )
+
+def collapsed_events():
+    # PWR-1 recurs within the episode gap and folds into one 2x episode
+    events = [event(0), event(10, resolved=True), event(20, "Comms", "COM-1")]
+    return list(EventDeduplicator(episode_gap=60).process(events))
+
+class EpisodeExportTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.events = collapsed_events()
+        episode = self.events[0]
+        self.assertIs(type(episode), Episode)
+        self.assertEqual(episode.count, 2)
+        self.assertEqual(episode.last_timestamp, START + timedelta(seconds=10))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_json_matches_asdict(self):
+        path = self.tmp / "events.json"
+        write_normalized_events(self.events, path, "json")
+        expected = json.loads(json.dumps([asdict(ev) for ev in self.events], default=str))
+        self.assertEqual(json.loads(path.read_text(encoding="utf-8")), expected)
+        self.assertEqual(expected[0]["count"], 2)
+        self.assertNotIn("count", expected[1])
+
+    def test_jsonl_keeps_count_and_last_timestamp(self):
+        path = self.tmp / "events.jsonl"
+        write_normalized_events(self.events, path, "jsonl")
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(lines[0]["count"], 2)
+        self.assertEqual(lines[0]["last_timestamp"], "2025-11-10T10:00:10+00:00")
+        self.assertNotIn("count", lines[1])
+
+    def test_binary_round_trip(self):
+        path = self.tmp / "events.bin"
+        write_normalized_events(self.events, path, "binary")
+        self.assertEqual(read_binary_events(path), self.events)
+
+    def test_index_counts_every_occurrence(self):
+        path = self.tmp / "events.bin"
+        write_normalized_events(self.events, path, "binary")
+        with EventIndex(build_event_index(path)) as index:
+            self.assertEqual(len(index), 2)
+            self.assertEqual(index.count(), 3)
+            self.assertEqual(index.count(subsystem="Power"), 2)
+            self.assertEqual(index.query(subsystem="Power"), self.events[:1])
+
+class AppendTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.events = collapsed_events() + [event(30, "Thermal", "THM-1")]
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def appended(self, export_format, *parts):
+        path = self.tmp / f"appended.{export_format}"
+        for i, part in enumerate(parts):
+            write_normalized_events(part, path, export_format, append=i > 0)
+        return path
+
+    def test_appending_matches_writing_at_once(self):
+        for export_format in ("json", "jsonl", "binary"):
+            with self.subTest(export_format=export_format):
+                whole = self.tmp / f"whole.{export_format}"
+                write_normalized_events(self.events, whole, export_format)
+                parts = ([], self.events[:1], [], self.events[1:], [])
+                path = self.appended(export_format, *parts)
+                self.assertEqual(path.read_bytes(), whole.read_bytes())
+
+    def test_appending_nothing_keeps_the_events(self):
+        path = self.appended("json", self.events, [])
+        self.assertEqual(len(json.loads(path.read_text(encoding="utf-8"))), len(self.events))
+        path = self.appended("binary", self.events, [])
+        self.assertEqual(read_binary_events(path), self.events)
+
+    def test_appending_to_a_missing_file_writes_it(self):
+        path = self.tmp / "events.json"
+        self.assertEqual(write_normalized_events(self.events, path, "json", append=True), 3)
+        self.assertEqual(len(json.loads(path.read_text(encoding="utf-8"))), 3)
@@ -0,0 +1,150 @@
+import itertools
+import random
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from extractors.binary_events import (
+    HEADER,
+    MAGIC,
+    BinaryEventReader,
+    read_binary_events,
+    write_binary_events,
+)
+from extractors.error_parser import ErrorEvent
+from extractors.event_index import EventIndex, build_event_index
+from extractors.event_table import to_epoch_us
+
+START = datetime(2025, 11, 10, 10, 0, tzinfo=timezone.utc)
+SUBSYSTEMS = ["Power", "Comms", "Navigation", "Thermal — ünïcode"]
+CODES = ["E-1", "E-2", "E-3"]
+SEVERITIES = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+
+def random_events(count, seed=7):
+    # Out of time order, with repeated timestamps, so the index has to sort
+    rng = random.Random(seed)
+    return [
+        ErrorEvent(
+            START + timedelta(seconds=rng.randrange(600), microseconds=rng.choice([0, 1, 999999])),
+            rng.choice(SUBSYSTEMS),
+            rng.choice(CODES),
+            rng.choice(SEVERITIES),
+            f"description {rng.randrange(20)}",
+            f"TLM-{i}" if i % 10 else "N/A",
+            rng.random() < 0.3,
+        )
+        for i in range(count)
+    ]
+
+class BinaryEventsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "events.bin"
+        self.events = random_events(500)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trip(self):
+        self.assertEqual(write_binary_events(self.events, self.path), len(self.events))
+        self.assertEqual(read_binary_events(self.path), self.events)
+        with BinaryEventReader(self.path) as reader:
+            self.assertEqual(reader.count, len(self.events))
+
+    def test_table_and_records_match_events(self):
+        write_binary_events(self.events, self.path)
+        with BinaryEventReader(self.path) as reader:
+            self.assertEqual(list(reader.table()), self.events)
+            records = list(reader.records())
+        self.assertEqual(len(records), len(self.events))
+        for record, ev in zip(records, self.events):
+            self.assertEqual(record["timestamp"], ev.timestamp)
+            self.assertEqual(record["telemetry_id"], ev.telemetry_id)
+            self.assertEqual(record["resolved"], ev.resolved)
+
+    def test_empty_file(self):
+        write_binary_events([], self.path)
+        self.assertEqual(read_binary_events(self.path), [])
+
+    def test_truncated_record(self):
+        write_binary_events(self.events[:3], self.path)
+        data = self.path.read_bytes()
+        self.path.write_bytes(data[:-2])
+        with self.assertRaises(ValueError):
+            read_binary_events(self.path)
+
+    def test_rejects_other_files(self):
+        self.path.write_bytes(HEADER.pack(b"NOTEVENT", 1, 0))
+        with self.assertRaises(ValueError):
+            BinaryEventReader(self.path)
+        self.path.write_bytes(HEADER.pack(MAGIC, 99, 0))
+        with self.assertRaises(ValueError):
+            BinaryEventReader(self.path)
+
+class EventIndexTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        path = Path(cls._tmp.name) / "events.bin"
+        cls.events = random_events(800)
+        write_binary_events(cls.events, path)
+        cls.index = EventIndex(build_event_index(path))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.index.close()
+        cls._tmp.cleanup()
+
+    def brute_force(self, start=None, end=None, subsystem=None, error_code=None,
+                    severity=None, resolved=None):
+        def wanted(values, value):
+            if values is None:
+                return True
+            return value == values if isinstance(values, str) else value in values
+
+        rows = [
+            row
+            for row, ev in enumerate(self.events)
+            if (start is None or ev.timestamp >= start)
+            and (end is None or ev.timestamp < end)
+            and wanted(subsystem, ev.subsystem)
+            and wanted(error_code, ev.error_code)
+            and wanted(severity, ev.severity)
+            and (resolved is None or ev.resolved == resolved)
+        ]
+        rows.sort(key=lambda row: (to_epoch_us(self.events[row].timestamp), row))
+        return [self.events[row] for row in rows]
+
+    def test_query_matches_brute_force(self):
+        times = [None, START + timedelta(seconds=100), START + timedelta(seconds=450)]
+        combinations = itertools.product(
+            times,
+            times,
+            [None, "Comms", ["Power", "Thermal — ünïcode"], "Missing"],
+            [None, "E-2", ["E-1", "E-3"]],
+            [None, "CRITICAL", ["LOW", "HIGH"]],
+            [None, True, False],
+        )
+        for start, end, subsystem, error_code, severity, resolved in combinations:
+            filters = {
+                "start": start,
+                "end": end,
+                "subsystem": subsystem,
+                "error_code": error_code,
+                "severity": severity,
+                "resolved": resolved,
+            }
+            with self.subTest(**filters):
+                expected = self.brute_force(**filters)
+                self.assertEqual(self.index.query(**filters), expected)
+                self.assertEqual(self.index.count(**filters), len(expected))
+
+    def test_limit_and_string_bounds(self):
+        expected = self.brute_force(start=START + timedelta(seconds=60))
+        self.assertEqual(
+            self.index.query(start="2025-11-10T10:01:00Z", limit=5), expected[:5]
+        )
+
+    def test_values(self):
+        self.assertEqual(sorted(self.index.values("subsystem")), sorted(SUBSYSTEMS))
@@ -0,0 +1,101 @@
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import cli
+from extractors.event_dedup import EventDeduplicator
+
+CONFIG = {
+    "severity_levels": {"LOW": 1, "MEDIUM": 2, "HIGH": 3, "CRITICAL": 4},
+    "ingestion": {"poll_interval_seconds": 0.01},
+    "alerting": {"critical_error_threshold": 3, "lookback_minutes": 60},
+}
+
+def record(minute, subsystem, code, severity="CRITICAL"):
+    return {
+        "timestamp": f"2025-11-10T10:{minute:02d}:00Z",
+        "subsystem": subsystem,
+        "error_code": code,
+        "severity": severity,
+        "description": "test",
+        "telemetry_id": f"TLM-{subsystem}-{minute}",
+        "resolved": False,
+    }
+
+def append_jsonl(path, records):
+    with path.open("a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(r) + "\n" for r in records))
+
+FIRST = [record(1, "Power", "PWR-1"), record(2, "Power", "PWR-1"), record(3, "Comms", "COM-1")]
+SECOND = [record(4, "Power", "PWR-1"), record(5, "Thermal", "THM-1", "HIGH")]
+
+class FollowCheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def follow(self, data_path, output_dir, checkpoint_path):
+        """
+        Follow ``data_path`` until the checkpoint covers the whole file and
+        return the JSON report.
+        """
+        stop = threading.Event()
+        size = data_path.stat().st_size
+        thread = threading.Thread(
+            target=cli.run_follow,
+            args=(CONFIG, data_path, output_dir, checkpoint_path, stop),
+            kwargs={"dedup": EventDeduplicator(episode_gap=120), "report_formats": ("json",)},
+        )
+        thread.start()
+        try:
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                if checkpoint_path.exists():
+                    checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+                    if checkpoint["offset"] == size:
+                        break
+                time.sleep(0.01)
+            else:
+                self.fail("follower did not reach the end of the file")
+        finally:
+            stop.set()
+            thread.join()
+        return json.loads((output_dir / "error_report.json").read_text(encoding="utf-8"))
+
+    def test_restart_continues_counts(self):
+        data_path = self.tmp / "telemetry.jsonl"
+        checkpoint_path = self.tmp / "telemetry.checkpoint.json"
+        append_jsonl(data_path, FIRST)
+        self.follow(data_path, self.tmp / "first", checkpoint_path)
+        state = json.loads(checkpoint_path.read_text(encoding="utf-8"))["state"]
+        self.assertEqual(len(state["dedup"]["open"]), 2)
+        self.assertEqual(state["alerts"]["peak_count"], 3)
+
+        append_jsonl(data_path, SECOND)
+        resumed = self.follow(data_path, self.tmp / "second", checkpoint_path)
+
+        whole_path = self.tmp / "whole.jsonl"
+        append_jsonl(whole_path, FIRST + SECOND)
+        whole = self.follow(whole_path, self.tmp / "whole", self.tmp / "whole.checkpoint.json")
+
+        self.assertEqual(resumed, whole)
+        self.assertEqual(resumed["summary"]["dedup"]["records"], 3)
+
+    def test_changed_settings_start_from_zero(self):
+        data_path = self.tmp / "telemetry.jsonl"
+        checkpoint_path = self.tmp / "telemetry.checkpoint.json"
+        append_jsonl(data_path, FIRST)
+        self.follow(data_path, self.tmp / "first", checkpoint_path)
+
+        checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        checkpoint["state"]["settings"] = "other"
+        checkpoint_path.write_text(json.dumps(checkpoint), encoding="utf-8")
+        append_jsonl(data_path, SECOND)
+        resumed = self.follow(data_path, self.tmp / "second", checkpoint_path)
+        self.assertEqual(resumed["summary"]["total_events"], 2)
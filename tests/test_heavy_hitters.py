@@ -0,0 +1,57 @@
+import random
+import unittest
+from collections import Counter
+
+from extractors.heavy_hitters import SpaceSaving
+
+def sketch_of(capacity, keys):
+    sketch = SpaceSaving(capacity)
+    for key in keys:
+        sketch.add(key)
+    return sketch
+
+class SpaceSavingMergeTest(unittest.TestCase):
+    def test_truncating_exact_sketches_is_not_exact(self):
+        left = sketch_of(3, "aaab")
+        right = sketch_of(3, "ccdddd")
+        self.assertTrue(left.exact and right.exact)
+
+        left.merge(right)
+        self.assertEqual(len(left), 3)
+        self.assertEqual(dict(left.items()), {"a": 3, "c": 2, "d": 4})
+        self.assertFalse(left.exact)
+        # The kept counts are still exact
+        self.assertEqual(left.error_bound(), 0)
+        self.assertGreaterEqual(left.min_count(), 1)
+
+    def test_merge_within_capacity_stays_exact(self):
+        left = sketch_of(4, "aab")
+        left.merge(sketch_of(4, "bc"))
+        self.assertTrue(left.exact)
+        self.assertEqual(dict(left.items()), {"a": 2, "b": 2, "c": 1})
+
+    def test_eviction_survives_later_merges_and_state(self):
+        left = sketch_of(3, "aaab")
+        left.merge(sketch_of(3, "ccdddd"))
+        merged = SpaceSaving(3)
+        merged.merge(left)
+        self.assertFalse(merged.exact)
+        self.assertFalse(SpaceSaving.from_state(left.to_state(), key_type=str).exact)
+
+    def test_merged_counts_bound_the_true_counts(self):
+        rng = random.Random(3)
+        stream = [rng.choice("abcdefghij") * rng.randint(1, 2) for _ in range(2000)]
+        parts = [stream[i::4] for i in range(4)]
+        merged = SpaceSaving(5)
+        for part in parts:
+            merged.merge(sketch_of(5, part))
+
+        true_counts = Counter(stream)
+        self.assertEqual(merged.total, len(stream))
+        self.assertFalse(merged.exact)
+        for key, count in merged.items():
+            self.assertLessEqual(count - merged.error(key), true_counts[key])
+            self.assertGreaterEqual(count, true_counts[key])
+        for key, count in true_counts.items():
+            if key not in merged:
+                self.assertLessEqual(count, merged.min_count())
@@ -0,0 +1,81 @@
+import asyncio
+import http.client
+import json
+import socket
+import threading
+import time
+import unittest
+
+from extractors.ingest_server import IngestionServer
+
+def jsonl(count, start=0):
+    return "".join(
+        json.dumps({"telemetry_id": f"TLM-{i}", "severity": "HIGH"}) + "\n"
+        for i in range(start, start + count)
+    ).encode("utf-8")
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.01)
+
+class IngestionServerTest(unittest.TestCase):
+    def start(self, **kwargs):
+        kwargs.setdefault("tcp_port", 0)
+        kwargs.setdefault("http_port", 0)
+        self.batches = []
+        self.server = IngestionServer(
+            lambda batch: self.batches.append(len(batch)), stats_interval=None, **kwargs
+        )
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=asyncio.run, args=(self.server.run(self.stop),))
+        self.thread.start()
+        self.addCleanup(self.shutdown)
+        self.assertTrue(self.server.ready.wait(5))
+
+    def shutdown(self):
+        self.stop.set()
+        self.thread.join(10)
+        self.assertFalse(self.thread.is_alive())
+
+    def post(self, body):
+        connection = http.client.HTTPConnection(*self.server.addresses["http"], timeout=10)
+        try:
+            connection.request("POST", "/ingest", body)
+            response = connection.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            connection.close()
+
+    def test_stream_batches_are_capped_at_batch_size(self):
+        self.start(batch_size=20, queue_size=50, batch_latency=0.05)
+        with socket.create_connection(self.server.addresses["tcp"]) as sock:
+            sock.sendall(jsonl(1004))
+        wait_for(lambda: self.server.stats.processed == 1004)
+        self.assertLessEqual(max(self.batches), 20)
+        self.assertGreaterEqual(len(self.batches), 1004 // 20)
+        self.assertLessEqual(self.server.stats.peak_queue_depth, 50)
+
+    def test_large_http_body_waits_for_room(self):
+        self.start(batch_size=20, queue_size=50, batch_latency=0.05)
+        self.assertEqual(self.post(jsonl(500)), (202, {"accepted": 500, "malformed": 0}))
+        wait_for(lambda: self.server.stats.processed == 500)
+        self.assertLessEqual(max(self.batches), 20)
+        self.assertLessEqual(self.server.stats.peak_queue_depth, 50)
+
+    def test_drop_policy_and_draining_on_stop(self):
+        # The batch neither fills up nor times out before the server stops
+        self.start(batch_size=1000, queue_size=50, batch_latency=30, overflow="drop")
+        status, payload = self.post(jsonl(80))
+        self.assertEqual((status, payload), (503, {"accepted": 50, "dropped": 30, "malformed": 0}))
+        self.assertEqual(self.post(jsonl(5))[1]["dropped"], 5)
+        self.assertEqual(self.batches, [])
+
+        started = time.monotonic()
+        self.shutdown()
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual(self.batches, [50])
+        stats = self.server.stats
+        self.assertEqual((stats.received, stats.dropped, stats.processed), (85, 35, 50))
@@ -0,0 +1,121 @@
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import cli
+from extractors.binary_events import read_binary_events
+from extractors.error_parser import ErrorEvent
+from extractors.event_dedup import MISSING_ID
+from outputs.report_snapshot import ReportSnapshot
+
+CONFIG = {"severity_levels": {"LOW": 1, "MEDIUM": 2, "HIGH": 3, "CRITICAL": 4}}
+START = datetime(2025, 11, 10, 10, 0, tzinfo=timezone.utc)
+
+def event(minute, telemetry_id, subsystem="Power"):
+    return ErrorEvent(
+        START + timedelta(minutes=minute), subsystem, "PWR-1", "HIGH", "test", telemetry_id, False
+    )
+
+class HighWaterMarkTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "report_snapshot.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def run_once(self, events):
+        """
+        One incremental run: load, apply the new events, save. Returns the
+        events that were applied.
+        """
+        snapshot = ReportSnapshot.load(self.path, CONFIG)
+        applied = list(snapshot.new_events(events))
+        snapshot.aggregator.update(applied)
+        snapshot.timeline.update(applied)
+        snapshot.save()
+        return applied
+
+    def test_boundary_timestamp_shared_by_two_runs(self):
+        first = [event(1, "TLM-1"), event(2, "TLM-2"), event(2, "TLM-3")]
+        self.assertEqual(self.run_once(first), first)
+
+        # The second run re-reads the boundary minute, where TLM-4 arrived late
+        second = [event(1, "TLM-1"), event(2, "TLM-2"), event(2, "TLM-4"), event(2, "TLM-3"),
+                  event(3, "TLM-5")]
+        self.assertEqual(self.run_once(second), [event(2, "TLM-4"), event(3, "TLM-5")])
+
+        snapshot = ReportSnapshot.load(self.path, CONFIG)
+        self.assertEqual(snapshot.aggregator.total_events, 5)
+        self.assertEqual(snapshot.high_water_mark, START + timedelta(minutes=3))
+        self.assertEqual(snapshot.runs, 2)
+
+    def test_boundary_ids_accumulate_across_runs_at_the_same_mark(self):
+        self.run_once([event(2, "TLM-1")])
+        self.run_once([event(2, "TLM-1"), event(2, "TLM-2")])
+        self.assertEqual(self.run_once([event(2, "TLM-1"), event(2, "TLM-2")]), [])
+        self.assertEqual(ReportSnapshot.load(self.path, CONFIG).aggregator.total_events, 2)
+
+    def test_events_without_id_at_the_mark_are_taken_as_seen(self):
+        self.run_once([event(2, MISSING_ID)])
+        self.assertEqual(self.run_once([event(2, MISSING_ID), event(1, "TLM-9")]), [])
+
+    def test_unsaved_run_does_not_move_the_mark(self):
+        snapshot = ReportSnapshot.load(self.path, CONFIG)
+        list(snapshot.new_events([event(5, "TLM-1")]))
+        self.assertIsNone(snapshot.high_water_mark)
+        self.assertEqual(self.run_once([event(5, "TLM-1")]), [event(5, "TLM-1")])
+
+    def test_other_settings_rebuild_the_snapshot(self):
+        self.run_once([event(1, "TLM-1")])
+        other = {**CONFIG, "aggregation": {"top_k_capacity": 4}}
+        snapshot = ReportSnapshot.load(self.path, other)
+        self.assertIsNone(snapshot.high_water_mark)
+        self.assertEqual(snapshot.aggregator.total_events, 0)
+
+class IncrementalExportTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.data_path = self.tmp / "telemetry.jsonl"
+        self.data_path.touch()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def run_once(self, minutes, export_format):
+        with self.data_path.open("a", encoding="utf-8") as f:
+            for minute in minutes:
+                f.write(json.dumps({
+                    "timestamp": f"2025-11-10T10:{minute:02d}:00Z",
+                    "subsystem": "Power",
+                    "error_code": "PWR-1",
+                    "severity": "HIGH",
+                    "description": "test",
+                    "telemetry_id": f"TLM-{minute}",
+                }) + "\n")
+        snapshot = ReportSnapshot.load(self.tmp / "report_snapshot.json", CONFIG)
+        cli.run_pipeline(
+            CONFIG,
+            self.data_path,
+            output_dir=self.tmp,
+            export_format=export_format,
+            snapshot=snapshot,
+        )
+
+    def test_runs_append_their_new_events(self):
+        path = self.tmp / "normalized_events.json"
+        self.run_once([1, 2], "json")
+        self.run_once([], "json")
+        self.run_once([3], "json")
+        exported = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual([ev["telemetry_id"] for ev in exported], ["TLM-1", "TLM-2", "TLM-3"])
+
+    def test_binary_export_keeps_earlier_runs(self):
+        self.run_once([1], "binary")
+        self.run_once([2, 3], "binary")
+        self.run_once([], "binary")
+        events = read_binary_events(self.tmp / "normalized_events.bin")
+        self.assertEqual([ev.telemetry_id for ev in events], ["TLM-1", "TLM-2", "TLM-3"])
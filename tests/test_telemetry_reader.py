@@ -0,0 +1,84 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from extractors import error_parser, telemetry_reader
+from extractors.telemetry_reader import (
+    _JsonStream,
+    iter_telemetry,
+    merge_sources,
+    read_telemetry_file,
+)
+
+RECORDS = [
+    {"timestamp": "2025-11-10T10:15:30Z", "subsystem": "Power", "value": 123456789},
+    {"timestamp": "2025-11-10T10:16:00Z", "subsystem": "Comms", "value": -0.125e-3},
+    {"description": "escaped \"quote\" and \\u00e9 é", "nested": {"list": [1, 2.5, None]}},
+    {"resolved": True, "code": "NAV-001"},
+]
+
+class JsonStreamTest(unittest.TestCase):
+    def test_values_split_at_every_chunk_boundary(self):
+        # Every chunk size puts a boundary inside some number, string and
+        # literal; a value ending exactly at the edge must not be cut short
+        document = json.dumps(RECORDS, indent=1)
+        for chunk_size in range(1, len(document) + 2):
+            with self.subTest(chunk_size=chunk_size):
+                stream = _JsonStream(io.StringIO(document), chunk_size=chunk_size)
+                self.assertEqual(list(stream.iter_array()), RECORDS)
+                self.assertEqual(stream.peek(), "")
+
+    def test_number_split_at_buffer_edge(self):
+        stream = _JsonStream(io.StringIO("[12345, 6]"), chunk_size=4)
+        self.assertEqual(list(stream.iter_array()), [12345, 6])
+
+    def test_unterminated_value(self):
+        stream = _JsonStream(io.StringIO('[{"a": 1'), chunk_size=3)
+        with self.assertRaises(ValueError):
+            list(stream.iter_array())
+
+class JsonArrayFileTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_streaming_matches_whole_file_read(self):
+        # Several chunks' worth, wrapped in an object after another key
+        records = [
+            {"telemetry_id": f"TLM-{i}", "value": i * 7919, "text": "x" * (i % 97)}
+            for i in range(4000)
+        ]
+        path = self.tmp / "telemetry.json"
+        path.write_text(json.dumps({"meta": {"v": 1}, "records": records}), encoding="utf-8")
+        self.assertGreater(path.stat().st_size, 2 * telemetry_reader._CHUNK_SIZE)
+        self.assertEqual(list(iter_telemetry(path)), records)
+        self.assertEqual(read_telemetry_file(path), records)
+
+class MergeSourcesTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.paths = []
+        for i, records in enumerate((RECORDS[:2], RECORDS[2:])):
+            path = self.tmp / f"part{i}.jsonl"
+            path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+            self.paths.append(path)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_records_follow_path_order(self):
+        paths = [self.paths[1], self.tmp / "missing.jsonl", self.paths[0]]
+        with self.assertLogs(telemetry_reader.logger, "ERROR"):
+            records = merge_sources(paths)
+        self.assertEqual(records, RECORDS[2:] + RECORDS[:2])
+
+    def test_workers_read_in_a_process_pool(self):
+        with patch.object(error_parser, "available_cpus", return_value=2):
+            self.assertEqual(merge_sources(self.paths, workers=4), RECORDS)
@@ -0,0 +1,36 @@
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+from extractors.telemetry_sources import discover_sources, partition_span
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+class PartitionSpanTest(unittest.TestCase):
+    def test_year_month_day(self):
+        self.assertEqual(partition_span(("2025",)), (utc(2025, 1, 1), utc(2026, 1, 1)))
+        self.assertEqual(partition_span(("2025", "12")), (utc(2025, 12, 1), utc(2026, 1, 1)))
+        self.assertEqual(
+            partition_span(("archive", "2025", "11", "10")), (utc(2025, 11, 10), utc(2025, 11, 11))
+        )
+
+    def test_implausible_years_are_not_partitions(self):
+        for name in ("0001", "1234", "8080", "9999"):
+            with self.subTest(name=name):
+                self.assertIsNone(partition_span((name,)))
+        # The year is looked for past a build-number directory
+        self.assertEqual(partition_span(("1234", "2025")), (utc(2025, 1, 1), utc(2026, 1, 1)))
+
+    def test_since_does_not_skip_non_year_directories(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for directory in ("8080", "2024", "2025/11"):
+                (root / directory).mkdir(parents=True)
+                (root / directory / "events.jsonl").touch()
+            sources = discover_sources([root], since=utc(2025, 1, 1))
+            self.assertEqual(
+                [path.relative_to(root.resolve()).parent.as_posix() for path in sources],
+                ["2025/11", "8080"],
+            )